@@ -2,7 +2,7 @@
 
 import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Optional
 
 import numpy as np
 
@@ -24,12 +24,18 @@ class ConsoleBasePracticeApp(BasePracticeApp, ABC):
             config: Config instance.
         """
         super().__init__(service, config)
+        self.phrases: Optional[Any] = None
+        self.current_phrase_idx: int = 0
+        self.current_note_idx: int = 0
+        self.is_running: bool = False
 
         self.audio_processor = DirectAudioProcessor(
             sample_rate=config.audio.sample_rate,
             callback=self._process_audio_callback,
             buffer_duration=config.audio.buffer_duration,
         )
+        # Hold timing follows the audio consumed from the microphone
+        self.service.default_state.clock = self.audio_processor.clock
         self.ui: Optional[ConsolePracticeView] = None
 
     def _process_audio_callback(self, audio_data: np.ndarray):
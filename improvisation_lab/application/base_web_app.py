@@ -0,0 +1,321 @@
+"""Web application for all practices."""
+
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Generic, Optional, Tuple, TypeVar, cast
+
+import gradio as gr
+import numpy as np
+
+from improvisation_lab.application.base_app import BasePracticeApp
+from improvisation_lab.application.session import (PracticeSession,
+                                                   SessionRegistry,
+                                                   get_session_id)
+from improvisation_lab.application.stream_pacing import (StreamPacer,
+                                                         align_stream_every)
+from improvisation_lab.config import Config
+from improvisation_lab.infrastructure.audio import WebAudioProcessor
+from improvisation_lab.presentation.web_view import WebPracticeView
+from improvisation_lab.service.base_practice_service import BasePracticeService
+
+T = TypeVar("T")
+SessionT = TypeVar("SessionT", bound=PracticeSession)
+
+
+class WebBasePracticeApp(BasePracticeApp, Generic[SessionT], ABC):
+    """Web application class for all practices.
+
+    The service (and its pitch detection model) is shared, while each browser
+    session gets its own session, of the practice specific type SessionT, from
+    a bounded session registry.
+
+    The Gradio handlers are coroutines: audio processing runs in a bounded
+    inference thread pool and button actions in the default executor, so the
+    event loop stays free to serve other events while inference is busy. The
+    session is looked up in the worker thread too, since the lookup may close
+    evicted sessions, which waits for their locks.
+    """
+
+    def __init__(self, service: BasePracticeService, config: Config):
+        """Initialize the application using web UI.
+
+        Args:
+            service: PracticeService instance.
+            config: Config instance.
+        """
+        super().__init__(service, config)
+        self.sessions: SessionRegistry[SessionT] = SessionRegistry(
+            self._new_session,
+            max_sessions=config.session.max_sessions,
+            idle_timeout=config.session.idle_timeout,
+            on_close=self._retire_session,
+        )
+        # Audio counters of closed sessions, so that metrics never decrease
+        self.retired_audio_counts: Counter[str] = Counter()
+        self.inference_executor = ThreadPoolExecutor(
+            max_workers=config.web.inference_workers,
+            thread_name_prefix="inference",
+        )
+        # Audio processing calls submitted to the inference pool and not done
+        self._pending_inferences = 0
+        self._pending_inferences_lock = threading.Lock()
+        # Interval at which the UI streams audio chunks, set by subclasses
+        self.stream_every = config.audio.buffer_duration
+        self.ui: Optional[WebPracticeView] = None
+
+    def _create_audio_processor(self, session: PracticeSession) -> WebAudioProcessor:
+        """Create the audio processor of a session.
+
+        Args:
+            session: The session whose audio the processor handles.
+
+        Returns:
+            Audio processor calling back into this app for the session.
+        """
+        # Called by the session being created, which is of this app's type
+        return WebAudioProcessor(
+            sample_rate=self.config.audio.sample_rate,
+            callback=partial(self._process_audio_callback, cast(SessionT, session)),
+            buffer_duration=self.config.audio.buffer_duration,
+        )
+
+    def _aligned_stream_every(self, stream_every: float) -> float:
+        """Align a view's stream interval with the audio buffer duration.
+
+        Args:
+            stream_every: Default stream interval of the view in seconds.
+
+        Returns:
+            The aligned stream interval in seconds.
+        """
+        return align_stream_every(stream_every, self.config.audio.buffer_duration)
+
+    def _create_pacer(self) -> StreamPacer:
+        """Create the stream pacer of a session.
+
+        Returns:
+            Pacer adapting the session's processing interval to its latency.
+        """
+        return StreamPacer(
+            self.stream_every, max_interval=self.config.web.max_stream_interval
+        )
+
+    def _feed_audio(
+        self,
+        session: PracticeSession,
+        audio: Tuple[int, np.ndarray],
+        received_at: float,
+    ):
+        """Pass a chunk of audio to the session's audio processor.
+
+        The buffered audio is only processed when the session's pacer allows
+        it; otherwise the chunk is just buffered, and stale windows are
+        skipped at the next processing.
+
+        Args:
+            session: The session the audio belongs to.
+            audio: Audio chunk as (sample_rate, samples).
+            received_at: perf_counter time at which the handler received the
+                chunk, so that waiting for a worker counts as latency.
+        """
+        if not session.pacer.should_process():
+            session.audio_processor.buffer_audio(audio)
+            return
+        session.audio_processor.process_audio(audio)
+        session.pacer.record(time.perf_counter() - received_at)
+
+    def _output_if_changed(
+        self,
+        session: PracticeSession,
+        name: str,
+        version: Any,
+        value: Any,
+        force: bool = False,
+    ) -> Any:
+        """Return an output value, or gr.skip() if the client already has it.
+
+        Args:
+            session: The session the output is sent to.
+            name: Name of the output.
+            version: Version of the value; values with the version last sent
+                to the session's client are skipped.
+            value: The output value.
+            force: Whether to send the value even if unchanged.
+
+        Returns:
+            The value, or gr.skip() to leave the component unchanged.
+        """
+        if not force and session.sent_versions.get(name) == version:
+            return gr.skip()
+        session.sent_versions[name] = version
+        return value
+
+    def _text_outputs(
+        self, session: PracticeSession, force: bool = False
+    ) -> Tuple[Any, Any]:
+        """Return the phrase and result text outputs of a session.
+
+        Args:
+            session: The session whose text is shown.
+            force: Whether to send the text even if unchanged.
+
+        Returns:
+            The phrase text and result text, each gr.skip() when unchanged.
+        """
+        text_manager = session.text_manager
+        return (
+            self._output_if_changed(
+                session,
+                "phrase_text",
+                text_manager.phrase_version,
+                text_manager.phrase_text,
+                force,
+            ),
+            self._output_if_changed(
+                session,
+                "result_text",
+                text_manager.result_version,
+                text_manager.result_text,
+                force,
+            ),
+        )
+
+    def _retire_session(self, session: PracticeSession):
+        """Keep the audio counters of a closed session.
+
+        Args:
+            session: The closed session.
+        """
+        processor = session.audio_processor
+        for name in processor.counter_names:
+            self.retired_audio_counts[name] += getattr(processor, name)
+
+    async def _run_inference(
+        self,
+        func: Callable[..., T],
+        request: Optional[gr.Request],
+        *args: Any,
+    ) -> T:
+        """Run audio processing of a request's session in the inference pool.
+
+        Args:
+            func: Function processing audio, called with the session first.
+            request: Request of the Gradio event, identifying the session.
+            *args: Other arguments of the function.
+
+        Returns:
+            The result of the function.
+        """
+        loop = asyncio.get_running_loop()
+        with self._pending_inferences_lock:
+            self._pending_inferences += 1
+        try:
+            return await loop.run_in_executor(
+                self.inference_executor,
+                partial(self._call_with_session, func, request, *args),
+            )
+        finally:
+            with self._pending_inferences_lock:
+                self._pending_inferences -= 1
+
+    @property
+    def pending_inferences(self) -> int:
+        """Return the number of audio processing calls queued or running."""
+        with self._pending_inferences_lock:
+            return self._pending_inferences
+
+    async def _run_action(
+        self,
+        func: Callable[..., T],
+        request: Optional[gr.Request],
+        *args: Any,
+    ) -> T:
+        """Run a button action on a request's session off the event loop.
+
+        Actions wait for the session lock, which may be held by audio
+        processing, so they run in the default executor rather than the
+        inference thread pool to never queue behind other sessions' audio.
+
+        Args:
+            func: Function performing the action, called with the session first.
+            request: Request of the Gradio event, identifying the session.
+            *args: Other arguments of the function.
+
+        Returns:
+            The result of the function.
+        """
+        return await asyncio.to_thread(self._call_with_session, func, request, *args)
+
+    def _call_with_session(
+        self, func: Callable[..., T], request: Optional[gr.Request], *args: Any
+    ) -> T:
+        """Look up the session of a request and call a function with it.
+
+        Args:
+            func: Function called with the session first.
+            request: Request of the Gradio event, identifying the session.
+            *args: Other arguments of the function.
+
+        Returns:
+            The result of the function.
+        """
+        return func(self.get_session(request), *args)
+
+    def get_session(self, request: Optional[gr.Request] = None) -> SessionT:
+        """Return the session of a Gradio request, creating it if necessary.
+
+        Args:
+            request: Request of the Gradio event (default: None, shared session).
+
+        Returns:
+            The session.
+        """
+        return self.sessions.get(get_session_id(request))
+
+    def end_session(self, request: Optional[gr.Request] = None):
+        """Close the session of a Gradio request, e.g. when the page is closed.
+
+        Args:
+            request: Request of the Gradio event (default: None, shared session).
+        """
+        self.sessions.remove(get_session_id(request))
+
+    def launch(self, **kwargs):
+        """Launch the application."""
+        self.ui.launch(**kwargs)
+
+    @abstractmethod
+    def _new_session(self, session_id: str) -> SessionT:
+        """Create a practice specific session.
+
+        Args:
+            session_id: Identifier of the session.
+
+        Returns:
+            The new session.
+        """
+        pass
+
+    @abstractmethod
+    def _process_audio_callback(self, session: SessionT, audio_data: np.ndarray):
+        """Process incoming audio data and update the session state.
+
+        Args:
+            session: The session the audio belongs to.
+            audio_data: Audio data to process.
+        """
+        pass
+
+    @abstractmethod
+    def _advance_to_next_note(self, session: SessionT):
+        """Advance the session to the next note or phrase.
+
+        Args:
+            session: The session to advance.
+        """
+        pass
@@ -0,0 +1,67 @@
+"""Bounded store of interval practice results."""
+
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, List
+
+
+class ResultsTable:
+    """Results of an interval practice session, newest first.
+
+    Only the latest ``max_rows`` results are kept. Rows are read a page at a
+    time, and ``version`` changes whenever the content changes so that the
+    table is only sent to the client when needed.
+    """
+
+    def __init__(self, max_rows: int = 500, page_size: int = 20):
+        """Initialize an empty table.
+
+        Args:
+            max_rows: Maximum number of results kept.
+            page_size: Number of results per page.
+        """
+        if max_rows < 1 or page_size < 1:
+            raise ValueError("max_rows and page_size must be at least 1")
+        self._rows: Deque[List[Any]] = deque(maxlen=max_rows)
+        self.page_size = page_size
+        self.version = 0
+
+    def add(self, row: List[Any]):
+        """Add a result as the newest row, dropping the oldest if full.
+
+        Args:
+            row: The result row.
+        """
+        self._rows.appendleft(row)
+        self.version += 1
+
+    def clear(self):
+        """Remove all results."""
+        self._rows.clear()
+        self.version += 1
+
+    @property
+    def num_pages(self) -> int:
+        """Return the number of pages, at least one."""
+        return max(1, -(-len(self._rows) // self.page_size))
+
+    def page(self, page_idx: int = 0) -> List[List[Any]]:
+        """Return the rows of a page, the first page holding the newest results.
+
+        Args:
+            page_idx: Index of the page, clamped to the existing pages.
+
+        Returns:
+            The rows of the page.
+        """
+        page_idx = min(max(page_idx, 0), self.num_pages - 1)
+        start = page_idx * self.page_size
+        return list(islice(self._rows, start, start + self.page_size))
+
+    def __len__(self) -> int:
+        """Return the number of results kept."""
+        return len(self._rows)
+
+    def __getitem__(self, index: int) -> List[Any]:
+        """Return a row, index 0 being the newest result."""
+        return self._rows[index]
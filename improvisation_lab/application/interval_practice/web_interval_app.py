@@ -1,11 +1,17 @@
 """Web application for interval practice."""
 
+import random
 import time
-from typing import Any, List, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
+import gradio as gr
 import numpy as np
 
-from improvisation_lab.application.base_app import BasePracticeApp
+from improvisation_lab.application.base_web_app import WebBasePracticeApp
+from improvisation_lab.application.interval_practice.results_table import \
+    ResultsTable
+from improvisation_lab.application.session import PracticeSession
+from improvisation_lab.application.stream_pacing import StreamPacer
 from improvisation_lab.config import Config
 from improvisation_lab.domain.music_theory import Intervals
 from improvisation_lab.infrastructure.audio import WebAudioProcessor
@@ -14,9 +20,43 @@ from improvisation_lab.presentation.interval_practice import (
 from improvisation_lab.service import IntervalPracticeService
 
 
-class WebIntervalPracticeApp(BasePracticeApp):
+class IntervalPracticeSession(PracticeSession):
+    """State of one user's interval practice session."""
+
+    def __init__(
+        self,
+        session_id: str,
+        create_audio_processor: Callable[[PracticeSession], WebAudioProcessor],
+        pacer: StreamPacer,
+        results_table: ResultsTable,
+        rng: random.Random | None = None,
+    ):
+        """Initialize the session.
+
+        Args:
+            session_id: Identifier of the session (Gradio session hash).
+            create_audio_processor: Function creating the session's audio processor.
+            pacer: Pacer deciding when the session's audio is processed.
+            results_table: Store of the session's results.
+            rng: Random generator the session's problems are drawn with.
+        """
+        super().__init__(
+            session_id, IntervalViewTextManager(), create_audio_processor, pacer, rng
+        )
+        self.base_note = "-"
+        self.results_table = results_table
+        # Page of the results table shown to the user
+        self.results_page = 0
+        self.progress_timer: float = 0.0
+        self.is_auto_advance = False
+        self.note_duration = 3.0
+
+
+class WebIntervalPracticeApp(WebBasePracticeApp[IntervalPracticeSession]):
     """Web application class for interval practice."""
 
+    service: IntervalPracticeService
+
     def __init__(self, service: IntervalPracticeService, config: Config):
         """Initialize the application using web UI.
 
@@ -26,93 +66,199 @@ class WebIntervalPracticeApp(BasePracticeApp):
         """
         super().__init__(service, config)
 
-        self.audio_processor = WebAudioProcessor(
-            sample_rate=config.audio.sample_rate,
-            callback=self._process_audio_callback,
-            buffer_duration=config.audio.buffer_duration,
+        self.stream_every = self._aligned_stream_every(
+            WebIntervalPracticeView.stream_every
         )
-
-        self.text_manager = IntervalViewTextManager()
         self.ui = WebIntervalPracticeView(
             on_generate_melody=self.start,
             on_end_practice=self.stop,
             on_audio_input=self.handle_audio,
             config=config,
+            on_session_end=self.end_session,
+            on_results_page=self.change_results_page,
+            stream_every=self.stream_every,
+            stream_concurrency_limit=config.web.stream_concurrency_limit,
+            max_queue_size=config.web.max_queue_size,
+        )
+
+    def _new_session(self, session_id: str) -> IntervalPracticeSession:
+        """Create an interval practice session.
+
+        Args:
+            session_id: Identifier of the session.
+
+        Returns:
+            The new session.
+        """
+        return IntervalPracticeSession(
+            session_id,
+            self._create_audio_processor,
+            self._create_pacer(),
+            ResultsTable(
+                max_rows=self.config.interval_practice.max_results,
+                page_size=self.config.interval_practice.results_page_size,
+            ),
+            self.service.create_rng(),
         )
-        self.base_note = "-"
-        self.results_table: List[List[Any]] = []
-        self.progress_timer: float = 0.0
-        self.is_auto_advance = False
-        self.note_duration = 3.0
 
-    def _process_audio_callback(self, audio_data: np.ndarray):
-        """Process incoming audio data and update the application state.
+    def _process_audio_callback(
+        self, session: IntervalPracticeSession, audio_data: np.ndarray
+    ):
+        """Process incoming audio data and update the session state.
 
         Args:
+            session: The session the audio belongs to.
             audio_data: Audio data to process.
         """
-        if not self.is_running or not self.phrases:
+        if not session.is_running or not session.phrases:
             return
 
-        current_note = self.phrases[self.current_phrase_idx][
-            self.current_note_idx
+        current_note = session.phrases[session.current_phrase_idx][
+            session.current_note_idx
         ].value
 
-        result = self.service.process_audio(audio_data, current_note)
+        result = self.service.process_audio(
+            audio_data, current_note, session.tracking_state
+        )
 
         # Update status display
-        self.text_manager.update_pitch_result(result, self.is_auto_advance)
+        session.text_manager.update_pitch_result(result, session.is_auto_advance)
 
         # Progress to next note if current note is complete
-        if self.is_auto_advance:
-            current_time = time.time()
-            if current_time - self.progress_timer >= self.note_duration:
-                self._advance_to_next_note()
-                self.progress_timer = current_time
+        if session.is_auto_advance:
+            current_time = session.tracking_state.clock.now()
+            if current_time - session.progress_timer >= session.note_duration:
+                self._advance_to_next_note(session)
+                session.progress_timer = current_time
         elif result.remaining_time <= 0:
-            self._advance_to_next_note()
+            self._advance_to_next_note(session)
 
-        self.text_manager.update_phrase_text(self.current_phrase_idx, self.phrases)
+        session.text_manager.update_phrase_text(
+            session.current_phrase_idx, session.phrases
+        )
 
-    def _advance_to_next_note(self):
-        """Advance to the next note or phrase."""
-        if self.phrases is None:
-            return
+    def _advance_to_next_note(self, session: IntervalPracticeSession):
+        """Advance the session to the next note or phrase.
 
-        self.update_results_table()
-        self.current_note_idx += 1
-        if self.current_note_idx >= len(self.phrases[self.current_phrase_idx]):
-            self.current_note_idx = 1
-            self.current_phrase_idx += 1
-            if self.current_phrase_idx >= len(self.phrases):
-                self.current_phrase_idx = 0
-            self.base_note = self.phrases[self.current_phrase_idx][0].value
+        Args:
+            session: The session to advance.
+        """
+        if session.phrases is None:
+            return
 
-    def handle_audio(self, audio: Tuple[int, np.ndarray]) -> Tuple[str, str, str, List]:
+        self.update_results_table(session)
+        session.tracking_state.start_note()
+        session.current_note_idx += 1
+        if session.current_note_idx >= len(session.phrases[session.current_phrase_idx]):
+            session.current_note_idx = 1
+            session.current_phrase_idx += 1
+            if session.current_phrase_idx >= len(session.phrases):
+                session.current_phrase_idx = 0
+            session.base_note = session.phrases[session.current_phrase_idx][0].value
+
+    async def handle_audio(
+        self, audio: Tuple[int, np.ndarray], request: Optional[gr.Request] = None
+    ) -> Tuple[Any, Any, Any, Any]:
         """Handle audio input from Gradio interface.
 
         Args:
             audio: Audio data to process.
+            request: Request of the Gradio event, identifying the session.
 
         Returns:
-            Tuple[str, str, str, List]:
+            Tuple[Any, Any, Any, Any]:
                 The current base note including the next base note,
-                target note, result text, and results table.
+                target note, result text, and results table page,
+                each gr.skip() when unchanged since last sent.
         """
-        if not self.is_running:
-            return "-", "Not running", "Start the session first", []
+        received_at = time.perf_counter()
+        return await self._run_inference(
+            self._handle_audio, request, audio, received_at
+        )
+
+    def _handle_audio(
+        self,
+        session: IntervalPracticeSession,
+        audio: Tuple[int, np.ndarray],
+        received_at: float,
+    ) -> Tuple[Any, Any, Any, Any]:
+        """Process audio input of a session.
 
-        self.audio_processor.process_audio(audio)
+        Args:
+            session: The session the audio belongs to.
+            audio: Audio data to process.
+            received_at: perf_counter time at which the audio was received.
+
+        Returns:
+            Tuple[Any, Any, Any, Any]:
+                The current base note including the next base note,
+                target note, result text, and results table page,
+                each gr.skip() when unchanged since last sent.
+        """
+        with session.lock:
+            if not session.is_running:
+                # The texts double as their versions
+                return (
+                    self._output_if_changed(session, "base_note", "-", "-"),
+                    self._output_if_changed(
+                        session, "phrase_text", "Not running", "Not running"
+                    ),
+                    self._output_if_changed(
+                        session,
+                        "result_text",
+                        "Start the session first",
+                        "Start the session first",
+                    ),
+                    gr.skip(),
+                )
+
+            self._feed_audio(session, audio, received_at)
+
+            return (
+                self._output_if_changed(
+                    session, "base_note", session.base_note, session.base_note
+                ),
+                *self._text_outputs(session),
+                self._results_output(session),
+            )
+
+    async def start(
+        self,
+        interval: str,
+        direction: str,
+        number_problems: int,
+        is_auto_advance: bool,
+        note_duration: float,
+        request: Optional[gr.Request] = None,
+    ) -> Tuple[str, str, str, List]:
+        """Start a new practice session.
 
-        return (
-            self.base_note,
-            self.text_manager.phrase_text,
-            self.text_manager.result_text,
-            self.results_table,
+        Args:
+            interval: Interval to move to and back.
+            direction: Direction to move to and back.
+            number_problems: Number of problems to generate.
+            is_auto_advance: Whether to automatically advance to the next note.
+            note_duration: Duration of each note in seconds.
+            request: Request of the Gradio event, identifying the session.
+
+        Returns:
+            Tuple[str, str, str, List]:
+                The current base note including the next base note,
+                target note, result text, and results table.
+        """
+        return await self._run_action(
+            self._start,
+            request,
+            interval,
+            direction,
+            number_problems,
+            is_auto_advance,
+            note_duration,
         )
 
-    def start(
+    def _start(
         self,
+        session: IntervalPracticeSession,
         interval: str,
         direction: str,
         number_problems: int,
@@ -122,6 +268,7 @@ class WebIntervalPracticeApp(BasePracticeApp):
         """Start a new practice session.
 
         Args:
+            session: The session to start.
             interval: Interval to move to and back.
             direction: Direction to move to and back.
             number_problems: Number of problems to generate.
@@ -137,72 +284,156 @@ class WebIntervalPracticeApp(BasePracticeApp):
 
         if direction == "Down":
             semitone_interval = -semitone_interval
-        self.phrases = self.service.generate_melody(
-            num_notes=number_problems, interval=semitone_interval
-        )
-        self.current_phrase_idx = 0
-        self.current_note_idx = 1
-        self.is_running = True
 
-        self.base_note = self.phrases[0][0].value
-
-        if not self.audio_processor.is_recording:
-            self.text_manager.initialize_text()
-            self.audio_processor.start_recording()
-
-        self.text_manager.update_phrase_text(self.current_phrase_idx, self.phrases)
-        self.results_table = []
+        with session.lock:
+            session.phrases = self.service.next_melody(
+                num_notes=number_problems, interval=semitone_interval, rng=session.rng
+            )
+            session.current_phrase_idx = 0
+            session.current_note_idx = 1
+            session.is_running = True
+
+            session.base_note = session.phrases[0][0].value
+
+            if not session.audio_processor.is_recording:
+                session.text_manager.initialize_text()
+                session.audio_processor.start_recording()
+            session.pacer.reset()
+            session.tracking_state.start_note()
+
+            session.text_manager.update_phrase_text(
+                session.current_phrase_idx, session.phrases
+            )
+            session.results_table.clear()
+
+            session.is_auto_advance = is_auto_advance
+            session.note_duration = note_duration
+            session.progress_timer = session.tracking_state.clock.now()
+
+            return (
+                self._output_if_changed(
+                    session, "base_note", session.base_note, session.base_note, True
+                ),
+                *self._text_outputs(session, force=True),
+                self._results_output(session, force=True),
+            )
+
+    async def stop(self, request: Optional[gr.Request] = None) -> Tuple[str, str, str]:
+        """Stop the current practice session.
 
-        self.is_auto_advance = is_auto_advance
-        self.note_duration = note_duration
-        self.progress_timer = time.time()
+        Args:
+            request: Request of the Gradio event, identifying the session.
 
-        return (
-            self.base_note,
-            self.text_manager.phrase_text,
-            self.text_manager.result_text,
-            self.results_table,
-        )
+        Returns:
+            tuple[str, str, str]:
+                The current base note including the next base note,
+                target note, and result text.
+        """
+        return await self._run_action(self._stop, request)
 
-    def stop(self) -> Tuple[str, str, str]:
+    def _stop(self, session: IntervalPracticeSession) -> Tuple[str, str, str]:
         """Stop the current practice session.
 
+        Args:
+            session: The session to stop.
+
         Returns:
             tuple[str, str, str]:
                 The current base note including the next base note,
                 target note, and result text.
         """
-        self.is_running = False
-        self.base_note = "-"
-        if self.audio_processor.is_recording:
-            self.audio_processor.stop_recording()
-            self.text_manager.terminate_text()
-        return (
-            self.base_note,
-            self.text_manager.phrase_text,
-            self.text_manager.result_text,
-        )
-
-    def launch(self, **kwargs):
-        """Launch the application."""
-        self.ui.launch(**kwargs)
+        with session.lock:
+            session.is_running = False
+            session.base_note = "-"
+            if session.audio_processor.is_recording:
+                session.audio_processor.stop_recording()
+                session.text_manager.terminate_text()
+            return (
+                self._output_if_changed(
+                    session, "base_note", session.base_note, session.base_note, True
+                ),
+                *self._text_outputs(session, force=True),
+            )
+
+    def update_results_table(self, session: IntervalPracticeSession):
+        """Update the results table of the session with the latest result.
 
-    def update_results_table(self):
-        """Update the results table with the latest result."""
-        if not self.is_auto_advance:
+        Args:
+            session: The session to update.
+        """
+        if not session.is_auto_advance or session.phrases is None:
             return
 
-        target_note = self.phrases[self.current_phrase_idx][self.current_note_idx].value
-        detected_note = self.text_manager.result_text.split("|")[1].strip()
-        detected_note = detected_note.replace("Your note: ", "").replace(" ", "")
+        target_note = session.phrases[session.current_phrase_idx][
+            session.current_note_idx
+        ].value
+        last_result = session.tracking_state.last_result
+        detected_note = (
+            last_result.current_base_note
+            if last_result is not None and last_result.current_base_note
+            else "---"
+        )
         # Result determination
-        result = "⭕️" if detected_note == target_note else "X"
+        is_correct = last_result is not None and last_result.is_correct
+        result = "⭕️" if is_correct else "X"
         new_result = [
-            self.current_phrase_idx + 1,
-            self.base_note,
+            session.current_phrase_idx + 1,
+            session.base_note,
             target_note,
             detected_note,
             result,
         ]
 
-        self.results_table.insert(0, new_result)
+        session.results_table.add(new_result)
+
+    def _results_output(
+        self, session: IntervalPracticeSession, force: bool = False
+    ) -> Any:
+        """Return the results table output, skipped if the client is up to date.
+
+        Args:
+            session: The session whose results are shown.
+            force: Whether to send the table even if unchanged.
+
+        Returns:
+            The rows of the shown page, or gr.skip() when unchanged since the
+            last time they were sent.
+        """
+        version = session.results_table.version
+        # Checked before building the page, which is only needed when sent
+        if not force and session.sent_versions.get("results") == version:
+            return gr.skip()
+        session.sent_versions["results"] = version
+        return session.results_table.page(session.results_page)
+
+    async def change_results_page(
+        self, page: float, request: Optional[gr.Request] = None
+    ) -> List[List[Any]]:
+        """Show another page of the results table.
+
+        Args:
+            page: Page number starting at 1, the first page holding the
+                newest results.
+            request: Request of the Gradio event, identifying the session.
+
+        Returns:
+            The rows of the page.
+        """
+        return await self._run_action(self._change_results_page, request, page)
+
+    def _change_results_page(
+        self, session: IntervalPracticeSession, page: float
+    ) -> List[List[Any]]:
+        """Show another page of the results table.
+
+        Args:
+            session: The session whose results are shown.
+            page: Page number starting at 1.
+
+        Returns:
+            The rows of the page.
+        """
+        with session.lock:
+            session.results_page = max(int(page or 1), 1) - 1
+            session.sent_versions["results"] = session.results_table.version
+            return session.results_table.page(session.results_page)
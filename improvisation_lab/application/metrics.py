@@ -0,0 +1,331 @@
+"""Runtime metrics for the practice applications.
+
+Metrics are pulled from the running components at scrape time by collectors
+registered in a MetricsRegistry, and rendered in the Prometheus text
+exposition format so they can be scraped from the ``/metrics`` endpoint.
+"""
+
+import os
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+
+from improvisation_lab.instrumentation import Instrumentation, instrumentation
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@dataclass
+class MetricSample:
+    """A single value of a metric."""
+
+    value: float
+    labels: Dict[str, str] = field(default_factory=dict)
+    suffix: str = ""
+
+
+@dataclass
+class MetricFamily:
+    """A metric with its type, help text and samples."""
+
+    name: str
+    type: str
+    help: str
+    samples: List[MetricSample] = field(default_factory=list)
+
+
+Collector = Callable[[], Iterable[MetricFamily]]
+
+
+class MetricsRegistry:
+    """Registry of metric collectors."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._collectors: List[Collector] = []
+        self._lock = threading.Lock()
+
+    def register(self, collector: Collector):
+        """Register a collector called on every scrape.
+
+        Args:
+            collector: Function returning the current metric families.
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def collect(self) -> List[MetricFamily]:
+        """Collect metrics from all collectors.
+
+        Families with the same name from different collectors are merged.
+
+        Returns:
+            List of metric families.
+        """
+        with self._lock:
+            collectors = list(self._collectors)
+
+        families: Dict[str, MetricFamily] = {}
+        for collector in collectors:
+            for family in collector():
+                if family.name in families:
+                    families[family.name].samples.extend(family.samples)
+                else:
+                    families[family.name] = MetricFamily(
+                        family.name, family.type, family.help, list(family.samples)
+                    )
+        return list(families.values())
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            The metrics as text.
+        """
+        lines = []
+        for family in self.collect():
+            lines.append(f"# HELP {family.name} {family.help}")
+            lines.append(f"# TYPE {family.name} {family.type}")
+            for sample in family.samples:
+                lines.append(
+                    f"{family.name}{sample.suffix}"
+                    f"{_format_labels(sample.labels)} {_format_value(sample.value)}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    """Format labels as {name="value",...}, escaping values."""
+    if not labels:
+        return ""
+    formatted = ",".join(
+        f'{name}="{_escape_label_value(str(value))}"'
+        for name, value in labels.items()
+    )
+    return "{" + formatted + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def practice_app_collector(app, practice_type: str) -> Collector:
+    """Create a collector for a web practice application.
+
+    Args:
+        app: Web practice application exposing its sessions and service.
+        practice_type: Type of practice, used as label value.
+
+    Returns:
+        Collector for the session, audio processor, pitch detector and
+        service counters.
+    """
+    labels = {"practice_type": practice_type}
+
+    def collect() -> List[MetricFamily]:
+        sessions = app.sessions.sessions()
+        processors = [session.audio_processor for session in sessions]
+        audio_counts = Counter(app.retired_audio_counts)
+        for processor in processors:
+            audio_counts["received_chunks"] += processor.received_chunks
+            audio_counts["dropped_chunks"] += processor.dropped_chunks
+            audio_counts["processed_windows"] += processor.processed_windows
+            audio_counts["skipped_windows"] += processor.skipped_windows
+        buffered_seconds = sum(processor.buffered_seconds for processor in processors)
+        detector = app.service.pitch_detector
+        result_counts = dict(app.service.result_counts)
+        return [
+            MetricFamily(
+                "improvisation_lab_sessions",
+                "gauge",
+                "Number of sessions held in the session registry.",
+                [MetricSample(len(sessions), labels)],
+            ),
+            MetricFamily(
+                "improvisation_lab_active_sessions",
+                "gauge",
+                "Number of running practice sessions.",
+                [
+                    MetricSample(
+                        sum(1 for session in sessions if session.is_running), labels
+                    )
+                ],
+            ),
+            MetricFamily(
+                "improvisation_lab_sessions_evicted_total",
+                "counter",
+                "Sessions evicted for being idle or to stay under the session cap.",
+                [MetricSample(app.sessions.evicted_count, labels)],
+            ),
+            MetricFamily(
+                "improvisation_lab_audio_chunks_received_total",
+                "counter",
+                "Audio chunks received from the client.",
+                [MetricSample(audio_counts["received_chunks"], labels)],
+            ),
+            MetricFamily(
+                "improvisation_lab_audio_chunks_dropped_total",
+                "counter",
+                "Audio chunks dropped because the session was not recording.",
+                [MetricSample(audio_counts["dropped_chunks"], labels)],
+            ),
+            MetricFamily(
+                "improvisation_lab_audio_windows_processed_total",
+                "counter",
+                "Audio windows passed on to pitch detection.",
+                [MetricSample(audio_counts["processed_windows"], labels)],
+            ),
+            MetricFamily(
+                "improvisation_lab_audio_windows_skipped_total",
+                "counter",
+                "Stale audio windows skipped because processing fell behind.",
+                [MetricSample(audio_counts["skipped_windows"], labels)],
+            ),
+            MetricFamily(
+                "improvisation_lab_audio_buffer_seconds",
+                "gauge",
+                "Audio waiting in the session buffers to be processed.",
+                [MetricSample(buffered_seconds, labels)],
+            ),
+            MetricFamily(
+                "improvisation_lab_inference_queue_depth",
+                "gauge",
+                "Audio processing calls waiting for or running in the inference pool.",
+                [MetricSample(app.pending_inferences, labels)],
+            ),
+            MetricFamily(
+                "improvisation_lab_pitch_inferences_total",
+                "counter",
+                "Pitch detection inferences run.",
+                [MetricSample(detector.inference_count, labels)],
+            ),
+            MetricFamily(
+                "improvisation_lab_pitch_inference_seconds_total",
+                "counter",
+                "Time spent in pitch detection inference.",
+                [MetricSample(detector.inference_seconds, labels)],
+            ),
+            MetricFamily(
+                "improvisation_lab_pitch_results_total",
+                "counter",
+                "Pitch results by outcome.",
+                [
+                    MetricSample(count, {**labels, "outcome": outcome})
+                    for outcome, count in result_counts.items()
+                ],
+            ),
+        ]
+
+    return collect
+
+
+def process_collector() -> Collector:
+    """Create a collector for process level metrics.
+
+    Returns:
+        Collector for resident memory and thread count.
+    """
+
+    def collect() -> List[MetricFamily]:
+        families = [
+            MetricFamily(
+                "improvisation_lab_threads",
+                "gauge",
+                "Number of Python threads.",
+                [MetricSample(threading.active_count())],
+            )
+        ]
+        resident_memory = _resident_memory_bytes()
+        if resident_memory is not None:
+            families.append(
+                MetricFamily(
+                    "improvisation_lab_resident_memory_bytes",
+                    "gauge",
+                    "Resident memory size of the process.",
+                    [MetricSample(resident_memory)],
+                )
+            )
+        return families
+
+    return collect
+
+
+def _resident_memory_bytes() -> int | None:
+    """Return the resident memory of this process, or None if unavailable."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def instrumentation_collector(
+    source: Instrumentation = instrumentation,
+) -> Collector:
+    """Create a collector exposing per-stage latencies as a summary.
+
+    Stages only appear once instrumentation is enabled and has recorded them.
+
+    Args:
+        source: Instrumentation to read (default: the module-level one).
+
+    Returns:
+        Collector for the per-stage latency summary.
+    """
+
+    def collect() -> List[MetricFamily]:
+        samples = []
+        for stage, stats in source.snapshot().items():
+            labels = {"stage": stage}
+            for quantile in ("p50", "p95", "p99"):
+                samples.append(
+                    MetricSample(
+                        stats[quantile],
+                        {**labels, "quantile": str(int(quantile[1:]) / 100)},
+                    )
+                )
+            samples.append(MetricSample(stats["total"], labels, "_sum"))
+            samples.append(MetricSample(stats["count"], labels, "_count"))
+        if not samples:
+            return []
+        return [
+            MetricFamily(
+                "improvisation_lab_stage_duration_seconds",
+                "summary",
+                "Duration of instrumented pipeline stages.",
+                samples,
+            )
+        ]
+
+    return collect
+
+
+def mount_metrics_endpoint(
+    app: FastAPI, registry: MetricsRegistry, path: str = "/metrics"
+):
+    """Add an endpoint serving the registry in the Prometheus text format.
+
+    Args:
+        app: FastAPI application to add the endpoint to.
+        registry: Registry to render.
+        path: Path of the endpoint (default: "/metrics").
+    """
+
+    @app.get(path, response_class=PlainTextResponse)
+    def metrics() -> PlainTextResponse:
+        return PlainTextResponse(
+            registry.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE
+        )
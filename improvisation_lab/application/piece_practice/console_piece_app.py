@@ -35,4 +35,4 @@ class ConsolePiecePracticeApp(ConsoleBasePracticeApp):
 
     def _generate_melody(self):
         """Generate melody specific to the practice type."""
-        return self.service.generate_melody()
+        return self.service.stream_melody()
@@ -1,20 +1,24 @@
 """Web application for melody practice."""
 
-from typing import Tuple
+import time
+from typing import Any, Optional, Tuple
 
+import gradio as gr
 import numpy as np
 
-from improvisation_lab.application.base_app import BasePracticeApp
+from improvisation_lab.application.base_web_app import WebBasePracticeApp
+from improvisation_lab.application.session import PracticeSession
 from improvisation_lab.config import Config
-from improvisation_lab.infrastructure.audio import WebAudioProcessor
 from improvisation_lab.presentation.piece_practice import (
     PieceViewTextManager, WebPiecePracticeView)
 from improvisation_lab.service import PiecePracticeService
 
 
-class WebPiecePracticeApp(BasePracticeApp):
+class WebPiecePracticeApp(WebBasePracticeApp[PracticeSession]):
     """Web application class for piece practice."""
 
+    service: PiecePracticeService
+
     def __init__(self, service: PiecePracticeService, config: Config):
         """Initialize the application using web UI.
 
@@ -24,99 +28,196 @@ class WebPiecePracticeApp(BasePracticeApp):
         """
         super().__init__(service, config)
 
-        self.audio_processor = WebAudioProcessor(
-            sample_rate=config.audio.sample_rate,
-            callback=self._process_audio_callback,
-            buffer_duration=config.audio.buffer_duration,
+        self.stream_every = self._aligned_stream_every(
+            WebPiecePracticeView.stream_every
         )
-
-        self.text_manager = PieceViewTextManager()
         self.ui = WebPiecePracticeView(
             on_generate_melody=self.start,
             on_end_practice=self.stop,
             on_audio_input=self.handle_audio,
             song_name=config.piece_practice.selected_song,
+            on_session_end=self.end_session,
+            stream_every=self.stream_every,
+            stream_concurrency_limit=config.web.stream_concurrency_limit,
+            max_queue_size=config.web.max_queue_size,
+        )
+
+    def _new_session(self, session_id: str) -> PracticeSession:
+        """Create a piece practice session.
+
+        Args:
+            session_id: Identifier of the session.
+
+        Returns:
+            The new session.
+        """
+        return PracticeSession(
+            session_id,
+            PieceViewTextManager(),
+            self._create_audio_processor,
+            self._create_pacer(),
+            self.service.create_rng(),
         )
 
-    def _process_audio_callback(self, audio_data: np.ndarray):
-        """Process incoming audio data and update the application state.
+    def _process_audio_callback(self, session: PracticeSession, audio_data: np.ndarray):
+        """Process incoming audio data and update the session state.
 
         Args:
+            session: The session the audio belongs to.
             audio_data: Audio data to process.
         """
-        if not self.is_running or not self.phrases:
+        if not session.is_running or not session.phrases:
             return
 
-        current_phrase = self.phrases[self.current_phrase_idx]
-        current_note = current_phrase.notes[self.current_note_idx]
+        current_phrase = session.phrases[session.current_phrase_idx]
+        current_note = current_phrase.notes[session.current_note_idx]
 
-        result = self.service.process_audio(audio_data, current_note)
+        result = self.service.process_audio(
+            audio_data, current_note, session.tracking_state
+        )
 
         # Update status display
-        self.text_manager.update_pitch_result(result)
+        session.text_manager.update_pitch_result(result)
 
         # Progress to next note if current note is complete
         if result.remaining_time <= 0:
-            self._advance_to_next_note()
+            self._advance_to_next_note(session)
 
-        self.text_manager.update_phrase_text(self.current_phrase_idx, self.phrases)
+        session.text_manager.update_phrase_text(
+            session.current_phrase_idx, session.phrases
+        )
+
+    def _advance_to_next_note(self, session: PracticeSession):
+        """Advance the session to the next note or phrase.
 
-    def _advance_to_next_note(self):
-        """Advance to the next note or phrase."""
-        if self.phrases is None:
+        Args:
+            session: The session to advance.
+        """
+        if session.phrases is None:
             return
-        self.current_note_idx += 1
-        if self.current_note_idx >= len(self.phrases[self.current_phrase_idx].notes):
-            self.current_note_idx = 0
-            self.current_phrase_idx += 1
-            if self.current_phrase_idx >= len(self.phrases):
-                self.current_phrase_idx = 0
-
-    def handle_audio(self, audio: Tuple[int, np.ndarray]) -> Tuple[str, str]:
+        session.tracking_state.start_note()
+        session.current_note_idx += 1
+        if session.current_note_idx >= len(
+            session.phrases[session.current_phrase_idx].notes
+        ):
+            session.current_note_idx = 0
+            session.current_phrase_idx += 1
+            if session.current_phrase_idx >= len(session.phrases):
+                session.current_phrase_idx = 0
+
+    async def handle_audio(
+        self, audio: Tuple[int, np.ndarray], request: Optional[gr.Request] = None
+    ) -> Tuple[Any, Any]:
         """Handle audio input from Gradio interface.
 
         Args:
             audio: Audio data to process.
+            request: Request of the Gradio event, identifying the session.
 
         Returns:
-            tuple[str, str]: The current phrase text and result text.
+            tuple[Any, Any]: The current phrase text and result text,
+                each gr.skip() when unchanged since last sent.
+        """
+        received_at = time.perf_counter()
+        return await self._run_inference(
+            self._handle_audio, request, audio, received_at
+        )
+
+    def _handle_audio(
+        self,
+        session: PracticeSession,
+        audio: Tuple[int, np.ndarray],
+        received_at: float,
+    ) -> Tuple[Any, Any]:
+        """Process audio input of a session.
+
+        Args:
+            session: The session the audio belongs to.
+            audio: Audio data to process.
+            received_at: perf_counter time at which the audio was received.
+
+        Returns:
+            tuple[Any, Any]: The current phrase text and result text,
+                each gr.skip() when unchanged since last sent.
         """
-        if not self.is_running:
-            return "Not running", "Start the session first"
+        with session.lock:
+            if not session.is_running:
+                # The texts double as their versions
+                return (
+                    self._output_if_changed(
+                        session, "phrase_text", "Not running", "Not running"
+                    ),
+                    self._output_if_changed(
+                        session,
+                        "result_text",
+                        "Start the session first",
+                        "Start the session first",
+                    ),
+                )
+
+            self._feed_audio(session, audio, received_at)
+            return self._text_outputs(session)
+
+    async def start(self, request: Optional[gr.Request] = None) -> tuple[str, str]:
+        """Start a new practice session.
 
-        self.audio_processor.process_audio(audio)
-        return self.text_manager.phrase_text, self.text_manager.result_text
+        Args:
+            request: Request of the Gradio event, identifying the session.
+
+        Returns:
+            tuple[str, str]: The current phrase text and result text.
+        """
+        return await self._run_action(self._start, request)
 
-    def start(self) -> tuple[str, str]:
+    def _start(self, session: PracticeSession) -> tuple[str, str]:
         """Start a new practice session.
 
+        Args:
+            session: The session to start.
+
         Returns:
             tuple[str, str]: The current phrase text and result text.
         """
-        self.phrases = self.service.generate_melody()
-        self.current_phrase_idx = 0
-        self.current_note_idx = 0
-        self.is_running = True
+        with session.lock:
+            session.phrases = self.service.stream_melody(rng=session.rng)
+            session.current_phrase_idx = 0
+            session.current_note_idx = 0
+            session.is_running = True
+
+            if not session.audio_processor.is_recording:
+                session.text_manager.initialize_text()
+                session.audio_processor.start_recording()
+            session.pacer.reset()
+            session.tracking_state.start_note()
+
+            session.text_manager.update_phrase_text(
+                session.current_phrase_idx, session.phrases
+            )
+            return self._text_outputs(session, force=True)
+
+    async def stop(self, request: Optional[gr.Request] = None) -> tuple[str, str]:
+        """Stop the current practice session.
 
-        if not self.audio_processor.is_recording:
-            self.text_manager.initialize_text()
-            self.audio_processor.start_recording()
+        Args:
+            request: Request of the Gradio event, identifying the session.
 
-        self.text_manager.update_phrase_text(self.current_phrase_idx, self.phrases)
-        return self.text_manager.phrase_text, self.text_manager.result_text
+        Returns:
+            tuple[str, str]: The current phrase text and result text.
+        """
+        return await self._run_action(self._stop, request)
 
-    def stop(self) -> tuple[str, str]:
+    def _stop(self, session: PracticeSession) -> tuple[str, str]:
         """Stop the current practice session.
 
+        Args:
+            session: The session to stop.
+
         Returns:
             tuple[str, str]: The current phrase text and result text.
         """
-        self.is_running = False
-        if self.audio_processor.is_recording:
-            self.audio_processor.stop_recording()
-            self.text_manager.terminate_text()
-        return self.text_manager.phrase_text, self.text_manager.result_text
-
-    def launch(self, **kwargs):
-        """Launch the application."""
-        self.ui.launch(**kwargs)
+        with session.lock:
+            session.is_running = False
+            if session.audio_processor.is_recording:
+                session.audio_processor.stop_recording()
+                session.text_manager.terminate_text()
+            return self._text_outputs(session, force=True)
@@ -0,0 +1,204 @@
+"""Per-user practice sessions for the web applications.
+
+Each browser session gets its own practice state (phrases, position, displayed
+text, audio buffer, pitch tracking state and random generator), while the
+practice service and its pitch detection model are shared by all sessions of
+the process.
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+
+from improvisation_lab.application.stream_pacing import StreamPacer
+from improvisation_lab.infrastructure.audio import WebAudioProcessor
+from improvisation_lab.presentation.view_text_manager import ViewTextManager
+from improvisation_lab.service.base_practice_service import PitchTrackingState
+
+
+class PracticeSession:
+    """State of one user's practice session."""
+
+    def __init__(
+        self,
+        session_id: str,
+        text_manager: ViewTextManager,
+        create_audio_processor: Callable[["PracticeSession"], WebAudioProcessor],
+        pacer: StreamPacer,
+        rng: random.Random | None = None,
+    ):
+        """Initialize the session.
+
+        Args:
+            session_id: Identifier of the session (Gradio session hash).
+            text_manager: Text manager holding the session's displayed text.
+            create_audio_processor:
+                Function creating the audio processor buffering the session's
+                audio, given the session its callback is bound to.
+            pacer: Pacer deciding when the session's audio is processed.
+            rng:
+                Random generator the session's melodies are drawn with
+                (default: None, a new unseeded one).
+        """
+        self.session_id = session_id
+        self.text_manager = text_manager
+        self.audio_processor = create_audio_processor(self)
+        self.pacer = pacer
+        self.rng = random.Random() if rng is None else rng
+        # Hold timing follows the audio consumed by the session's processor
+        self.tracking_state = PitchTrackingState(clock=self.audio_processor.clock)
+        self.phrases: Optional[Any] = None
+        self.current_phrase_idx: int = 0
+        self.current_note_idx: int = 0
+        self.is_running: bool = False
+        # Version of each output last sent to the client, to skip unchanged ones
+        self.sent_versions: Dict[str, Any] = {}
+        self.last_access = time.monotonic()
+        # Serializes handler calls (audio stream and button clicks) per session
+        self.lock = threading.RLock()
+
+    def touch(self):
+        """Mark the session as used now."""
+        self.last_access = time.monotonic()
+
+    def close(self):
+        """Stop the session and release its audio input."""
+        with self.lock:
+            self.is_running = False
+            if self.audio_processor.is_recording:
+                self.audio_processor.stop_recording()
+
+
+S = TypeVar("S", bound=PracticeSession)
+
+
+class SessionRegistry(Generic[S]):
+    """Bounded registry of practice sessions keyed by session id.
+
+    Sessions idle for longer than ``idle_timeout`` are evicted whenever a
+    session is looked up, and when the registry is full the least recently
+    used session is evicted to make room.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str], S],
+        max_sessions: int = 32,
+        idle_timeout: float = 600.0,
+        on_close: Callable[[S], None] | None = None,
+    ):
+        """Initialize the registry.
+
+        Args:
+            factory: Function creating a new session for a session id.
+            max_sessions: Maximum number of sessions kept at once.
+            idle_timeout: Seconds after which an unused session is evicted.
+            on_close: Function called with each session removed from the registry.
+        """
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self._factory = factory
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._on_close = on_close
+        self._sessions: "OrderedDict[str, S]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted_count = 0
+
+    def get(self, session_id: str) -> S:
+        """Return the session for the id, creating it if necessary.
+
+        Args:
+            session_id: Identifier of the session.
+
+        Returns:
+            The session.
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                # Touched first, so that the session is not evicted as idle
+                self._sessions.move_to_end(session_id)
+                session.touch()
+            evicted = self._evict_idle()
+            if session is None:
+                while len(self._sessions) >= self.max_sessions:
+                    _, lru_session = self._sessions.popitem(last=False)
+                    evicted.append(lru_session)
+                session = self._factory(session_id)
+                self._sessions[session_id] = session
+                session.touch()
+            self.evicted_count += len(evicted)
+        self._close(evicted)
+        return session
+
+    def remove(self, session_id: str):
+        """Remove and close a session if it exists.
+
+        Args:
+            session_id: Identifier of the session.
+        """
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is not None:
+            self._close([session])
+
+    def evict_idle(self):
+        """Remove and close all sessions idle for longer than the idle timeout."""
+        with self._lock:
+            evicted = self._evict_idle()
+            self.evicted_count += len(evicted)
+        self._close(evicted)
+
+    def sessions(self) -> List[S]:
+        """Return the current sessions, least recently used first."""
+        with self._lock:
+            return list(self._sessions.values())
+
+    def __len__(self) -> int:
+        """Return the number of sessions."""
+        with self._lock:
+            return len(self._sessions)
+
+    def __contains__(self, session_id: object) -> bool:
+        """Return whether a session exists for the id."""
+        with self._lock:
+            return session_id in self._sessions
+
+    def _evict_idle(self) -> List[S]:
+        """Pop sessions idle for too long. Must be called with the lock held."""
+        deadline = time.monotonic() - self.idle_timeout
+        evicted = []
+        # Sessions are ordered by last access, so stop at the first fresh one
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session.last_access > deadline:
+                break
+            del self._sessions[session_id]
+            evicted.append(session)
+        return evicted
+
+    def _close(self, sessions: List[S]):
+        """Close removed sessions outside of the registry lock."""
+        for session in sessions:
+            session.close()
+            if self._on_close is not None:
+                self._on_close(session)
+
+
+def get_session_id(request: Any) -> str:
+    """Return the session id of a Gradio request.
+
+    Calls without a request (e.g. direct calls or tests) share one default
+    session.
+
+    Args:
+        request: gr.Request of the event, or None.
+
+    Returns:
+        The session id.
+    """
+    session_hash = getattr(request, "session_hash", None) if request else None
+    return session_hash or "default"
@@ -0,0 +1,98 @@
+"""Pacing of audio stream processing for the web applications.
+
+Gradio streams microphone chunks at a fixed interval chosen when the page is
+built. The interval is aligned with the analysis window, and each session
+processes its buffered audio no more often than its handler can keep up with,
+so that a slow server buffers chunks instead of queueing up work.
+"""
+
+import time
+from typing import Callable
+
+
+def align_stream_every(stream_every: float, buffer_duration: float) -> float:
+    """Align a stream interval with the analysis window duration.
+
+    The result is the closest whole multiple or whole divisor of the window
+    duration, so that chunks add up to complete windows.
+
+    Args:
+        stream_every: Desired interval between chunks in seconds.
+        buffer_duration: Duration of the analysis window in seconds.
+
+    Returns:
+        The aligned interval in seconds.
+    """
+    if stream_every <= 0 or buffer_duration <= 0:
+        raise ValueError("stream_every and buffer_duration must be positive")
+    if stream_every >= buffer_duration:
+        return round(stream_every / buffer_duration) * buffer_duration
+    return buffer_duration / round(buffer_duration / stream_every)
+
+
+class StreamPacer:
+    """Decides how often a session processes its audio stream.
+
+    Tracks an exponential moving average of the processing latency and
+    stretches the processing interval to ``headroom`` times that latency,
+    between the stream interval and ``max_interval``. Chunks arriving before
+    the interval has elapsed are only buffered.
+    """
+
+    def __init__(
+        self,
+        stream_every: float,
+        max_interval: float,
+        smoothing: float = 0.2,
+        headroom: float = 1.2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the pacer.
+
+        Args:
+            stream_every: Interval at which chunks arrive in seconds.
+            max_interval: Upper bound of the processing interval in seconds.
+            smoothing: Weight of the newest latency in the moving average.
+            headroom: Factor between the average latency and the interval.
+            clock: Function returning the current time in seconds.
+        """
+        self.stream_every = stream_every
+        self.max_interval = max(max_interval, stream_every)
+        self.smoothing = smoothing
+        self.headroom = headroom
+        self._clock = clock
+        self.average_latency = 0.0
+        self._last_processed: float | None = None
+
+    @property
+    def interval(self) -> float:
+        """Return the current processing interval in seconds."""
+        return min(
+            max(self.average_latency * self.headroom, self.stream_every),
+            self.max_interval,
+        )
+
+    def should_process(self) -> bool:
+        """Return whether the chunk arriving now should be processed."""
+        if self._last_processed is None:
+            return True
+        elapsed = self._clock() - self._last_processed
+        # Chunks arrive with jitter, so allow half a stream interval of slack
+        return elapsed >= self.interval - self.stream_every / 2
+
+    def record(self, latency: float):
+        """Record the latency of processing a chunk.
+
+        Args:
+            latency: Processing time in seconds.
+        """
+        self._last_processed = self._clock()
+        if self.average_latency == 0.0:
+            self.average_latency = latency
+        else:
+            self.average_latency += self.smoothing * (latency - self.average_latency)
+
+    def reset(self):
+        """Forget the measured latency, e.g. when a new practice starts."""
+        self.average_latency = 0.0
+        self._last_processed = None
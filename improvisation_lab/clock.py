@@ -0,0 +1,51 @@
+"""Clocks used to time how long notes are held.
+
+Hold timing reads a ``Clock`` instead of the wall clock. Live practice uses a
+``SampleClock`` advanced by the audio processor for every sample it consumes,
+so durations follow the audio itself rather than when handlers happen to run,
+and offline replays can run faster than real time with the same results.
+"""
+
+import time
+from typing import Protocol
+
+
+class Clock(Protocol):
+    """Source of monotonic time in seconds."""
+
+    def now(self) -> float:
+        """Return the current time in seconds."""
+        ...
+
+
+class MonotonicClock:
+    """Clock reading the system monotonic clock."""
+
+    def now(self) -> float:
+        """Return the current time in seconds."""
+        return time.monotonic()
+
+
+class SampleClock:
+    """Clock measuring time in audio samples consumed."""
+
+    def __init__(self, sample_rate: int):
+        """Initialize the clock at time zero.
+
+        Args:
+            sample_rate: Sample rate of the audio in Hz.
+        """
+        self.sample_rate = sample_rate
+        self.samples = 0
+
+    def advance(self, num_samples: int):
+        """Advance the clock by a number of consumed samples.
+
+        Args:
+            num_samples: Number of samples consumed.
+        """
+        self.samples += num_samples
+
+    def now(self) -> float:
+        """Return the duration of the consumed audio in seconds."""
+        return self.samples / self.sample_rate
@@ -20,6 +20,34 @@ class PitchDetectorConfig:
     device: str = "cpu"
 
 
+@dataclass
+class NoteDecisionConfig:
+    """Configuration settings for deciding the sung note from pitch readings."""
+
+    # Smooth per-hop pitch readings; if disabled, one reading per window is judged
+    enabled: bool = True
+    # Pitch readings (hops) in the median window
+    window_size: int = 5
+    # Consecutive readings a new note needs before it replaces the current one
+    hysteresis: int = 2
+    # Maximum distance (cents) of the median pitch from the nearest note
+    tolerance_cents: float = 50.0
+    # Minimum ratio of voiced readings in the window to detect a note
+    min_voiced_ratio: float = 0.5
+
+
+@dataclass
+class PitchGradingConfig:
+    """Configuration settings for judging whether the sung note is correct.
+
+    Targets are note names without an octave, so the sung note is judged by
+    pitch class, in any octave.
+    """
+
+    # Maximum distance (cents) of the sung pitch from the target note
+    tolerance_cents: float = 50.0
+
+
 @dataclass
 class AudioConfig:
     """Configuration class for audio-related settings."""
@@ -27,7 +55,11 @@ class AudioConfig:
     sample_rate: int = 16000
     buffer_duration: float = 0.3
     note_duration: float = 1.0
+    # Frequency of A4 in Hz that notes are tuned to
+    reference_frequency: float = 440.0
     pitch_detector: PitchDetectorConfig = field(default_factory=PitchDetectorConfig)
+    note_decision: NoteDecisionConfig = field(default_factory=NoteDecisionConfig)
+    grading: PitchGradingConfig = field(default_factory=PitchGradingConfig)
 
     @classmethod
     def from_yaml(cls, yaml_data: dict) -> "AudioConfig":
@@ -36,6 +68,9 @@ class AudioConfig:
             sample_rate=yaml_data.get("sample_rate", cls.sample_rate),
             buffer_duration=yaml_data.get("buffer_duration", cls.buffer_duration),
             note_duration=yaml_data.get("note_duration", cls.note_duration),
+            reference_frequency=yaml_data.get(
+                "reference_frequency", cls.reference_frequency
+            ),
         )
 
         if "pitch_detector" in yaml_data:
@@ -45,6 +80,12 @@ class AudioConfig:
             pitch_detector_data["sample_rate"] = config.sample_rate
             config.pitch_detector = PitchDetectorConfig(**pitch_detector_data)
 
+        if "note_decision" in yaml_data:
+            config.note_decision = NoteDecisionConfig(**yaml_data["note_decision"])
+
+        if "grading" in yaml_data:
+            config.grading = PitchGradingConfig(**yaml_data["grading"])
+
         return config
 
 
@@ -54,6 +95,14 @@ class IntervalPracticeConfig:
 
     num_problems: int = 10
     interval: int = 0
+    max_results: int = 500
+    results_page_size: int = 20
+    # Seed of the random generator drawing problems, None for unseeded
+    seed: int | None = None
+    # Problem sets kept pre-generated per number of problems, 0 to disable
+    exercise_pool_size: int = 8
+    # .npz file the pre-generated problem sets are persisted to, None for none
+    exercise_cache_path: str | None = None
 
     @classmethod
     def from_yaml(cls, yaml_data: dict) -> "IntervalPracticeConfig":
@@ -61,6 +110,17 @@ class IntervalPracticeConfig:
         return cls(
             num_problems=yaml_data.get("num_problems", cls.num_problems),
             interval=yaml_data.get("interval", cls.interval),
+            max_results=yaml_data.get("max_results", cls.max_results),
+            results_page_size=yaml_data.get(
+                "results_page_size", cls.results_page_size
+            ),
+            seed=yaml_data.get("seed", cls.seed),
+            exercise_pool_size=yaml_data.get(
+                "exercise_pool_size", cls.exercise_pool_size
+            ),
+            exercise_cache_path=yaml_data.get(
+                "exercise_cache_path", cls.exercise_cache_path
+            ),
         )
 
 
@@ -70,6 +130,8 @@ class PiecePracticeConfig:
 
     selected_song: str = "fly_me_to_the_moon"
     chord_progressions: dict = field(default_factory=dict)
+    # Seed of the random generator drawing melodies, None for unseeded
+    seed: int | None = None
 
     @classmethod
     def from_yaml(cls, yaml_data: dict) -> "PiecePracticeConfig":
@@ -79,6 +141,75 @@ class PiecePracticeConfig:
             chord_progressions=yaml_data.get(
                 "chord_progressions", {cls.selected_song: []}
             ),
+            seed=yaml_data.get("seed", cls.seed),
+        )
+
+
+@dataclass
+class SessionConfig:
+    """Configuration settings for web practice sessions."""
+
+    max_sessions: int = 32
+    idle_timeout: float = 600.0
+
+    @classmethod
+    def from_yaml(cls, yaml_data: dict) -> "SessionConfig":
+        """Create SessionConfig instance from YAML data."""
+        return cls(
+            max_sessions=yaml_data.get("max_sessions", cls.max_sessions),
+            idle_timeout=yaml_data.get("idle_timeout", cls.idle_timeout),
+        )
+
+
+@dataclass
+class WebConfig:
+    """Configuration settings for serving the web interface."""
+
+    # Audio stream events processed at once, per practice type
+    stream_concurrency_limit: int = 4
+    # Events waiting in the Gradio queue before new ones are rejected
+    max_queue_size: int = 64
+    # Threads running audio processing and pitch detection
+    inference_workers: int = 2
+    # Longest interval (seconds) at which a slow session's audio is processed
+    max_stream_interval: float = 1.0
+    # Serve Prometheus metrics at /metrics; otherwise the Gradio app is launched
+    # as is
+    metrics_endpoint: bool = False
+
+    @classmethod
+    def from_yaml(cls, yaml_data: dict) -> "WebConfig":
+        """Create WebConfig instance from YAML data."""
+        return cls(
+            stream_concurrency_limit=yaml_data.get(
+                "stream_concurrency_limit", cls.stream_concurrency_limit
+            ),
+            max_queue_size=yaml_data.get("max_queue_size", cls.max_queue_size),
+            inference_workers=yaml_data.get(
+                "inference_workers", cls.inference_workers
+            ),
+            max_stream_interval=yaml_data.get(
+                "max_stream_interval", cls.max_stream_interval
+            ),
+            metrics_endpoint=yaml_data.get("metrics_endpoint", cls.metrics_endpoint),
+        )
+
+
+@dataclass
+class MusicTheoryConfig:
+    """Configuration settings for scales and chords added to the built-in ones."""
+
+    # Intervals in semitones from the root, by scale name
+    scales: dict[str, list[int]] = field(default_factory=dict)
+    # Intervals in semitones from the root, by chord name
+    chords: dict[str, list[int]] = field(default_factory=dict)
+
+    @classmethod
+    def from_yaml(cls, yaml_data: dict) -> "MusicTheoryConfig":
+        """Create MusicTheoryConfig instance from YAML data."""
+        return cls(
+            scales=dict(yaml_data.get("scales") or {}),
+            chords=dict(yaml_data.get("chords") or {}),
         )
 
 
@@ -89,6 +220,9 @@ class Config:
     audio: AudioConfig
     interval_practice: IntervalPracticeConfig
     piece_practice: PiecePracticeConfig
+    session: SessionConfig
+    web: WebConfig
+    music_theory: MusicTheoryConfig
 
     def __init__(self, config_path: str | Path = "config.yml"):
         """Initialize Config instance.
@@ -110,10 +244,18 @@ class Config:
                 self.piece_practice = PiecePracticeConfig.from_yaml(
                     yaml_data.get("piece_practice", {})
                 )
+                self.session = SessionConfig.from_yaml(yaml_data.get("session", {}))
+                self.web = WebConfig.from_yaml(yaml_data.get("web", {}))
+                self.music_theory = MusicTheoryConfig.from_yaml(
+                    yaml_data.get("music_theory", {})
+                )
         else:
             self.audio = AudioConfig()
             self.interval_practice = IntervalPracticeConfig()
             self.piece_practice = PiecePracticeConfig()
+            self.session = SessionConfig()
+            self.web = WebConfig()
+            self.music_theory = MusicTheoryConfig()
             self.piece_practice.chord_progressions = {
                 # opening 4 bars of Fly Me to the Moon
                 "fly_me_to_the_moon": [
@@ -1,5 +1,7 @@
 """Module for music analysis."""
 
+from improvisation_lab.domain.analysis.note_decision import (
+    NoteDecision, NoteDecisionEngine)
 from improvisation_lab.domain.analysis.pitch_detector import PitchDetector
 
-__all__ = ["PitchDetector"]
+__all__ = ["NoteDecision", "NoteDecisionEngine", "PitchDetector"]
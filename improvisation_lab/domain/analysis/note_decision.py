@@ -0,0 +1,141 @@
+"""Streaming note decisions from per-hop pitch readings."""
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque
+
+import numpy as np
+
+from improvisation_lab.domain.music_theory import NOTE_NAMES, Notes
+
+
+@dataclass
+class NoteDecision:
+    """Stable note after consuming a batch of pitch readings."""
+
+    note: str | None  # Stable base note, None while no note is sung
+    midi: float | None  # Median pitch of the window as fractional MIDI number
+    changed: bool  # Whether the stable note changed in this batch
+    # MIDI number of the stable note nearest to the median pitch
+    note_midi: int | None = None
+    # Offset of the median pitch from note_midi, in cents
+    cents: float | None = None
+
+
+class NoteDecisionEngine:
+    """Turn noisy per-hop f0 readings into stable note decisions.
+
+    Readings are kept in a sliding window. The candidate note is the nearest
+    note to the median of the voiced readings, or no note when too few
+    readings are voiced. Medians further than ``tolerance_cents`` from the
+    nearest note are ambiguous and keep the current decision. A candidate
+    replaces the stable note only after winning ``hysteresis`` consecutive
+    readings, so single wrong or unvoiced frames do not flicker the result.
+    """
+
+    def __init__(
+        self,
+        window_size: int = 5,
+        hysteresis: int = 2,
+        tolerance_cents: float = 50.0,
+        min_voiced_ratio: float = 0.5,
+        reference_frequency: float = 440.0,
+    ):
+        """Initialize the engine.
+
+        Args:
+            window_size: Number of readings in the sliding window.
+            hysteresis: Consecutive readings a new candidate needs to win.
+            tolerance_cents: Maximum distance of the median from a note.
+            min_voiced_ratio: Minimum ratio of voiced readings in the window.
+            reference_frequency: Frequency of A4 in Hz.
+        """
+        if window_size < 1 or hysteresis < 1:
+            raise ValueError("window_size and hysteresis must be at least 1")
+        self.window_size = window_size
+        self.hysteresis = hysteresis
+        self.tolerance_cents = tolerance_cents
+        self.min_voiced_ratio = min_voiced_ratio
+        self.reference_frequency = reference_frequency
+        self._window: Deque[float] = deque(maxlen=window_size)
+        self.note: str | None = None
+        self._median_midi: float | None = None
+        self._pending: str | None = None
+        self._pending_count = 0
+
+    def reset(self):
+        """Forget all readings and the stable note."""
+        self._window.clear()
+        self.note = None
+        self._median_midi = None
+        self._pending = None
+        self._pending_count = 0
+
+    def update(self, frequencies: np.ndarray | list[float]) -> NoteDecision:
+        """Consume pitch readings in time order.
+
+        Args:
+            frequencies: f0 per hop in Hz, zero or negative when unvoiced.
+
+        Returns:
+            The decision after the last reading.
+        """
+        midis = Notes.convert_frequency_to_midi(
+            np.ravel(frequencies), self.reference_frequency
+        )
+        changed = False
+        for midi in midis.tolist():
+            changed |= self._push(midi)
+
+        note_midi = None
+        cents = None
+        if self.note is not None and self._median_midi is not None:
+            # The octave of the stable note closest to the median pitch
+            pitch_class = Notes.get_note_index(self.note)
+            note_midi = (
+                round((self._median_midi - pitch_class) / 12) * 12 + pitch_class
+            )
+            cents = (self._median_midi - note_midi) * 100
+        return NoteDecision(
+            note=self.note,
+            midi=self._median_midi,
+            changed=changed,
+            note_midi=note_midi,
+            cents=cents,
+        )
+
+    def _push(self, midi: float) -> bool:
+        """Add one reading and return whether the stable note changed."""
+        self._window.append(midi)
+
+        candidate = self._candidate()
+        if candidate == self.note:
+            self._pending = None
+            self._pending_count = 0
+            return False
+        if candidate == self._pending:
+            self._pending_count += 1
+        else:
+            self._pending = candidate
+            self._pending_count = 1
+        if self._pending_count < self.hysteresis:
+            return False
+        self.note = candidate
+        self._pending = None
+        self._pending_count = 0
+        return True
+
+    def _candidate(self) -> str | None:
+        """Return the note suggested by the current window."""
+        voiced = [midi for midi in self._window if not math.isnan(midi)]
+        if not voiced or len(voiced) < self.min_voiced_ratio * len(self._window):
+            self._median_midi = None
+            return None
+        median = float(np.median(voiced))
+        self._median_midi = median
+        nearest = round(median)
+        if abs(median - nearest) * 100 > self.tolerance_cents:
+            return self.note
+        # MIDI note numbers modulo 12 index the chromatic scale from C
+        return NOTE_NAMES[nearest % 12]
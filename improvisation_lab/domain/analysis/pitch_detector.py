@@ -1,10 +1,14 @@
 """PitchDetector class for real-time pitch detection using FCPE."""
 
+import threading
+import time
+
 import numpy as np
 import torch
 from torchfcpe import spawn_bundled_infer_model
 
 from improvisation_lab.config import PitchDetectorConfig
+from improvisation_lab.instrumentation import timed
 
 
 class PitchDetector:
@@ -25,14 +29,19 @@ class PitchDetector:
         self.interp_uv = config.interp_uv
         self.model = spawn_bundled_infer_model(device=config.device)
 
-    def detect_pitch(self, audio_frame: np.ndarray) -> float:
-        """Detect pitch from audio frame.
+        # Counters exposed as runtime metrics, updated from inference threads
+        self.inference_count = 0
+        self.inference_seconds = 0.0
+        self._counter_lock = threading.Lock()
+
+    def _infer(self, audio_frame: np.ndarray) -> np.ndarray:
+        """Run the model and return f0 per hop.
 
         Args:
             audio_frame: Numpy array of audio samples
 
         Returns:
-            Frequency in Hz
+            Frequency in Hz for each hop, zero where no voice is detected
         """
         audio_length = len(audio_frame)
         f0_target_length = (audio_length // self.hop_length) + 1
@@ -42,6 +51,7 @@ class PitchDetector:
         audio_tensor = torch.from_numpy(audio_frame).float()
         audio_tensor = audio_tensor.unsqueeze(0).unsqueeze(-1)
 
+        start_time = time.perf_counter()
         pitch = self.model.infer(
             audio_tensor,
             sr=self.sample_rate,
@@ -52,10 +62,38 @@ class PitchDetector:
             interp_uv=self.interp_uv,
             output_interp_target_length=f0_target_length,
         )
+        elapsed = time.perf_counter() - start_time
+        with self._counter_lock:
+            self.inference_seconds += elapsed
+            self.inference_count += 1
+        return pitch[0, :, 0].cpu().numpy()
+
+    @timed("analysis.detect_pitch")
+    def detect_pitch(self, audio_frame: np.ndarray) -> float:
+        """Detect pitch from audio frame.
+
+        Args:
+            audio_frame: Numpy array of audio samples
+
+        Returns:
+            Frequency in Hz
+        """
+        f0 = self._infer(audio_frame)
 
         # Extract the middle frequency value from the pitch tensor
         # Taking the middle value helps avoid potential inaccuracies at the edges
         # of the audio frame, providing a more stable frequency estimate.
-        middle_index = pitch.size(1) // 2
-        frequency = pitch[0, middle_index, 0].item()
-        return frequency
+        middle_index = len(f0) // 2
+        return float(f0[middle_index])
+
+    @timed("analysis.detect_pitch_track")
+    def detect_pitch_track(self, audio_frame: np.ndarray) -> np.ndarray:
+        """Detect pitch for each hop of an audio frame.
+
+        Args:
+            audio_frame: Numpy array of audio samples
+
+        Returns:
+            Frequency in Hz for each hop, zero where no voice is detected
+        """
+        return self._infer(audio_frame)
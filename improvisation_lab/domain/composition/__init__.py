@@ -2,5 +2,6 @@
 
 from improvisation_lab.domain.composition.melody_composer import (
     MelodyComposer, PhraseData)
+from improvisation_lab.domain.composition.phrase_stream import PhraseStream
 
-__all__ = ["PhraseData", "MelodyComposer"]
+__all__ = ["PhraseData", "MelodyComposer", "PhraseStream"]
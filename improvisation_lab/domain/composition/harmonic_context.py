@@ -0,0 +1,287 @@
+"""Module for resolving the harmonic context that phrases are generated in.
+
+A harmonic context is a scale played over a chord. Everything the phrase
+generator derives from it (the scale in order, the position of each pitch
+class in the scale, the adjacent scale notes and the chord tones) is computed
+once per context and shared through a bounded LRU cache, since practice sets
+reuse the same few contexts. The moves allowed from each pitch class are
+compiled into transition tables, so generating a note is a table lookup plus
+a random draw. The tables are also held as arrays, to draw the next notes of
+many phrases at once.
+"""
+
+import random
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable
+
+import numpy as np
+
+from improvisation_lab.domain.music_theory import (ChordTone, Scale,
+                                                   pitch_class_mask)
+
+# Harmonic contexts kept in the cache
+CONTEXT_CACHE_SIZE = 256
+
+# Weight of a move, given the current and the next pitch class
+TransitionWeight = Callable[[int, int], float]
+
+
+def closest_pitch_class_in_direction(
+    pitch_class: int, scale_mask: int, direction: int
+) -> int:
+    """Find the closest pitch class of a scale in a given direction.
+
+    Args:
+        pitch_class: The pitch class to start from.
+        scale_mask: The pitch class mask of the scale.
+        direction: Direction to search (-1 for lower, 1 for higher).
+
+    Returns:
+        The closest pitch class of the scale in the given direction, or the
+        starting pitch class if the scale has no other note.
+    """
+    for step in range(1, 12):
+        candidate = (pitch_class + direction * step) % 12
+        if scale_mask >> candidate & 1:
+            return candidate
+    return pitch_class
+
+
+@dataclass(frozen=True)
+class Transition:
+    """Candidate next pitch classes of a pitch class and their weights.
+
+    Attributes:
+        candidates: The pitch classes that can follow.
+        cum_weights:
+            Cumulative weights of the candidates, None if they are equally likely.
+    """
+
+    candidates: tuple[int, ...]
+    cum_weights: tuple[float, ...] | None = None
+
+    @classmethod
+    def build(
+        cls,
+        current: int,
+        candidates: tuple[int, ...],
+        weight: TransitionWeight | None = None,
+    ) -> "Transition":
+        """Build the transition from a pitch class to candidates.
+
+        Args:
+            current: The current pitch class.
+            candidates: The pitch classes that can follow.
+            weight: Weight of each move (default: None, equally likely).
+
+        Returns:
+            The transition.
+        """
+        if weight is None:
+            return cls(candidates)
+        cum_weights = []
+        total = 0.0
+        for candidate in candidates:
+            total += weight(current, candidate)
+            cum_weights.append(total)
+        return cls(candidates, tuple(cum_weights))
+
+    def draw(self, rng: random.Random) -> int:
+        """Draw the next pitch class.
+
+        Args:
+            rng: The random generator to draw with.
+
+        Returns:
+            The next pitch class.
+        """
+        if self.cum_weights is None:
+            return rng.choice(self.candidates)
+        return rng.choices(self.candidates, cum_weights=self.cum_weights)[0]
+
+
+@dataclass(frozen=True)
+class TransitionTable:
+    """Transitions of all 12 pitch classes as arrays, for drawing in bulk.
+
+    Attributes:
+        candidates:
+            Candidate next pitch classes of each pitch class (12 x max
+            candidates), padded with -1.
+        cum_probs:
+            Cumulative probabilities of the candidates, with the last candidate
+            and padding set to infinity, so that the number of entries not
+            above a uniform draw is the index of the drawn candidate.
+    """
+
+    candidates: np.ndarray
+    cum_probs: np.ndarray
+
+    @classmethod
+    def from_transitions(cls, transitions: tuple[Transition, ...]) -> "TransitionTable":
+        """Build the table of the transitions of all 12 pitch classes.
+
+        Args:
+            transitions: The transition of each pitch class.
+
+        Returns:
+            The transition table.
+        """
+        width = max(1, max(len(transition.candidates) for transition in transitions))
+        candidates = np.full((12, width), -1, dtype=np.int8)
+        cum_probs = np.full((12, width), np.inf)
+        for pitch_class, transition in enumerate(transitions):
+            count = len(transition.candidates)
+            if count == 0:
+                continue
+            candidates[pitch_class, :count] = transition.candidates
+            if transition.cum_weights is None:
+                cum_weights = np.arange(1, count + 1, dtype=float)
+            else:
+                cum_weights = np.asarray(transition.cum_weights, dtype=float)
+            cum_probs[pitch_class, : count - 1] = (
+                cum_weights[:-1] / cum_weights[-1]
+            )
+        candidates.setflags(write=False)
+        cum_probs.setflags(write=False)
+        return cls(candidates, cum_probs)
+
+    def draw(self, current: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Draw the next pitch class of each current pitch class.
+
+        Args:
+            current: The current pitch classes.
+            rng: The random generator to draw with.
+
+        Returns:
+            The next pitch classes, -1 where a pitch class has no candidate.
+        """
+        draws = rng.random(current.shape)
+        index = (self.cum_probs[current] <= draws[..., np.newaxis]).sum(axis=-1)
+        return self.candidates[current, index]
+
+
+@dataclass(frozen=True)
+class HarmonicContext:
+    """Pitch class data of a scale played over a chord.
+
+    Tables indexed by pitch class have an entry for all 12 pitch classes,
+    whether they are in the scale or not.
+
+    Attributes:
+        scale: The pitch classes of the scale in scale order.
+        scale_mask: The pitch class mask of the scale.
+        chord_mask: The pitch class mask of the chord.
+        scale_index: Position of each pitch class in the scale, -1 if not in it.
+        adjacent: The lower and higher adjacent scale notes of each pitch class.
+        transitions:
+            Moves from each pitch class in a phrase: chord tones move freely to
+            any other scale note, other notes only to adjacent scale notes.
+        free_transitions: Moves from each pitch class to any other scale note.
+        transition_table: The transitions as arrays.
+        free_transition_table: The free transitions as arrays.
+    """
+
+    scale: tuple[int, ...]
+    scale_mask: int
+    chord_mask: int
+    scale_index: tuple[int, ...]
+    adjacent: tuple[tuple[int, int], ...]
+    transitions: tuple[Transition, ...]
+    free_transitions: tuple[Transition, ...]
+    transition_table: TransitionTable = field(compare=False)
+    free_transition_table: TransitionTable = field(compare=False)
+
+    @classmethod
+    def from_pitch_classes(
+        cls,
+        scale: tuple[int, ...],
+        chord_mask: int = 0,
+        weight: TransitionWeight | None = None,
+    ) -> "HarmonicContext":
+        """Derive a context from the pitch classes of a scale and a chord mask.
+
+        Args:
+            scale: The pitch classes of the scale in scale order.
+            chord_mask: The pitch class mask of the chord (default: 0).
+            weight: Weight of each move (default: None, equally likely).
+
+        Returns:
+            The context of the scale over the chord.
+        """
+        scale = tuple(scale)
+        scale_mask = pitch_class_mask(scale)
+        scale_index = [-1] * 12
+        for index, pitch_class in enumerate(scale):
+            scale_index[pitch_class] = index
+
+        adjacent = []
+        for pitch_class in range(12):
+            index = scale_index[pitch_class]
+            if index >= 0:
+                adjacent.append(
+                    (scale[(index - 1) % len(scale)], scale[(index + 1) % len(scale)])
+                )
+            else:
+                adjacent.append(
+                    (
+                        closest_pitch_class_in_direction(pitch_class, scale_mask, -1),
+                        closest_pitch_class_in_direction(pitch_class, scale_mask, 1),
+                    )
+                )
+
+        free_transitions = tuple(
+            Transition.build(
+                pitch_class, tuple(pc for pc in scale if pc != pitch_class), weight
+            )
+            for pitch_class in range(12)
+        )
+        transitions = tuple(
+            (
+                free_transitions[pitch_class]
+                if chord_mask >> pitch_class & 1
+                else Transition.build(pitch_class, adjacent[pitch_class], weight)
+            )
+            for pitch_class in range(12)
+        )
+
+        return cls(
+            scale=scale,
+            scale_mask=scale_mask,
+            chord_mask=chord_mask,
+            scale_index=tuple(scale_index),
+            adjacent=tuple(adjacent),
+            transitions=transitions,
+            free_transitions=free_transitions,
+            transition_table=TransitionTable.from_transitions(transitions),
+            free_transition_table=TransitionTable.from_transitions(free_transitions),
+        )
+
+    def is_chord_tone(self, pitch_class: int) -> bool:
+        """Return whether a pitch class is a chord tone."""
+        return bool(self.chord_mask >> pitch_class & 1)
+
+
+@lru_cache(maxsize=CONTEXT_CACHE_SIZE)
+def resolve_context(
+    scale_root: str, scale_type: str, chord_root: str, chord_type: str
+) -> HarmonicContext:
+    """Resolve the context of a scale over a chord, cached across callers.
+
+    Args:
+        scale_root: The root note of the scale.
+        scale_type: The type of scale (e.g., "major", "natural_minor").
+        chord_root: The root note of the chord.
+        chord_type: The type of chord (e.g., "maj", "maj7").
+
+    Returns:
+        The context of the scale over the chord.
+
+    Raises:
+        ValueError: If a root note, the scale type or the chord type is invalid.
+    """
+    return HarmonicContext.from_pitch_classes(
+        Scale.get_scale_pitch_classes(scale_root, scale_type),
+        ChordTone.get_chord_mask(chord_root, chord_type),
+    )
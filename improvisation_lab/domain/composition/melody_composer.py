@@ -1,12 +1,17 @@
 """Module for handling melody generation and playback."""
 
+import random
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
+import numpy as np
+
+from improvisation_lab.domain.composition.harmonic_context import \
+    resolve_context
 from improvisation_lab.domain.composition.note_transposer import NoteTransposer
 from improvisation_lab.domain.composition.phrase_generator import \
     PhraseGenerator
-from improvisation_lab.domain.music_theory import ChordTone, Notes
+from improvisation_lab.domain.music_theory import Notes
 
 
 @dataclass
@@ -22,9 +27,16 @@ class PhraseData:
 class MelodyComposer:
     """Class responsible for generating melodic phrases based on chord progressions."""
 
-    def __init__(self):
-        """Initialize MelodyPlayer with a melody generator."""
-        self.phrase_generator = PhraseGenerator()
+    def __init__(self, rng: random.Random | None = None):
+        """Initialize MelodyPlayer with a melody generator.
+
+        Args:
+            rng:
+                Random generator to draw notes with (default: None, a new
+                unseeded one). Pass a seeded one for reproducible melodies.
+        """
+        self.rng = random.Random() if rng is None else rng
+        self.phrase_generator = PhraseGenerator(self.rng)
         self.note_transposer = NoteTransposer()
 
     def generate_phrases(
@@ -40,37 +52,111 @@ class MelodyComposer:
         Returns:
             List of PhraseData objects containing the generated melodic phrases.
         """
-        phrases: List[PhraseData] = []
+        return list(self.iter_phrases(progression, loop=False))
+
+    def iter_phrases(
+        self, progression: List[tuple[str, str, str, str, int]], loop: bool = True
+    ) -> Iterator[PhraseData]:
+        """Generate melodic phrases over a chord progression on demand.
+
+        Phrases connect across loops of the progression as they do within it,
+        so an endless melody does not repeat itself.
+
+        Args:
+            progression:
+                List of tuples containing (scale_root, scale_type, chord_root,
+                chord_type, length) for each chord in the progression.
+            loop: Whether to start over at the end of the progression, endlessly.
+
+        Yields:
+            PhraseData objects of the phrases.
+        """
         prev_note: Optional[str] = None
         prev_note_was_chord_tone = False
 
+        while progression:
+            for scale_root, scale_type, chord_root, chord_type, length in progression:
+                phrase = self.phrase_generator.generate_phrase(
+                    scale_root=scale_root,
+                    scale_type=scale_type,
+                    chord_root=chord_root,
+                    chord_type=chord_type,
+                    prev_note=prev_note,
+                    prev_note_was_chord_tone=prev_note_was_chord_tone,
+                    length=length,
+                )
+
+                # Update information for the next phrase
+                prev_note = phrase[-1]
+                context = resolve_context(
+                    scale_root, scale_type, chord_root, chord_type
+                )
+                prev_note_was_chord_tone = context.is_chord_tone(
+                    Notes.get_note_index(prev_note)
+                )
+
+                yield PhraseData(
+                    notes=phrase,
+                    chord_name=f"{chord_root}{chord_type}",
+                    scale_info=f"{scale_root} {scale_type}",
+                    length=length,
+                )
+            if not loop:
+                break
+
+    def generate_phrase_batches(
+        self,
+        progression: List[tuple[str, str, str, str, int]],
+        num_melodies: int,
+        rng: np.random.Generator | None = None,
+    ) -> List[np.ndarray]:
+        """Generate many melodies over a chord progression at once.
+
+        Each melody connects its phrases as generate_phrases does.
+
+        Args:
+            progression:
+                List of tuples containing (scale_root, scale_type, chord_root,
+                chord_type, length) for each chord in the progression.
+            num_melodies: The number of melodies.
+            rng:
+                The random generator to draw with (default: None, one seeded
+                from the composer's random generator).
+
+        Returns:
+            The pitch classes of the phrases of all melodies for each chord in
+            the progression (num_melodies x length).
+        """
+        rng = np.random.default_rng(self.rng.getrandbits(64)) if rng is None else rng
+        batches: List[np.ndarray] = []
+        prev: np.ndarray | None = None
+        prev_was_chord_tone: np.ndarray | None = None
+
         for scale_root, scale_type, chord_root, chord_type, length in progression:
-            phrase = self.phrase_generator.generate_phrase(
+            batch = self.phrase_generator.generate_phrase_batch(
                 scale_root=scale_root,
                 scale_type=scale_type,
                 chord_root=chord_root,
                 chord_type=chord_type,
-                prev_note=prev_note,
-                prev_note_was_chord_tone=prev_note_was_chord_tone,
+                num_phrases=num_melodies,
                 length=length,
+                prev=prev,
+                prev_was_chord_tone=prev_was_chord_tone,
+                rng=rng,
             )
 
-            # Update information for the next phrase
-            prev_note = phrase[-1]
-            prev_note_was_chord_tone = self.phrase_generator.is_chord_tone(
-                prev_note, ChordTone.get_chord_tones(chord_root, chord_type)
-            )
-
-            phrases.append(
-                PhraseData(
-                    notes=phrase,
-                    chord_name=f"{chord_root}{chord_type}",
-                    scale_info=f"{scale_root} {scale_type}",
-                    length=length,
+            # Update information for the next phrases
+            if length > 0:
+                context = resolve_context(
+                    scale_root, scale_type, chord_root, chord_type
                 )
-            )
+                prev = batch[:, -1]
+                prev_was_chord_tone = (
+                    context.chord_mask >> prev.astype(np.int64) & 1
+                ).astype(bool)
+            batches.append(batch)
 
-        return phrases
+        return batches
 
     def generate_interval_melody(
         self, base_notes: List[Notes], interval: int
@@ -1,6 +1,6 @@
 """Note transposer."""
 
-from improvisation_lab.domain.music_theory import Notes
+from improvisation_lab.domain.music_theory import NOTES_BY_INDEX, Notes
 
 
 class NoteTransposer:
@@ -12,6 +12,4 @@ class NoteTransposer:
 
     def transpose_note(self, note: Notes, interval: int) -> Notes:
         """Transpose a note by a given interval."""
-        chromatic_scale = Notes.get_chromatic_scale(note.value)
-        transposed_index = (interval) % len(chromatic_scale)
-        return Notes(chromatic_scale[transposed_index])
+        return NOTES_BY_INDEX[(Notes.get_note_index(note) + interval) % 12]
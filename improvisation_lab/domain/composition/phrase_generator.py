@@ -2,11 +2,39 @@
 
 This module provides functionality to generate natural melody phrases
 based on given scales and chord progressions, following music theory principles.
+
+Notes are handled internally as pitch classes (indices in the chromatic scale
+from C) and scales and chords as 12-bit pitch class masks, so membership tests
+are bit operations. Note names are only used at the public interface. What is
+derived from a scale and chord is resolved once per harmonic context.
 """
 
 import random
+from functools import lru_cache
+
+import numpy as np
+
+from improvisation_lab.domain.composition.harmonic_context import (
+    CONTEXT_CACHE_SIZE, HarmonicContext, closest_pitch_class_in_direction,
+    resolve_context)
+from improvisation_lab.domain.music_theory import (NOTE_NAMES, Notes,
+                                                   pitch_class_mask)
+
+
+def _to_pitch_classes(notes: list[str] | tuple[str, ...]) -> tuple[int, ...]:
+    """Convert note names to pitch classes."""
+    return tuple(Notes.get_note_index(note) for note in notes)
+
 
-from improvisation_lab.domain.music_theory import ChordTone, Notes, Scale
+@lru_cache(maxsize=CONTEXT_CACHE_SIZE)
+def _context_of(
+    scale_notes: tuple[str, ...], chord_tones: tuple[str, ...] = ()
+) -> HarmonicContext:
+    """Derive the harmonic context of note names, cached like resolve_context."""
+    return HarmonicContext.from_pitch_classes(
+        _to_pitch_classes(scale_notes),
+        pitch_class_mask(_to_pitch_classes(chord_tones)),
+    )
 
 
 class PhraseGenerator:
@@ -19,6 +47,16 @@ class PhraseGenerator:
     while non-chord tones move to adjacent notes.
     """
 
+    def __init__(self, rng: random.Random | None = None):
+        """Initialize PhraseGenerator.
+
+        Args:
+            rng:
+                Random generator to draw notes with (default: None, a new
+                unseeded one). Pass a seeded one for reproducible phrases.
+        """
+        self.rng = random.Random() if rng is None else rng
+
     def is_chord_tone(self, note: str, chord_tones: list[str]) -> bool:
         """Check if a note is a chord tone.
 
@@ -41,18 +79,8 @@ class PhraseGenerator:
         Returns:
             The list of adjacent notes in order (lower note first, then higher note).
         """
-        length_scale_notes = len(scale_notes)
-        if note in scale_notes:
-            note_index = scale_notes.index(note)
-            return [
-                scale_notes[(note_index - 1) % length_scale_notes],
-                scale_notes[(note_index + 1) % length_scale_notes],
-            ]
-
-        return [
-            self._find_closest_note_in_direction(note, scale_notes, -1),
-            self._find_closest_note_in_direction(note, scale_notes, 1),
-        ]
+        adjacent = _context_of(tuple(scale_notes)).adjacent[Notes.get_note_index(note)]
+        return [NOTE_NAMES[pitch_class] for pitch_class in adjacent]
 
     def _find_closest_note_in_direction(
         self, note: str, scale_notes: list[str], direction: int
@@ -60,26 +88,20 @@ class PhraseGenerator:
         """Find the closest note in a given direction within the scale.
 
         Args:
-            start_index: Starting index in the chromatic scale.
-            all_notes: List of all notes (chromatic scale).
+            note: The note to start from.
             scale_notes: List of notes in the target scale.
             direction: Direction to search (-1 for lower, 1 for higher).
 
         Returns:
             The closest note in the given direction that exists in the scale.
         """
-        all_notes = [note.value for note in Notes]  # Chromatic scale
-        note_index = all_notes.index(note)
-
-        current_index = note_index
-        while True:
-            current_index = (current_index + direction) % 12
-            current_note = all_notes[current_index]
-            if current_note in scale_notes:
-                return current_note
-            if current_index == note_index:  # If we've gone full circle
-                break
-        return all_notes[current_index]
+        return NOTE_NAMES[
+            closest_pitch_class_in_direction(
+                Notes.get_note_index(note),
+                pitch_class_mask(_to_pitch_classes(scale_notes)),
+                direction,
+            )
+        ]
 
     def get_next_note(
         self, current_note: str, scale_notes: list[str], chord_tones: list[str]
@@ -94,15 +116,25 @@ class PhraseGenerator:
         Returns:
             The next note.
         """
-        is_current_chord_tone = self.is_chord_tone(current_note, chord_tones)
+        next_pitch_class = self._next_pitch_class(
+            Notes.get_note_index(current_note),
+            _context_of(tuple(scale_notes), tuple(chord_tones)),
+        )
+        return NOTE_NAMES[next_pitch_class]
+
+    def _next_pitch_class(self, current: int, context: HarmonicContext) -> int:
+        """Get the next pitch class of a phrase.
+
+        Args:
+            current: The current pitch class.
+            context: The harmonic context of the phrase.
 
-        if is_current_chord_tone:
-            # For chord tones, freely move to any scale note
-            available_notes = [note for note in scale_notes if note != current_note]
-            return random.choice(available_notes)
-        # For non-chord tones, move to adjacent notes only
-        adjacent_notes = self.get_adjacent_notes(current_note, scale_notes)
-        return random.choice(adjacent_notes)
+        Returns:
+            The next pitch class.
+        """
+        # Chord tones freely move to any scale note, non-chord tones only to
+        # adjacent notes
+        return context.transitions[current].draw(self.rng)
 
     def select_first_note(
         self,
@@ -123,24 +155,40 @@ class PhraseGenerator:
         Returns:
             The selected first note.
         """
+        first = self._first_pitch_class(
+            _context_of(tuple(scale_notes), tuple(chord_tones)),
+            None if prev_note is None else Notes.get_note_index(prev_note),
+            prev_note_was_chord_tone,
+        )
+        return NOTE_NAMES[first]
+
+    def _first_pitch_class(
+        self,
+        context: HarmonicContext,
+        prev: int | None,
+        prev_was_chord_tone: bool,
+    ) -> int:
+        """Select the first pitch class of a phrase.
+
+        Args:
+            context: The harmonic context of the phrase.
+            prev: The last pitch class of the previous phrase, if any.
+            prev_was_chord_tone: Whether the previous note was a chord tone.
+
+        Returns:
+            The selected first pitch class.
+        """
         # For the first phrase, randomly select from scale notes
-        if prev_note is None:
-            return random.choice(scale_notes)
+        if prev is None:
+            return self.rng.choice(context.scale)
 
         # Case: previous note was a chord tone, can move freely
-        if prev_note_was_chord_tone:
-            available_notes = [note for note in scale_notes if note != prev_note]
-            return random.choice(available_notes)
-
-        # Case: previous note was not a chord tone
-        if prev_note in chord_tones:
-            # If it's a chord tone in the current chord, can move freely
-            available_notes = [note for note in scale_notes if note != prev_note]
-            return random.choice(available_notes)
+        if prev_was_chord_tone:
+            return context.free_transitions[prev].draw(self.rng)
 
-        # If it's not a chord tone, can only move to adjacent notes
-        adjacent_notes = self.get_adjacent_notes(prev_note, scale_notes)
-        return random.choice(adjacent_notes)
+        # Otherwise it moves freely if it is a chord tone in the current chord,
+        # and only to adjacent notes if not
+        return context.transitions[prev].draw(self.rng)
 
     def generate_phrase(
         self,
@@ -167,22 +215,90 @@ class PhraseGenerator:
         Returns:
             A list of note names in the phrase.
         """
-        # Get scale notes and chord tones
-        scale_notes = Scale.get_scale_notes(scale_root, scale_type)
-        chord_tones = ChordTone.get_chord_tones(chord_root, chord_type)
-
-        # Generate the phrase
-        phrase = []
+        # Scale notes and chord tones are resolved once per context
+        context = resolve_context(scale_root, scale_type, chord_root, chord_type)
 
         # Select the first note
-        current_note = self.select_first_note(
-            scale_notes, chord_tones, prev_note, prev_note_was_chord_tone
+        current = self._first_pitch_class(
+            context,
+            None if prev_note is None else Notes.get_note_index(prev_note),
+            prev_note_was_chord_tone,
         )
-        phrase.append(current_note)
+        phrase = [current]
 
         # Generate remaining notes
         for _ in range(length - 1):
-            current_note = self.get_next_note(current_note, scale_notes, chord_tones)
-            phrase.append(current_note)
+            current = self._next_pitch_class(current, context)
+            phrase.append(current)
+
+        return [NOTE_NAMES[pitch_class] for pitch_class in phrase]
+
+    def generate_phrase_batch(
+        self,
+        scale_root: str,
+        scale_type: str,
+        chord_root: str,
+        chord_type: str,
+        num_phrases: int,
+        length: int = 8,
+        prev: np.ndarray | None = None,
+        prev_was_chord_tone: np.ndarray | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> np.ndarray:
+        """Generate many phrases at once, as pitch classes.
+
+        The phrases follow the same rules as generate_phrase. Notes are drawn
+        for all phrases at once, one position at a time.
+
+        Args:
+            scale_root: The root note of the scale.
+            scale_type: The type of scale (e.g., "major", "natural_minor").
+            chord_root: The root note of the chord.
+            chord_type: The type of chord (e.g., "maj", "maj7").
+            num_phrases: The number of phrases.
+            length: The length of each phrase (default: 8).
+            prev:
+                The last pitch class of the previous phrase of each phrase
+                (default: None, no previous phrase).
+            prev_was_chord_tone:
+                Whether the previous note of each phrase was a chord tone
+                (default: None, none was).
+            rng:
+                The random generator to draw with (default: None, one seeded
+                from the generator's random generator).
+
+        Returns:
+            The pitch classes of the phrases (num_phrases x length). Use
+            pitch_class_names to convert them to note names.
+
+        Raises:
+            ValueError: If the scale has too few notes to move between.
+        """
+        rng = np.random.default_rng(self.rng.getrandbits(64)) if rng is None else rng
+        context = resolve_context(scale_root, scale_type, chord_root, chord_type)
+        phrases = np.empty((num_phrases, length), dtype=np.int8)
+        if length == 0:
+            return phrases
+
+        # Select the first notes
+        if prev is None:
+            current = rng.choice(np.array(context.scale, dtype=np.int8), num_phrases)
+        else:
+            prev = np.asarray(prev, dtype=np.int8)
+            current = context.transition_table.draw(prev, rng)
+            if prev_was_chord_tone is not None:
+                current = np.where(
+                    prev_was_chord_tone,
+                    context.free_transition_table.draw(prev, rng),
+                    current,
+                )
+        phrases[:, 0] = current
+
+        # Generate remaining notes
+        for position in range(1, length):
+            current = context.transition_table.draw(current, rng)
+            phrases[:, position] = current
 
-        return phrase
+        if (phrases < 0).any():
+            raise ValueError(f"Too few notes in the scale: {scale_root} {scale_type}")
+        return phrases
@@ -0,0 +1,78 @@
+"""Module for playing phrases generated on demand.
+
+Endless practice would otherwise need the whole melody up front. A phrase
+stream draws phrases from an iterator as they are reached, keeping only the
+current phrase and a small look-ahead, so memory stays constant however long
+the practice runs.
+"""
+
+from collections import deque
+from typing import Deque, Iterator
+
+from improvisation_lab.domain.composition.melody_composer import PhraseData
+
+
+class PhraseStream:
+    """Phrases of an iterator, indexed by their position in the melody.
+
+    The stream can be used in place of a list of phrases by code that moves
+    forward through the phrases by index: indexing a phrase generates the
+    phrases up to the look-ahead after it, and releases the phrases more than
+    the look-ahead before it, which can then no longer be indexed. Peeking at
+    the next phrases thus keeps the current one.
+    """
+
+    def __init__(self, phrases: Iterator[PhraseData], lookahead: int = 1):
+        """Initialize the stream and generate its first phrases.
+
+        Args:
+            phrases: Iterator of the phrases, usually endless.
+            lookahead:
+                Number of phrases generated ahead of the current one, e.g. to
+                show the next phrase (default: 1).
+
+        Raises:
+            ValueError: If lookahead is less than 1.
+        """
+        if lookahead < 1:
+            raise ValueError("lookahead must be at least 1")
+        self.lookahead = lookahead
+        self._phrases = phrases
+        self._buffer: Deque[PhraseData] = deque()
+        # Index of the first buffered phrase in the melody
+        self._start = 0
+        self._fill(lookahead)
+
+    def __len__(self) -> int:
+        """Return the number of phrases generated so far."""
+        return self._start + len(self._buffer)
+
+    def __getitem__(self, index: int) -> PhraseData:
+        """Return a phrase, generating the look-ahead after it.
+
+        Args:
+            index: Index of the phrase in the melody.
+
+        Returns:
+            The phrase.
+
+        Raises:
+            IndexError: If the phrase was released or the iterator ended before it.
+        """
+        if index < self._start:
+            raise IndexError(f"Phrase {index} was already released")
+        self._fill(index + self.lookahead)
+        if index >= len(self):
+            raise IndexError(f"Phrase {index} is past the end of the melody")
+        while self._start < index - self.lookahead:
+            self._buffer.popleft()
+            self._start += 1
+        return self._buffer[index - self._start]
+
+    def _fill(self, index: int):
+        """Generate phrases up to an index, unless the iterator ends first."""
+        while len(self) <= index:
+            phrase = next(self._phrases, None)
+            if phrase is None:
+                return
+            self._buffer.append(phrase)
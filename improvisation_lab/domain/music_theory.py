@@ -1,6 +1,9 @@
 """Module containing basic music theory concepts and constants."""
 
+import math
+from dataclasses import dataclass
 from enum import Enum
+from typing import Iterable
 
 import numpy as np
 
@@ -45,8 +48,14 @@ class Notes(str, Enum):
 
         Returns:
             int: The index of the note in the chromatic scale (0-11).
+
+        Raises:
+            ValueError: If the note is not a valid note name.
         """
-        return list(cls).index(cls(note))
+        try:
+            return NOTE_INDEX[note]
+        except KeyError:
+            raise ValueError(f"{note!r} is not a valid {cls.__name__}") from None
 
     @classmethod
     def get_chromatic_scale(cls, note: str) -> list[str]:
@@ -59,23 +68,23 @@ class Notes(str, Enum):
             list[str]: A list of note names in chromatic order,
                       starting from C (e.g., ["C", "C#", "D", ...]).
         """
-        start_idx = cls.get_note_index(note)
-        all_notes = [note.value for note in cls]
-        return all_notes[start_idx:] + all_notes[:start_idx]
+        return list(CHROMATIC_SCALES[cls.get_note_index(note)])
 
     @classmethod
-    def convert_frequency_to_note(cls, frequency: float) -> str:
+    def convert_frequency_to_note(
+        cls, frequency: float, reference_frequency: float = 440.0
+    ) -> str:
         """Convert a frequency in Hz to the nearest note name on a piano keyboard.
 
         Args:
             frequency: The frequency in Hz.
+            reference_frequency: Frequency of A4 in Hz.
 
         Returns:
             The name of the nearest note.
         """
-        A4_frequency = 440.0
-        # Calculate the number of semitones from A4 (440Hz)
-        n = 12 * np.log2(frequency / A4_frequency)
+        # Calculate the number of semitones from A4
+        n = 12 * np.log2(frequency / reference_frequency)
 
         # Round to the nearest semitone
         n = round(n)
@@ -84,28 +93,323 @@ class Notes(str, Enum):
         octave = 4 + (n + 9) // 12
         note_idx = (n + 9) % 12
 
-        note = cls.get_chromatic_scale(cls.C)[note_idx]
-        return f"{note}{octave}"
+        return f"{NOTE_NAMES[note_idx]}{octave}"
+
+    @classmethod
+    def convert_frequency_to_midi(
+        cls, frequencies: np.ndarray | float, reference_frequency: float = 440.0
+    ) -> np.ndarray:
+        """Convert frequencies in Hz to fractional MIDI note numbers.
+
+        Args:
+            frequencies: Frequencies in Hz, zero or negative where unvoiced.
+            reference_frequency: Frequency of A4 (MIDI note 69) in Hz.
+
+        Returns:
+            MIDI note numbers as floats, NaN where unvoiced.
+        """
+        frequencies = np.asarray(frequencies, dtype=np.float64)
+        voiced = frequencies > 0
+        midi = np.full(frequencies.shape, np.nan)
+        midi[voiced] = 69 + 12 * np.log2(frequencies[voiced] / reference_frequency)
+        return midi
+
+    @classmethod
+    def convert_frequencies_to_notes(
+        cls, frequencies: np.ndarray, reference_frequency: float = 440.0
+    ) -> "NoteTrack":
+        """Convert a track of frequencies to notes in one vectorized pass.
+
+        Args:
+            frequencies: Frequencies in Hz, zero or negative where unvoiced.
+            reference_frequency: Frequency of A4 (MIDI note 69) in Hz.
+
+        Returns:
+            The nearest note of each frequency.
+        """
+        midi = cls.convert_frequency_to_midi(frequencies, reference_frequency)
+        voiced = ~np.isnan(midi)
+        nearest = np.where(voiced, np.rint(midi), 0).astype(np.int64)
+        return NoteTrack(
+            voiced=voiced,
+            midi=np.where(voiced, nearest, -1),
+            pitch_class=np.where(voiced, nearest % 12, -1),
+            octave=np.where(voiced, nearest // 12 - 1, -1),
+            cents=np.where(voiced, (midi - nearest) * 100, np.nan),
+        )
 
     @classmethod
-    def convert_frequency_to_base_note(cls, frequency: float) -> str:
+    def convert_frequency_to_base_note(
+        cls, frequency: float, reference_frequency: float = 440.0
+    ) -> str:
         """Convert frequency to base note name without octave number.
 
         Args:
             frequency: Frequency in Hz
+            reference_frequency: Frequency of A4 in Hz
 
         Returns:
             Base note name (e.g., 'C', 'C#', 'D')
         """
-        note_with_octave = cls.convert_frequency_to_note(frequency)
+        note_with_octave = cls.convert_frequency_to_note(frequency, reference_frequency)
         return note_with_octave[:-1]  # Remove the octave number
 
 
+# Lookup tables built once at import, so that note operations on the per-frame
+# and per-note paths are table lookups instead of scans of the enum.
+# Note names in chromatic order from C
+NOTE_NAMES: tuple[str, ...] = tuple(note.value for note in Notes)
+# Notes members in chromatic order from C
+NOTES_BY_INDEX: tuple[Notes, ...] = tuple(Notes)
+# Index of each note in the chromatic scale, keyed by name and by member
+# (members of a str Enum hash by member name, e.g. "C_SHARP", not by value)
+NOTE_INDEX: dict[str, int] = {
+    **{name: idx for idx, name in enumerate(NOTE_NAMES)},
+    **{note: idx for idx, note in enumerate(NOTES_BY_INDEX)},
+}
+# Chromatic scale starting from each note, indexed by the starting note's index
+CHROMATIC_SCALES: tuple[tuple[str, ...], ...] = tuple(
+    NOTE_NAMES[idx:] + NOTE_NAMES[:idx] for idx in range(12)
+)
+# Names of MIDI notes 0-127 with octave numbers (MIDI 60 is C4)
+MIDI_NOTE_NAMES: tuple[str, ...] = tuple(
+    f"{NOTE_NAMES[midi % 12]}{midi // 12 - 1}" for midi in range(128)
+)
+# Name tables as object arrays, for converting whole tracks with np.take
+_BASE_NAME_TABLE = np.array([*NOTE_NAMES, None], dtype=object)
+_MIDI_NAME_TABLE = np.array([*MIDI_NOTE_NAMES, None], dtype=object)
+
+
+def pitch_class_names(pitch_classes: np.ndarray) -> list:
+    """Convert an array of pitch classes to nested lists of note names.
+
+    Args:
+        pitch_classes: Pitch classes of any shape, negative where there is no note.
+
+    Returns:
+        Note names in the shape of the array, None where there is no note.
+    """
+    pitch_classes = np.asarray(pitch_classes)
+    return np.take(
+        _BASE_NAME_TABLE, np.where(pitch_classes >= 0, pitch_classes, -1)
+    ).tolist()
+
+
+def pitch_class_mask(pitch_classes: Iterable[int]) -> int:
+    """Return the 12-bit mask with the bit of each pitch class set.
+
+    Pitch class ``pc`` is in a mask if ``mask >> pc & 1``.
+
+    Args:
+        pitch_classes: Indices of notes in the chromatic scale from C (0-11).
+
+    Returns:
+        The mask.
+    """
+    mask = 0
+    for pitch_class in pitch_classes:
+        mask |= 1 << pitch_class
+    return mask
+
+
+@dataclass(frozen=True)
+class NoteTrack:
+    """Nearest notes of a track of frequencies, as parallel arrays.
+
+    Unvoiced frames are masked out by ``voiced``; their integer fields are -1
+    and their cents offset is NaN.
+    """
+
+    voiced: np.ndarray  # Whether each frame is voiced
+    midi: np.ndarray  # MIDI note number of the nearest note
+    pitch_class: np.ndarray  # Index of the nearest note in the chromatic scale
+    octave: np.ndarray  # Octave number of the nearest note
+    cents: np.ndarray  # Offset of the frequency from the nearest note, in cents
+
+    def __len__(self) -> int:
+        """Return the number of frames."""
+        return len(self.voiced)
+
+    def base_note_names(self) -> list[str | None]:
+        """Return the base note name of each frame, None where unvoiced."""
+        return np.take(_BASE_NAME_TABLE, self.pitch_class).tolist()
+
+    def note_names(self) -> list[str | None]:
+        """Return the note name with octave of each frame, None where unvoiced.
+
+        Frames outside the MIDI range 0-127 are also None.
+        """
+        in_range = self.voiced & (self.midi >= 0) & (self.midi < 128)
+        return np.take(_MIDI_NAME_TABLE, np.where(in_range, self.midi, -1)).tolist()
+
+
+class NoteGrid:
+    """Semitone boundaries for classifying frequencies into notes.
+
+    The frequencies at which the nearest note changes are computed once for
+    the range of detectable frequencies, so a whole f0 track is classified
+    with a single ``np.searchsorted`` instead of a logarithm per frequency.
+    """
+
+    def __init__(
+        self, f0_min: float, f0_max: float, reference_frequency: float = 440.0
+    ):
+        """Build the grid.
+
+        Args:
+            f0_min: Lowest frequency to classify, in Hz.
+            f0_max: Highest frequency to classify, in Hz.
+            reference_frequency: Frequency of A4 (MIDI note 69) in Hz.
+        """
+        if not 0 < f0_min < f0_max:
+            raise ValueError("The frequency range must satisfy 0 < f0_min < f0_max")
+        self.reference_frequency = reference_frequency
+        # Nearest notes of the range limits
+        self.first_midi = round(69 + 12 * math.log2(f0_min / reference_frequency))
+        last_midi = round(69 + 12 * math.log2(f0_max / reference_frequency))
+        # Lower edge of each note of the range, then the upper edge of the last
+        edge_midis = np.arange(self.first_midi, last_midi + 2) - 0.5
+        self.edges = reference_frequency * 2 ** ((edge_midis - 69) / 12)
+
+    def classify(self, frequencies: np.ndarray) -> np.ndarray:
+        """Return the nearest MIDI note of each frequency.
+
+        Args:
+            frequencies: Frequencies in Hz, zero or negative where unvoiced.
+
+        Returns:
+            MIDI note numbers, -1 where unvoiced or outside the grid.
+        """
+        frequencies = np.asarray(frequencies, dtype=np.float64)
+        index = np.searchsorted(self.edges, frequencies, side="right") - 1
+        inside = (index >= 0) & (index < len(self.edges) - 1)
+        return np.where(inside, self.first_midi + index, -1)
+
+    def base_note_names(self, frequencies: np.ndarray) -> list[str | None]:
+        """Return the base note name of each frequency.
+
+        Args:
+            frequencies: Frequencies in Hz, zero or negative where unvoiced.
+
+        Returns:
+            Base note names, None where unvoiced or outside the grid.
+        """
+        midi = self.classify(frequencies)
+        return np.take(_BASE_NAME_TABLE, np.where(midi >= 0, midi % 12, -1)).tolist()
+
+
+class PatternRegistry:
+    """Named interval patterns, such as scales or chords, over all roots.
+
+    Each registered pattern is validated and compiled once into its pitch
+    classes, note names and pitch class mask for all 12 roots, held in
+    immutable tuples, so that looking up a pattern on a root is O(1).
+    """
+
+    def __init__(self, kind: str, patterns: dict[str, list[int]]):
+        """Initialize the registry with built-in patterns.
+
+        Args:
+            kind: What the patterns are (e.g., "scale"), used in error messages.
+            patterns: Intervals in semitones from the root, by pattern name.
+        """
+        self.kind = kind
+        self._patterns: dict[str, tuple[int, ...]] = {}
+        self._pitch_classes: dict[str, tuple[tuple[int, ...], ...]] = {}
+        self._note_names: dict[str, tuple[tuple[str, ...], ...]] = {}
+        self._masks: dict[str, tuple[int, ...]] = {}
+        for name, intervals in patterns.items():
+            self.register(name, intervals)
+
+    def register(self, name: str, intervals: list[int]):
+        """Validate and compile a pattern.
+
+        Intervals may exceed an octave (e.g., 14 for a 9th); they are reduced
+        to pitch classes. Registering the same pattern again has no effect.
+
+        Args:
+            name: Name of the pattern.
+            intervals: Intervals in semitones from the root, in pattern order.
+
+        Raises:
+            ValueError:
+                If the pattern is invalid, or the name is already registered
+                with different intervals.
+        """
+        if not isinstance(name, str) or not name:
+            raise ValueError(f"Invalid {self.kind} name: {name!r}")
+        if not intervals or not all(
+            isinstance(interval, int) and not isinstance(interval, bool)
+            for interval in intervals
+        ):
+            raise ValueError(
+                f"Intervals of {self.kind} {name!r} must be a non-empty list of "
+                f"integers: {intervals!r}"
+            )
+        if min(intervals) < 0:
+            raise ValueError(f"Intervals of {self.kind} {name!r} must not be negative")
+        pattern = tuple(interval % 12 for interval in intervals)
+        if len(set(pattern)) != len(pattern):
+            raise ValueError(
+                f"Intervals of {self.kind} {name!r} repeat a pitch class: {intervals!r}"
+            )
+        if name in self._patterns:
+            if self._patterns[name] != pattern:
+                raise ValueError(f"The {self.kind} {name!r} is already registered")
+            return
+
+        pitch_classes = tuple(
+            tuple((root + interval) % 12 for interval in pattern) for root in range(12)
+        )
+        self._patterns[name] = pattern
+        self._pitch_classes[name] = pitch_classes
+        self._note_names[name] = tuple(
+            tuple(NOTE_NAMES[pc] for pc in root_pcs) for root_pcs in pitch_classes
+        )
+        self._masks[name] = tuple(
+            pitch_class_mask(root_pcs) for root_pcs in pitch_classes
+        )
+
+    def __contains__(self, name: object) -> bool:
+        """Return whether a pattern is registered under the name."""
+        return name in self._patterns
+
+    def names(self) -> list[str]:
+        """Return the names of the registered patterns."""
+        return list(self._patterns)
+
+    def intervals(self, name: str) -> tuple[int, ...]:
+        """Return the intervals of a pattern reduced to one octave."""
+        self._check(name)
+        return self._patterns[name]
+
+    def pitch_classes(self, name: str, root: int) -> tuple[int, ...]:
+        """Return the pitch classes of a pattern on a root pitch class."""
+        self._check(name)
+        return self._pitch_classes[name][root]
+
+    def note_names(self, name: str, root: int) -> tuple[str, ...]:
+        """Return the note names of a pattern on a root pitch class."""
+        self._check(name)
+        return self._note_names[name][root]
+
+    def mask(self, name: str, root: int) -> int:
+        """Return the pitch class mask of a pattern on a root pitch class."""
+        self._check(name)
+        return self._masks[name][root]
+
+    def _check(self, name: str):
+        """Raise ValueError if no pattern is registered under the name."""
+        if name not in self._patterns:
+            raise ValueError(f"Invalid {self.kind} type: {name}")
+
+
 class Scale:
     """Musical scale representation and operations.
 
     This class handles scale-related operations including scale generation
-    and scale note calculations.
+    and scale note calculations. Scales beyond the built-in ones can be
+    registered, e.g. from the configuration.
     """
 
     SCALES = {
@@ -114,6 +418,20 @@ class Scale:
         "harmonic_minor": [0, 2, 3, 5, 7, 8, 11],
         "diminished": [0, 2, 3, 5, 6, 8, 9, 11],
     }
+    registry = PatternRegistry("scale", SCALES)
+
+    @classmethod
+    def register(cls, scale_type: str, intervals: list[int]):
+        """Register a scale.
+
+        Args:
+            scale_type: Name of the scale.
+            intervals: Intervals in semitones from the root, in scale order.
+
+        Raises:
+            ValueError: If the scale is invalid or conflicts with another one.
+        """
+        cls.registry.register(scale_type, intervals)
 
     @classmethod
     def get_scale_notes(cls, root_note: str, scale_type: str) -> list[str]:
@@ -129,19 +447,50 @@ class Scale:
         Raises:
             ValueError: If root_note is invalid or scale_type is not recognized.
         """
-        if scale_type not in cls.SCALES:
-            raise ValueError(f"Invalid scale type: {scale_type}")
+        return list(
+            cls.registry.note_names(scale_type, Notes.get_note_index(root_note))
+        )
+
+    @classmethod
+    def get_scale_pitch_classes(
+        cls, root_note: str, scale_type: str
+    ) -> tuple[int, ...]:
+        """Return the pitch classes of a scale in scale order from the root.
+
+        Args:
+            root_note: The root note of the scale.
+            scale_type: The type of scale (e.g., "major", "natural_minor").
+
+        Returns:
+            Indices of the scale notes in the chromatic scale from C.
+
+        Raises:
+            ValueError: If root_note is invalid or scale_type is not recognized.
+        """
+        return cls.registry.pitch_classes(
+            scale_type, Notes.get_note_index(root_note)
+        )
+
+    @classmethod
+    def get_scale_mask(cls, root_note: str, scale_type: str) -> int:
+        """Return the 12-bit pitch class mask of a scale.
 
-        scale_pattern = cls.SCALES[scale_type]
-        chromatic = Notes.get_chromatic_scale(root_note)
-        return [chromatic[interval % 12] for interval in scale_pattern]
+        Args:
+            root_note: The root note of the scale.
+            scale_type: The type of scale (e.g., "major", "natural_minor").
+
+        Returns:
+            The mask of the scale notes.
+        """
+        return cls.registry.mask(scale_type, Notes.get_note_index(root_note))
 
 
 class ChordTone:
     """Musical chord tone representation and operations.
 
     This class handles chord tone-related operations
-    including chord tone generation and chord tone calculation.
+    including chord tone generation and chord tone calculation. Chords beyond
+    the built-in ones can be registered, e.g. from the configuration.
     """
 
     CHORD_TONES = {
@@ -152,6 +501,20 @@ class ChordTone:
         "dom7": [0, 4, 7, 10],
         "dim7": [0, 3, 6, 9],
     }
+    registry = PatternRegistry("chord", CHORD_TONES)
+
+    @classmethod
+    def register(cls, chord_type: str, intervals: list[int]):
+        """Register a chord.
+
+        Args:
+            chord_type: Name of the chord.
+            intervals: Intervals in semitones from the root.
+
+        Raises:
+            ValueError: If the chord is invalid or conflicts with another one.
+        """
+        cls.registry.register(chord_type, intervals)
 
     @classmethod
     def get_chord_tones(cls, root_note: str, chord_type: str) -> list[str]:
@@ -164,12 +527,39 @@ class ChordTone:
         Returns:
             A list of note names in the chord.
         """
-        if chord_type not in cls.CHORD_TONES:
-            raise ValueError(f"Invalid chord type: {chord_type}")
+        return list(
+            cls.registry.note_names(chord_type, Notes.get_note_index(root_note))
+        )
+
+    @classmethod
+    def get_chord_pitch_classes(
+        cls, root_note: str, chord_type: str
+    ) -> tuple[int, ...]:
+        """Return the pitch classes of a chord from the root.
+
+        Args:
+            root_note: The root note of the chord.
+            chord_type: The type of chord (e.g., "maj", "maj7").
+
+        Returns:
+            Indices of the chord tones in the chromatic scale from C.
+        """
+        return cls.registry.pitch_classes(
+            chord_type, Notes.get_note_index(root_note)
+        )
 
-        chord_pattern = cls.CHORD_TONES[chord_type]
-        chromatic = Notes.get_chromatic_scale(root_note)
-        return [chromatic[interval] for interval in chord_pattern]
+    @classmethod
+    def get_chord_mask(cls, root_note: str, chord_type: str) -> int:
+        """Return the 12-bit pitch class mask of a chord.
+
+        Args:
+            root_note: The root note of the chord.
+            chord_type: The type of chord (e.g., "maj", "maj7").
+
+        Returns:
+            The mask of the chord tones.
+        """
+        return cls.registry.mask(chord_type, Notes.get_note_index(root_note))
 
 
 class Intervals:
@@ -5,10 +5,21 @@ from typing import Callable
 
 import numpy as np
 
+from improvisation_lab.clock import SampleClock
+from improvisation_lab.instrumentation import timed
+
 
 class AudioProcessor(ABC):
     """Abstract base class for audio input handling."""
 
+    # Counters exposed as runtime metrics
+    counter_names = (
+        "received_chunks",
+        "dropped_chunks",
+        "processed_windows",
+        "skipped_windows",
+    )
+
     def __init__(
         self,
         sample_rate: int,
@@ -27,6 +38,18 @@ class AudioProcessor(ABC):
         self._callback = callback
         self._buffer = np.array([], dtype=np.float32)
         self._buffer_size = int(sample_rate * buffer_duration)
+        # Time of the end of the last consumed window, in audio samples
+        self.clock = SampleClock(sample_rate)
+
+        self.received_chunks = 0
+        self.dropped_chunks = 0
+        self.processed_windows = 0
+        self.skipped_windows = 0
+
+    @property
+    def buffered_seconds(self) -> float:
+        """Duration of the audio waiting in the buffer, in seconds."""
+        return len(self._buffer) / self.sample_rate
 
     def _append_to_buffer(self, audio_data: np.ndarray) -> None:
         """Append new audio data to the buffer."""
@@ -34,12 +57,26 @@ class AudioProcessor(ABC):
         if audio_data.ndim > 1:
             audio_data = np.mean(audio_data, axis=1)
         self._buffer = np.concatenate([self._buffer, audio_data])
+        self.received_chunks += 1
 
+    @timed("audio.process_buffer")
     def _process_buffer(self) -> None:
-        """Process buffer data if it has reached the desired size."""
+        """Process buffer data if it has reached the desired size.
+
+        Only the most recent complete window is processed; older complete
+        windows are stale by then and are skipped so that processing never
+        falls further behind the input. The clock advances over skipped
+        windows too, so it reads the end of the window being processed.
+        """
+        num_windows = len(self._buffer) // self._buffer_size
+        if num_windows > 1:
+            self.skipped_windows += num_windows - 1
+            self._buffer = self._buffer[(num_windows - 1) * self._buffer_size :]
         if len(self._buffer) >= self._buffer_size:
+            self.clock.advance(num_windows * self._buffer_size)
             if self._callback is not None:
                 self._callback(self._buffer[: self._buffer_size])
+            self.processed_windows += 1
             self._buffer = self._buffer[self._buffer_size :]
 
     @abstractmethod
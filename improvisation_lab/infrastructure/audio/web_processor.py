@@ -7,6 +7,7 @@ from scipy import signal
 
 from improvisation_lab.infrastructure.audio.audio_processor import \
     AudioProcessor
+from improvisation_lab.instrumentation import timed
 
 
 class WebAudioProcessor(AudioProcessor):
@@ -27,6 +28,7 @@ class WebAudioProcessor(AudioProcessor):
         """
         super().__init__(sample_rate, callback, buffer_duration)
 
+    @timed("audio.resample")
     def _resample_audio(
         self, audio_data: np.ndarray, original_sr: int, target_sr: int
     ) -> np.ndarray:
@@ -77,6 +79,7 @@ class WebAudioProcessor(AudioProcessor):
         audio_data[np.abs(audio_data) < threshold] = 0
         return audio_data
 
+    @timed("audio.web_process_audio")
     def process_audio(self, audio_input: tuple[int, np.ndarray]) -> None:
         """Process incoming audio data from Gradio.
 
@@ -84,8 +87,22 @@ class WebAudioProcessor(AudioProcessor):
             audio_input: Tuple of (sample_rate, audio_data)
                         where audio_data is a (samples, channels) array
         """
+        if self.buffer_audio(audio_input):
+            self._process_buffer()
+
+    def buffer_audio(self, audio_input: tuple[int, np.ndarray]) -> bool:
+        """Add incoming audio data from Gradio to the buffer without processing it.
+
+        Args:
+            audio_input: Tuple of (sample_rate, audio_data)
+                        where audio_data is a (samples, channels) array
+
+        Returns:
+            Whether the audio was buffered (False when not recording).
+        """
         if not self.is_recording:
-            return
+            self.dropped_chunks += 1
+            return False
 
         input_sample_rate, audio_data = audio_input
         if input_sample_rate != self.sample_rate:
@@ -96,7 +113,7 @@ class WebAudioProcessor(AudioProcessor):
         audio_data = self._normalize_audio(audio_data)
 
         self._append_to_buffer(audio_data)
-        self._process_buffer()
+        return True
 
     def start_recording(self):
         """Start accepting audio input from Gradio."""
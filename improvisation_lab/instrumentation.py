@@ -0,0 +1,212 @@
+"""Per-stage latency instrumentation.
+
+Stages of the audio pipeline (resampling, buffering, inference, feedback
+rendering) are wrapped with the ``timed`` decorator. When instrumentation is
+disabled, which is the default, the wrapper only checks a flag before calling
+the wrapped function. When enabled, each call is timed and recorded into a
+fixed-bucket histogram per stage.
+
+Spans are inclusive: a stage that calls another instrumented stage
+includes the time spent in the nested stage.
+"""
+
+import bisect
+import functools
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+# Log-spaced bucket upper bounds from 10us to ~10s (4 buckets per octave)
+BUCKET_BOUNDS = tuple(1e-5 * 2 ** (i / 4) for i in range(81))
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations in seconds.
+
+    Recording is O(log buckets) and memory is constant regardless of the
+    number of recorded durations. Percentiles are approximated by the upper
+    bound of the bucket containing the requested rank.
+    """
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all recorded durations."""
+        with self._lock:
+            self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+            self.count = 0
+            self.total = 0.0
+            self.min = float("inf")
+            self.max = 0.0
+
+    def record(self, duration: float):
+        """Record a duration.
+
+        Args:
+            duration: Duration in seconds.
+        """
+        bucket = bisect.bisect_left(BUCKET_BOUNDS, duration)
+        with self._lock:
+            self.counts[bucket] += 1
+            self.count += 1
+            self.total += duration
+            if duration < self.min:
+                self.min = duration
+            if duration > self.max:
+                self.max = duration
+
+    def percentile(self, q: float) -> float:
+        """Return the approximate q-th percentile in seconds.
+
+        Args:
+            q: Percentile between 0 and 100.
+
+        Returns:
+            Upper bound of the bucket containing the percentile,
+            clamped to the observed maximum. 0.0 if nothing was recorded.
+        """
+        with self._lock:
+            counts = list(self.counts)
+            count = self.count
+            maximum = self.max
+        return self._percentile(q, counts, count, maximum)
+
+    @staticmethod
+    def _percentile(q: float, counts: List[int], count: int, maximum: float) -> float:
+        """Return the approximate q-th percentile of a copy of bucket counts."""
+        if count == 0:
+            return 0.0
+        rank = q / 100 * count
+        cumulative = 0
+        for bucket, bucket_count in enumerate(counts):
+            cumulative += bucket_count
+            if cumulative >= rank and bucket_count > 0:
+                if bucket == len(BUCKET_BOUNDS):
+                    return maximum
+                return min(BUCKET_BOUNDS[bucket], maximum)
+        return maximum
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return summary statistics of the recorded durations.
+
+        The statistics are computed from one copy of the histogram taken under
+        the lock, so they are consistent with each other.
+
+        Returns:
+            Dictionary with count, total, mean, min, max, p50, p95 and p99,
+            all durations in seconds.
+        """
+        with self._lock:
+            counts = list(self.counts)
+            count = self.count
+            total = self.total
+            minimum = self.min if count else 0.0
+            maximum = self.max
+        return {
+            "count": count,
+            "total": total,
+            "mean": total / count if count else 0.0,
+            "min": minimum,
+            "max": maximum,
+            "p50": self._percentile(50, counts, count, maximum),
+            "p95": self._percentile(95, counts, count, maximum),
+            "p99": self._percentile(99, counts, count, maximum),
+        }
+
+
+class Instrumentation:
+    """Collection of per-stage latency histograms."""
+
+    def __init__(self, enabled: bool = False):
+        """Initialize the instrumentation.
+
+        Args:
+            enabled: Whether to record durations (default: False).
+        """
+        self.enabled = enabled
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def enable(self):
+        """Start recording durations."""
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording durations. Already recorded durations are kept."""
+        self.enabled = False
+
+    def reset(self):
+        """Discard all recorded durations."""
+        with self._lock:
+            self._histograms = {}
+
+    def record(self, stage: str, duration: float):
+        """Record the duration of a stage.
+
+        Args:
+            stage: Name of the stage.
+            duration: Duration in seconds.
+        """
+        histogram = self._histograms.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(stage, LatencyHistogram())
+        histogram.record(duration)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Return summary statistics for every recorded stage.
+
+        Returns:
+            Dictionary mapping stage names to their histogram summaries.
+        """
+        with self._lock:
+            histograms = dict(self._histograms)
+        return {
+            stage: histogram.snapshot()
+            for stage, histogram in sorted(histograms.items())
+        }
+
+    def dump_json(self, path: str | Path):
+        """Write the snapshot to a JSON file.
+
+        Args:
+            path: Path of the JSON file to write.
+        """
+        with open(path, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+
+instrumentation = Instrumentation()
+
+
+def timed(stage: str) -> Callable[[F], F]:
+    """Record the duration of each call to the decorated function.
+
+    Args:
+        stage: Name of the stage the function belongs to.
+
+    Returns:
+        Decorator recording into the module-level instrumentation.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not instrumentation.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                instrumentation.record(stage, time.perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
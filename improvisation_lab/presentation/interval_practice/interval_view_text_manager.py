@@ -17,24 +17,27 @@ class IntervalViewTextManager(ViewTextManager):
         """Initialize the text manager."""
         super().__init__()
 
-    def update_phrase_text(
+    def _build_phrase_text(
         self, current_phrase_idx: int, phrases: Optional[List[List[Notes]]]
-    ):
-        """Update the phrase text.
+    ) -> str:
+        """Build the phrase text.
 
         Args:
             current_phrase_idx: The index of the current phrase.
             phrases: The list of phrases.
+
+        Returns:
+            The phrase text.
         """
         if not phrases:
-            self.phrase_text = "No phrase data"
-            return self.phrase_text
+            return "No phrase data"
 
         current_phrase = phrases[current_phrase_idx]
-        self.phrase_text = (
+        phrase_text = (
             f"Problem {current_phrase_idx + 1}: \n" f"{' -> '.join(current_phrase)}"
         )
 
         if current_phrase_idx < len(phrases) - 1:
             next_phrase = phrases[current_phrase_idx + 1]
-            self.phrase_text += f"\nNext Base Note: {next_phrase[0].value}"
+            phrase_text += f"\nNext Base Note: {next_phrase[0].value}"
+        return phrase_text
@@ -4,10 +4,9 @@ This module provides a web interface using Gradio for visualizing
 and interacting with interval practice sessions.
 """
 
-from typing import Callable, List, Tuple
+from typing import Awaitable, Callable, List, Optional, Tuple
 
 import gradio as gr
-import numpy as np
 
 from improvisation_lab.config import Config
 from improvisation_lab.domain.music_theory import Intervals
@@ -17,24 +16,47 @@ from improvisation_lab.presentation.web_view import WebPracticeView
 class WebIntervalPracticeView(WebPracticeView):
     """Handles the user interface for the melody practice application."""
 
+    # Interval (seconds) at which Gradio streams microphone chunks to the app
+    stream_every: float = 0.3
+
     def __init__(
         self,
-        on_generate_melody: Callable[
-            [str, str, int, bool, float], Tuple[str, str, str, List]
-        ],
-        on_end_practice: Callable[[], Tuple[str, str, str]],
-        on_audio_input: Callable[[Tuple[int, np.ndarray]], Tuple[str, str, str, List]],
+        on_generate_melody: Callable[..., Awaitable[Tuple[str, str, str, List]]],
+        on_end_practice: Callable[..., Awaitable[Tuple[str, str, str]]],
+        on_audio_input: Callable[..., Awaitable[Tuple[str, str, str, List]]],
         config: Config,
+        on_session_end: Optional[Callable[..., None]] = None,
+        stream_concurrency_limit: Optional[int] = 1,
+        max_queue_size: Optional[int] = None,
+        stream_every: Optional[float] = None,
+        on_results_page: Optional[Callable[..., Awaitable[List]]] = None,
     ):
         """Initialize the UI with callback functions.
 
         Args:
-            on_generate_melody: Function to call when start button is clicked
-            on_end_practice: Function to call when stop button is clicked
-            on_audio_input: Function to process audio input
+            on_generate_melody: Coroutine function to call when start button is clicked
+            on_end_practice: Coroutine function to call when stop button is clicked
+            on_audio_input: Coroutine function to process audio input
+            config: Config instance
+            on_session_end: Function to call when the user closes the page
+            stream_concurrency_limit:
+                Audio stream events processed at once (None for no limit)
+            max_queue_size: Events waiting in the queue (None for no limit)
+            stream_every: Interval between audio chunks (None for the default)
+            on_results_page:
+                Coroutine function to call when the results page is changed
         """
-        super().__init__(on_generate_melody, on_end_practice, on_audio_input)
+        super().__init__(
+            on_generate_melody,
+            on_end_practice,
+            on_audio_input,
+            on_session_end,
+            stream_concurrency_limit,
+            max_queue_size,
+            stream_every,
+        )
         self.config = config
+        self.on_results_page = on_results_page
         self._initialize_interval_settings()
 
     def _initialize_interval_settings(self):
@@ -118,9 +140,18 @@ class WebIntervalPracticeView(WebPracticeView):
                 value=[],
                 label="Result History",
             )
+            self.results_page_box = gr.Number(
+                label="Result History Page (1 = latest)",
+                value=1,
+                minimum=1,
+                precision=0,
+                visible=self.on_results_page is not None,
+            )
 
             self._add_audio_callbacks()
             self._add_buttons_callbacks()
+            self._add_results_page_callback()
+            self._add_session_callbacks(app)
 
             # Add Tone.js script
             app.load(
@@ -171,6 +202,8 @@ class WebIntervalPracticeView(WebPracticeView):
     def _add_buttons_callbacks(self):
         """Create the control buttons section."""
         # Connect button callbacks
+        # (no concurrency limit: actions are cheap and must not queue up behind
+        # other users' clicks)
         self.generate_melody_button.click(
             fn=self.on_generate_melody,
             inputs=[
@@ -186,11 +219,13 @@ class WebIntervalPracticeView(WebPracticeView):
                 self.pitch_result_box,
                 self.results_table,
             ],
+            concurrency_limit=None,
         )
 
         self.end_practice_button.click(
             fn=self.on_end_practice,
             outputs=[self.base_note_box, self.phrase_info_box, self.pitch_result_box],
+            concurrency_limit=None,
         )
 
     def _add_audio_callbacks(self):
@@ -207,5 +242,18 @@ class WebIntervalPracticeView(WebPracticeView):
                 self.results_table,
             ],
             show_progress=False,
-            stream_every=0.3,
+            stream_every=self.stream_every,
+            concurrency_limit=self.stream_concurrency_limit,
+        )
+
+    def _add_results_page_callback(self):
+        """Show the selected page of the results table."""
+        if self.on_results_page is None:
+            return
+        self.results_page_box.change(
+            fn=self.on_results_page,
+            inputs=self.results_page_box,
+            outputs=self.results_table,
+            show_progress=False,
+            concurrency_limit=None,
         )
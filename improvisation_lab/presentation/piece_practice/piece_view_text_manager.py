@@ -6,7 +6,7 @@ in both the web and console versions of the melody practice.
 
 from typing import List, Optional
 
-from improvisation_lab.domain.composition import PhraseData
+from improvisation_lab.domain.composition import PhraseData, PhraseStream
 from improvisation_lab.presentation.view_text_manager import ViewTextManager
 
 
@@ -17,21 +17,25 @@ class PieceViewTextManager(ViewTextManager):
         """Initialize the text manager."""
         super().__init__()
 
-    def update_phrase_text(
-        self, current_phrase_idx: int, phrases: Optional[List[PhraseData]]
-    ):
-        """Update the phrase text.
+    def _build_phrase_text(
+        self,
+        current_phrase_idx: int,
+        phrases: Optional[List[PhraseData] | PhraseStream],
+    ) -> str:
+        """Build the phrase text.
 
         Args:
             current_phrase_idx: The index of the current phrase.
-            phrases: The list of phrases.
+            phrases: The list or stream of phrases.
+
+        Returns:
+            The phrase text.
         """
         if not phrases:
-            self.phrase_text = "No phrase data"
-            return self.phrase_text
+            return "No phrase data"
 
         current_phrase = phrases[current_phrase_idx]
-        self.phrase_text = (
+        phrase_text = (
             f"Phrase {current_phrase_idx + 1}: "
             f"{current_phrase.chord_name}\n"
             f"{' -> '.join(current_phrase.notes)}"
@@ -39,6 +43,7 @@ class PieceViewTextManager(ViewTextManager):
 
         if current_phrase_idx < len(phrases) - 1:
             next_phrase = phrases[current_phrase_idx + 1]
-            self.phrase_text += (
+            phrase_text += (
                 f"\nNext: {next_phrase.chord_name} ({next_phrase.notes[0]})"
             )
+        return phrase_text
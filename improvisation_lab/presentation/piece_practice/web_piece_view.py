@@ -4,10 +4,9 @@ This module provides a web interface using Gradio for visualizing
 and interacting with piece practice sessions.
 """
 
-from typing import Callable, Tuple
+from typing import Awaitable, Callable, Optional, Tuple
 
 import gradio as gr
-import numpy as np
 
 from improvisation_lab.presentation.web_view import WebPracticeView
 
@@ -15,22 +14,42 @@ from improvisation_lab.presentation.web_view import WebPracticeView
 class WebPiecePracticeView(WebPracticeView):
     """Handles the user interface for the piece practice application."""
 
+    # Interval (seconds) at which Gradio streams microphone chunks to the app
+    stream_every: float = 0.1
+
     def __init__(
         self,
-        on_generate_melody: Callable[[], Tuple[str, str]],
-        on_end_practice: Callable[[], Tuple[str, str]],
-        on_audio_input: Callable[[Tuple[int, np.ndarray]], Tuple[str, str]],
+        on_generate_melody: Callable[..., Awaitable[Tuple[str, str]]],
+        on_end_practice: Callable[..., Awaitable[Tuple[str, str]]],
+        on_audio_input: Callable[..., Awaitable[Tuple[str, str]]],
         song_name: str,
+        on_session_end: Optional[Callable[..., None]] = None,
+        stream_concurrency_limit: Optional[int] = 1,
+        max_queue_size: Optional[int] = None,
+        stream_every: Optional[float] = None,
     ):
         """Initialize the UI with callback functions.
 
         Args:
-            on_generate_melody: Function to call when start button is clicked
-            on_end_practice: Function to call when stop button is clicked
-            on_audio_input: Function to process audio input
+            on_generate_melody: Coroutine function to call when start button is clicked
+            on_end_practice: Coroutine function to call when stop button is clicked
+            on_audio_input: Coroutine function to process audio input
             song_name: Name of the song to be practiced
+            on_session_end: Function to call when the user closes the page
+            stream_concurrency_limit:
+                Audio stream events processed at once (None for no limit)
+            max_queue_size: Events waiting in the queue (None for no limit)
+            stream_every: Interval between audio chunks (None for the default)
         """
-        super().__init__(on_generate_melody, on_end_practice, on_audio_input)
+        super().__init__(
+            on_generate_melody,
+            on_end_practice,
+            on_audio_input,
+            on_session_end,
+            stream_concurrency_limit,
+            max_queue_size,
+            stream_every,
+        )
         self.song_name = song_name
 
     def _build_interface(self) -> gr.Blocks:
@@ -49,6 +68,7 @@ class WebPiecePracticeView(WebPracticeView):
             self.end_practice_button = gr.Button("End Practice")
 
             self._add_buttons_callbacks()
+            self._add_session_callbacks(app)
 
         return app
 
@@ -59,14 +79,18 @@ class WebPiecePracticeView(WebPracticeView):
     def _add_buttons_callbacks(self):
         """Create the control buttons section."""
         # Connect button callbacks
+        # (no concurrency limit: actions are cheap and must not queue up behind
+        # other users' clicks)
         self.generate_melody_button.click(
             fn=self.on_generate_melody,
             outputs=[self.phrase_info_box, self.pitch_result_box],
+            concurrency_limit=None,
         )
 
         self.end_practice_button.click(
             fn=self.on_end_practice,
             outputs=[self.phrase_info_box, self.pitch_result_box],
+            concurrency_limit=None,
         )
 
     def _add_audio_input(self):
@@ -86,5 +110,6 @@ class WebPiecePracticeView(WebPracticeView):
             inputs=audio_input,
             outputs=[self.phrase_info_box, self.pitch_result_box],
             show_progress=False,
-            stream_every=0.1,
+            stream_every=self.stream_every,
+            concurrency_limit=self.stream_concurrency_limit,
         )
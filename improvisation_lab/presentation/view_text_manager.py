@@ -5,25 +5,66 @@ in both the web and console versions of the melody practice.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional
+from typing import Any, Optional, Tuple
 
+from improvisation_lab.instrumentation import timed
 from improvisation_lab.service.base_practice_service import PitchResult
 
+# Cents offsets are shown rounded to this step, so that the result text does
+# not change with every small drift of the sung pitch
+CENTS_DISPLAY_STEP = 10
+
 
 class ViewTextManager(ABC):
-    """Displayed text management for melody practice."""
+    """Displayed text management for melody practice.
+
+    Each text has a version that changes only when the text changes, so that
+    views can skip re-sending unchanged text.
+    """
 
     def __init__(self):
         """Initialize the text manager."""
+        self._phrase_text = ""
+        self._result_text = ""
+        self.phrase_version = 0
+        self.result_version = 0
+        # Phrase index and phrases the phrase text was last built from
+        self._phrase_key: Optional[Tuple[int, Any]] = None
         self.initialize_text()
 
+    @property
+    def phrase_text(self) -> str:
+        """Return the phrase text."""
+        return self._phrase_text
+
+    @phrase_text.setter
+    def phrase_text(self, text: str):
+        """Set the phrase text, updating its version if it changed."""
+        if text != self._phrase_text:
+            self._phrase_text = text
+            self.phrase_version += 1
+
+    @property
+    def result_text(self) -> str:
+        """Return the result text."""
+        return self._result_text
+
+    @result_text.setter
+    def result_text(self, text: str):
+        """Set the result text, updating its version if it changed."""
+        if text != self._result_text:
+            self._result_text = text
+            self.result_version += 1
+
     def initialize_text(self):
         """Initialize the text."""
+        self._phrase_key = None
         self.phrase_text = "No phrase data"
         self.result_text = "Ready to start... (waiting for audio)"
 
     def terminate_text(self):
         """Terminate the text."""
+        self._phrase_key = None
         self.phrase_text = "Session Stopped"
         self.result_text = "Practice ended"
 
@@ -31,6 +72,7 @@ class ViewTextManager(ABC):
         """Set the text to waiting for audio."""
         self.result_text = "Waiting for audio..."
 
+    @timed("presentation.update_pitch_result")
     def update_pitch_result(
         self, pitch_result: PitchResult, is_auto_advance: bool = False
     ):
@@ -42,20 +84,53 @@ class ViewTextManager(ABC):
                 Whether to automatically advance to the next note.
                 Default is False.
         """
-        result_text = (
-            f"Target: {pitch_result.target_note} | "
-            f"Your note: {pitch_result.current_base_note or '---'}"
-        )
+        your_note = pitch_result.current_base_note or "---"
+        if pitch_result.current_base_note is not None:
+            if pitch_result.octave is not None:
+                your_note += str(pitch_result.octave)
+            if pitch_result.cents is not None:
+                cents = round(pitch_result.cents / CENTS_DISPLAY_STEP)
+                your_note += f" ({cents * CENTS_DISPLAY_STEP:+d} cents)"
+        result_text = f"Target: {pitch_result.target_note} | Your note: {your_note}"
         if pitch_result.current_base_note is not None and not is_auto_advance:
             result_text += f" | Remaining: {pitch_result.remaining_time:.1f}s"
         self.result_text = result_text
 
-    @abstractmethod
-    def update_phrase_text(self, current_phrase_idx: int, phrases: Optional[List[Any]]):
+    def update_phrase_text(
+        self, current_phrase_idx: int, phrases: Optional[Any]
+    ) -> str:
         """Update the phrase text.
 
+        The text is only rebuilt when the phrase index or the phrases changed
+        since the last update.
+
         Args:
             current_phrase_idx: The index of the current phrase.
-            phrases: The list of phrases.
+            phrases: The phrases, indexed by phrase (e.g. a list or a PhraseStream).
+
+        Returns:
+            The phrase text.
+        """
+        if (
+            self._phrase_key is None
+            or self._phrase_key[0] != current_phrase_idx
+            or self._phrase_key[1] is not phrases
+        ):
+            self._phrase_key = (current_phrase_idx, phrases)
+            self.phrase_text = self._build_phrase_text(current_phrase_idx, phrases)
+        return self.phrase_text
+
+    @abstractmethod
+    def _build_phrase_text(
+        self, current_phrase_idx: int, phrases: Optional[Any]
+    ) -> str:
+        """Build the phrase text.
+
+        Args:
+            current_phrase_idx: The index of the current phrase.
+            phrases: The phrases, indexed by phrase (e.g. a list or a PhraseStream).
+
+        Returns:
+            The phrase text.
         """
         pass
@@ -5,31 +5,47 @@ and interacting with piece practice sessions.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Tuple
+from typing import Any, Awaitable, Callable, Optional, Tuple
 
 import gradio as gr
-import numpy as np
 
 
 class WebPracticeView(ABC):
     """Handles the user interface for all practice applications."""
 
+    # Interval (seconds) at which Gradio streams microphone chunks to the app
+    stream_every: float = 0.1
+
     def __init__(
         self,
-        on_generate_melody: Callable[..., Tuple[Any, ...]],
-        on_end_practice: Callable[[], Tuple[Any, ...]],
-        on_audio_input: Callable[[Tuple[int, np.ndarray]], Tuple[Any, ...]],
+        on_generate_melody: Callable[..., Awaitable[Tuple[Any, ...]]],
+        on_end_practice: Callable[..., Awaitable[Tuple[Any, ...]]],
+        on_audio_input: Callable[..., Awaitable[Tuple[Any, ...]]],
+        on_session_end: Optional[Callable[..., None]] = None,
+        stream_concurrency_limit: Optional[int] = 1,
+        max_queue_size: Optional[int] = None,
+        stream_every: Optional[float] = None,
     ):
         """Initialize the UI with callback functions.
 
         Args:
-            on_generate_melody: Function to call when start button is clicked
-            on_end_practice: Function to call when stop button is clicked
-            on_audio_input: Function to process audio input
+            on_generate_melody: Coroutine function to call when start button is clicked
+            on_end_practice: Coroutine function to call when stop button is clicked
+            on_audio_input: Coroutine function to process audio input
+            on_session_end: Function to call when the user closes the page
+            stream_concurrency_limit:
+                Audio stream events processed at once (None for no limit)
+            max_queue_size: Events waiting in the queue (None for no limit)
+            stream_every: Interval between audio chunks (None for the default)
         """
         self.on_generate_melody = on_generate_melody
         self.on_end_practice = on_end_practice
         self.on_audio_input = on_audio_input
+        self.on_session_end = on_session_end
+        self.stream_concurrency_limit = stream_concurrency_limit
+        self.max_queue_size = max_queue_size
+        if stream_every is not None:
+            self.stream_every = stream_every
 
     def launch(self, **kwargs):
         """Launch the Gradio application.
@@ -38,9 +54,18 @@ class WebPracticeView(ABC):
             **kwargs: Additional keyword arguments for the launch method.
         """
         app = self._build_interface()
-        app.queue()
+        app.queue(max_size=self.max_queue_size)
         app.launch(**kwargs)
 
+    def _add_session_callbacks(self, app: gr.Blocks):
+        """Release the user's session when the page is closed or refreshed.
+
+        Args:
+            app: The Gradio interface being built.
+        """
+        if self.on_session_end is not None:
+            app.unload(self.on_session_end)
+
     @abstractmethod
     def _build_interface(self) -> gr.Blocks:
         """Create and configure the Gradio interface.
@@ -1,15 +1,22 @@
 """Base class for practice services."""
 
-import time
+import random
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 
 import numpy as np
 
-from improvisation_lab.config import Config
-from improvisation_lab.domain.analysis import PitchDetector
+from improvisation_lab.clock import Clock, MonotonicClock
+from improvisation_lab.config import Config, MusicTheoryConfig
+from improvisation_lab.domain.analysis import (NoteDecision,
+                                               NoteDecisionEngine,
+                                               PitchDetector)
 from improvisation_lab.domain.composition import MelodyComposer
-from improvisation_lab.domain.music_theory import Notes
+from improvisation_lab.domain.music_theory import (NOTE_NAMES, ChordTone,
+                                                   Notes, Scale)
+from improvisation_lab.instrumentation import timed
 
 
 @dataclass
@@ -20,55 +27,263 @@ class PitchResult:
     current_base_note: str | None
     is_correct: bool
     remaining_time: float
+    # MIDI number and octave of the detected note, None if no voice
+    midi: int | None = None
+    octave: int | None = None
+    # Offset of the sung pitch from the detected note, in cents
+    cents: float | None = None
+
+
+@dataclass
+class PitchTrackingState:
+    """Per-session state of pitch tracking.
+
+    The service itself is shared between sessions (it holds the pitch detection
+    model), so state that must not leak between users is kept here.
+    """
+
+    correct_pitch_start_time: float | None = None
+    # Latest result for the current target note
+    last_result: PitchResult | None = None
+    # Number of detections of each note (None: no voice) for the current target
+    note_detections: Counter[str | None] = field(default_factory=Counter)
+    # Smoothing of the session's pitch readings, kept across target notes
+    note_decider: NoteDecisionEngine | None = None
+    # Clock timing how long the correct pitch is held
+    clock: Clock = field(default_factory=MonotonicClock)
+
+    def start_note(self):
+        """Reset the per-note state when moving on to the next target note."""
+        self.correct_pitch_start_time = None
+        self.last_result = None
+        self.note_detections.clear()
+
+    def record(self, result: PitchResult):
+        """Record a result for the current target note.
+
+        Args:
+            result: The pitch result.
+        """
+        self.last_result = result
+        self.note_detections[result.current_base_note] += 1
+
+
+def register_music_theory(music_theory: MusicTheoryConfig):
+    """Register the scales and chords of the configuration.
+
+    Args:
+        music_theory: Configuration of the scales and chords to add.
+
+    Raises:
+        ValueError: If a scale or chord is invalid or conflicts with another one.
+    """
+    for scale_type, intervals in music_theory.scales.items():
+        Scale.register(scale_type, intervals)
+    for chord_type, intervals in music_theory.chords.items():
+        ChordTone.register(chord_type, intervals)
 
 
 class BasePracticeService(ABC):
     """Base class for practice services."""
 
-    def __init__(self, config: Config):
-        """Initialize BasePracticeService with configuration."""
+    def __init__(self, config: Config, seed: int | None = None):
+        """Initialize BasePracticeService with configuration.
+
+        Args:
+            config: Configuration of the application.
+            seed:
+                Seed of the random generator melodies are generated with
+                (default: None, unseeded).
+        """
         self.config = config
-        self.melody_composer = MelodyComposer()
+        register_music_theory(config.music_theory)
+        self.rng = random.Random(seed)
+        self.melody_composer = MelodyComposer(self.rng)
         self.pitch_detector = PitchDetector(config.audio.pitch_detector)
 
-        self.correct_pitch_start_time: float | None = None
+        # State used when no per-session state is passed to process_audio
+        self.default_state = PitchTrackingState()
+        # Number of results by outcome, exposed as runtime metrics and
+        # counted from inference threads
+        self.result_counts: Counter[str] = Counter(
+            {"no_voice": 0, "incorrect": 0, "correct": 0}
+        )
+        self._result_counts_lock = threading.Lock()
+
+    def create_rng(self) -> random.Random:
+        """Create a random generator for one session.
+
+        The generator is seeded from the service's generator, so sessions
+        created in the same order get the same melodies if the service is
+        seeded.
+
+        Returns:
+            The random generator.
+        """
+        return random.Random(self.rng.getrandbits(64))
+
+    def _composer(self, rng: random.Random | None) -> MelodyComposer:
+        """Return the composer drawing with the random generator.
+
+        Args:
+            rng: The random generator, None for the service's generator.
+
+        Returns:
+            The melody composer.
+        """
+        if rng is None or rng is self.rng:
+            return self.melody_composer
+        return MelodyComposer(rng)
+
+    @property
+    def correct_pitch_start_time(self) -> float | None:
+        """Start time of the correct pitch in the default tracking state."""
+        return self.default_state.correct_pitch_start_time
+
+    @correct_pitch_start_time.setter
+    def correct_pitch_start_time(self, value: float | None):
+        self.default_state.correct_pitch_start_time = value
 
     @abstractmethod
     def generate_melody(self, *args, **kwargs):
         """Abstract method to generate a melody."""
         pass
 
-    def process_audio(self, audio_data: np.ndarray, target_note: str) -> PitchResult:
+    @timed("service.process_audio")
+    def process_audio(
+        self,
+        audio_data: np.ndarray,
+        target_note: str,
+        state: PitchTrackingState | None = None,
+    ) -> PitchResult:
         """Process audio data to detect pitch and provide feedback.
 
         Args:
             audio_data: Audio data as a numpy array.
             target_note: The target note to display.
+            state: Pitch tracking state of the session (default: service state).
         Returns:
             PitchResult containing the target note, detected note, correctness,
             and remaining time.
         """
-        frequency = self.pitch_detector.detect_pitch(audio_data)
+        if state is None:
+            state = self.default_state
+        decision = self._detect_note(audio_data, state)
+
+        if decision.note is None:  # no voice detected, reset the correct pitch start
+            result = self._create_no_voice_result(target_note, state)
+        elif self._is_correct(decision, target_note):
+            result = self._create_correct_pitch_result(target_note, decision, state)
+        else:
+            result = self._create_incorrect_pitch_result(target_note, decision, state)
+
+        state.record(result)
+        return result
+
+    def _detect_note(
+        self, audio_data: np.ndarray, state: PitchTrackingState
+    ) -> NoteDecision:
+        """Detect the sung note.
+
+        With note decision enabled, the pitch of every hop is fed to the
+        session's decision engine and its stable note is returned, so a single
+        wrong or unvoiced reading does not change the result.
+
+        Args:
+            audio_data: Audio data as a numpy array.
+            state: Pitch tracking state of the session.
+
+        Returns:
+            The detected note, whose note is None if no voice is detected.
+        """
+        decision_config = self.config.audio.note_decision
+        if not decision_config.enabled:
+            frequency = self.pitch_detector.detect_pitch(audio_data)
+            if frequency <= 0:
+                return NoteDecision(note=None, midi=None, changed=False)
+            midi = float(
+                Notes.convert_frequency_to_midi(
+                    frequency, self.config.audio.reference_frequency
+                )
+            )
+            note_midi = round(midi)
+            return NoteDecision(
+                note=NOTE_NAMES[note_midi % 12],
+                midi=midi,
+                changed=False,
+                note_midi=note_midi,
+                cents=(midi - note_midi) * 100,
+            )
+
+        if state.note_decider is None:
+            state.note_decider = NoteDecisionEngine(
+                window_size=decision_config.window_size,
+                hysteresis=decision_config.hysteresis,
+                tolerance_cents=decision_config.tolerance_cents,
+                min_voiced_ratio=decision_config.min_voiced_ratio,
+                reference_frequency=self.config.audio.reference_frequency,
+            )
+        frequencies = self.pitch_detector.detect_pitch_track(audio_data)
+        return state.note_decider.update(frequencies)
 
-        if frequency <= 0:  # if no voice detected, reset the correct pitch start time
-            return self._create_no_voice_result(target_note)
+    def _is_correct(self, decision: NoteDecision, target_note: str) -> bool:
+        """Judge the detected note against the target with the grading rule.
 
-        note_name = Notes.convert_frequency_to_base_note(frequency)
-        if note_name != target_note:
-            return self._create_incorrect_pitch_result(target_note, note_name)
+        The note is judged by pitch class, in any octave.
 
-        return self._create_correct_pitch_result(target_note, note_name)
+        Args:
+            decision: The detected note.
+            target_note: The target base note.
 
-    def _create_no_voice_result(self, target_note: str) -> PitchResult:
+        Returns:
+            Whether the detected note is correct.
+        """
+        grading = self.config.audio.grading
+        if decision.note != target_note:
+            return False
+        return decision.cents is None or abs(decision.cents) <= grading.tolerance_cents
+
+    def _count_result(self, outcome: str):
+        """Count a pitch result of an outcome.
+
+        Args:
+            outcome: The outcome ("no_voice", "incorrect" or "correct").
+        """
+        with self._result_counts_lock:
+            self.result_counts[outcome] += 1
+
+    @staticmethod
+    def _pitch_details(decision: NoteDecision) -> dict:
+        """Return the MIDI number, octave and cents offset of a detected note.
+
+        Args:
+            decision: The detected note.
+
+        Returns:
+            Keyword arguments for PitchResult.
+        """
+        if decision.note_midi is None:
+            return {"midi": None, "octave": None, "cents": None}
+        return {
+            "midi": decision.note_midi,
+            "octave": decision.note_midi // 12 - 1,
+            "cents": decision.cents,
+        }
+
+    def _create_no_voice_result(
+        self, target_note: str, state: PitchTrackingState
+    ) -> PitchResult:
         """Create result for no voice detected case.
 
         Args:
             target_note: The target note to display.
+            state: Pitch tracking state of the session.
 
         Returns:
             PitchResult for no voice detected case.
         """
-        self.correct_pitch_start_time = None
+        state.correct_pitch_start_time = None
+        self._count_result("no_voice")
         return PitchResult(
             target_note=target_note,
             current_base_note=None,
@@ -77,49 +292,55 @@ class BasePracticeService(ABC):
         )
 
     def _create_incorrect_pitch_result(
-        self, target_note: str, detected_note: str
+        self, target_note: str, decision: NoteDecision, state: PitchTrackingState
     ) -> PitchResult:
         """Create result for incorrect pitch case, reset the correct pitch start time.
 
         Args:
             target_note: The target note to display.
-            detected_note: The detected note.
+            decision: The detected note.
+            state: Pitch tracking state of the session.
 
         Returns:
             PitchResult for incorrect pitch case.
         """
-        self.correct_pitch_start_time = None
+        state.correct_pitch_start_time = None
+        self._count_result("incorrect")
         return PitchResult(
             target_note=target_note,
-            current_base_note=detected_note,
+            current_base_note=decision.note,
             is_correct=False,
             remaining_time=self.config.audio.note_duration,
+            **self._pitch_details(decision),
         )
 
     def _create_correct_pitch_result(
-        self, target_note: str, detected_note: str
+        self, target_note: str, decision: NoteDecision, state: PitchTrackingState
     ) -> PitchResult:
         """Create result for correct pitch case.
 
         Args:
             target_note: The target note to display.
-            detected_note: The detected note.
+            decision: The detected note.
+            state: Pitch tracking state of the session.
 
         Returns:
             PitchResult for correct pitch case.
         """
-        current_time = time.time()
+        self._count_result("correct")
+        current_time = state.clock.now()
         # Note is completed if the correct pitch is sustained for the duration of a note
-        if self.correct_pitch_start_time is None:
-            self.correct_pitch_start_time = current_time
+        if state.correct_pitch_start_time is None:
+            state.correct_pitch_start_time = current_time
             remaining_time = self.config.audio.note_duration
         else:
-            elapsed_time = current_time - self.correct_pitch_start_time
+            elapsed_time = current_time - state.correct_pitch_start_time
             remaining_time = max(0, self.config.audio.note_duration - elapsed_time)
 
         return PitchResult(
             target_note=target_note,
-            current_base_note=detected_note,
+            current_base_note=decision.note,
             is_correct=True,
             remaining_time=remaining_time,
+            **self._pitch_details(decision),
         )
@@ -0,0 +1,141 @@
+"""Bank of pre-generated exercises for starting practice sessions instantly.
+
+Exercises are encoded as rows of small integers (e.g. note indices) and kept
+in a pool per key. Taking an exercise pops a row; when a pool runs low it is
+refilled on a background thread, so generation happens off the request path.
+Pools can be persisted to a NumPy .npz file, so they survive a restart.
+"""
+
+import os
+import random
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Deque, Dict, Set
+
+import numpy as np
+
+# Generates one encoded exercise with the given random generator
+ExerciseGenerator = Callable[[random.Random], np.ndarray]
+
+
+class ExerciseBank:
+    """Pools of pre-generated exercises, refilled in the background."""
+
+    def __init__(
+        self,
+        pool_size: int = 8,
+        rng: random.Random | None = None,
+        cache_path: str | Path | None = None,
+    ):
+        """Initialize the bank, loading pools cached on disk.
+
+        Args:
+            pool_size: Number of exercises a pool is refilled to.
+            rng:
+                Random generator exercises are generated with (default: None,
+                a new unseeded one).
+            cache_path:
+                Path of the .npz file pools are persisted to (default: None,
+                not persisted).
+
+        Raises:
+            ValueError: If pool_size is less than 1.
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self.pool_size = pool_size
+        self.rng = random.Random() if rng is None else rng
+        self.cache_path = None if cache_path is None else Path(cache_path)
+        self._pools: Dict[str, Deque[np.ndarray]] = {}
+        self._generators: Dict[str, ExerciseGenerator] = {}
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="exercise-bank"
+        )
+        self._load()
+
+    def take(self, key: str, generate: ExerciseGenerator) -> np.ndarray:
+        """Take an exercise from the pool of a key.
+
+        If the pool is empty, an exercise is generated right away. The pool
+        is refilled in the background when it falls below half its size.
+
+        Args:
+            key: Key of the pool, identifying the kind of exercise.
+            generate: Function generating an exercise of the key.
+
+        Returns:
+            The encoded exercise.
+        """
+        with self._lock:
+            self._generators[key] = generate
+            pool = self._pools.setdefault(key, deque())
+            exercise = pool.popleft() if pool else generate(self.rng)
+            if len(pool) < self.pool_size / 2 and key not in self._pending:
+                self._pending.add(key)
+                self._executor.submit(self._refill, key)
+        return exercise
+
+    def warm(self, key: str, generate: ExerciseGenerator):
+        """Fill the pool of a key in the background before it is used.
+
+        Args:
+            key: Key of the pool, identifying the kind of exercise.
+            generate: Function generating an exercise of the key.
+        """
+        with self._lock:
+            self._generators[key] = generate
+            if key not in self._pending:
+                self._pending.add(key)
+                self._executor.submit(self._refill, key)
+
+    def pool_count(self, key: str) -> int:
+        """Return the number of exercises in the pool of a key."""
+        with self._lock:
+            return len(self._pools.get(key, ()))
+
+    def wait(self):
+        """Wait until the refills submitted so far are done."""
+        self._executor.submit(lambda: None).result()
+
+    def close(self):
+        """Stop refilling after the submitted refills."""
+        self._executor.shutdown(wait=True)
+
+    def _refill(self, key: str):
+        """Fill the pool of a key up to the pool size and persist the pools."""
+        try:
+            while True:
+                with self._lock:
+                    pool = self._pools.setdefault(key, deque())
+                    if len(pool) >= self.pool_size:
+                        break
+                    # Generated under the lock, so draws from the shared
+                    # generator do not interleave with take()
+                    pool.append(self._generators[key](self.rng))
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+        self._save()
+
+    def _load(self):
+        """Load the pools cached on disk, if any."""
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        with np.load(self.cache_path) as cached:
+            for key in cached.files:
+                self._pools[key] = deque(cached[key][: self.pool_size])
+
+    def _save(self):
+        """Persist the pools to disk, replacing the cache file atomically."""
+        if self.cache_path is None:
+            return
+        with self._lock:
+            arrays = {key: np.stack(pool) for key, pool in self._pools.items() if pool}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.cache_path.with_name(self.cache_path.name + ".tmp.npz")
+        np.savez(temp_path, **arrays)
+        os.replace(temp_path, self.cache_path)
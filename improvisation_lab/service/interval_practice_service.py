@@ -1,11 +1,20 @@
 """Service for interval practice."""
 
-from random import sample
+import random
+from functools import partial
 from typing import List
 
+import numpy as np
+
 from improvisation_lab.config import Config
-from improvisation_lab.domain.music_theory import Notes
+from improvisation_lab.domain.music_theory import NOTES_BY_INDEX, Notes
 from improvisation_lab.service.base_practice_service import BasePracticeService
+from improvisation_lab.service.exercise_bank import ExerciseBank
+
+
+def _draw_base_note_indices(rng: random.Random, num_notes: int) -> np.ndarray:
+    """Draw the indices of distinct base notes of a problem set."""
+    return np.array(rng.sample(range(len(NOTES_BY_INDEX)), num_notes), dtype=np.int8)
 
 
 class IntervalPracticeService(BasePracticeService):
@@ -13,19 +22,87 @@ class IntervalPracticeService(BasePracticeService):
 
     def __init__(self, config: Config):
         """Initialize IntervalPracticeService with configuration."""
-        super().__init__(config)
+        super().__init__(config, seed=config.interval_practice.seed)
+
+        # Base notes do not depend on the interval, so problem sets are banked
+        # per number of problems and transposed when taken. Banked sets are
+        # drawn in the order sessions start, so a seeded service draws every
+        # set with the session's generator instead, keeping sessions
+        # reproducible.
+        self.exercise_bank: ExerciseBank | None = None
+        if (
+            config.interval_practice.exercise_pool_size > 0
+            and config.interval_practice.seed is None
+        ):
+            self.exercise_bank = ExerciseBank(
+                pool_size=config.interval_practice.exercise_pool_size,
+                rng=self.create_rng(),
+                cache_path=config.interval_practice.exercise_cache_path,
+            )
+            num_problems = config.interval_practice.num_problems
+            self.exercise_bank.warm(
+                self._exercise_key(num_problems),
+                partial(_draw_base_note_indices, num_notes=num_problems),
+            )
 
     def generate_melody(
-        self, num_notes: int = 10, interval: int = 1
+        self,
+        num_notes: int = 10,
+        interval: int = 1,
+        rng: random.Random | None = None,
     ) -> List[List[Notes]]:
         """Generate a melody based on interval transitions.
 
         Args:
             num_notes: Number of base notes to generate. Default is 10.
             interval: Interval to move to and back. Default is 1 (semitone).
+            rng:
+                Random generator to draw the base notes with, e.g. the session's.
+                Default is None, the service's generator.
+
+        Returns:
+            List of Notes objects containing the generated melodic phrases.
+        """
+        composer = self._composer(rng)
+        base_notes = composer.rng.sample(list(Notes), num_notes)
+        return composer.generate_interval_melody(base_notes, interval)
+
+    def next_melody(
+        self,
+        num_notes: int = 10,
+        interval: int = 1,
+        rng: random.Random | None = None,
+    ) -> List[List[Notes]]:
+        """Return a melody for a new session, taken from the exercise bank.
+
+        The base notes are taken from a pool of pre-generated problem sets,
+        which is refilled in the background. Without an exercise bank, which
+        is the case for a seeded service, the melody is generated with
+        generate_melody.
+
+        Args:
+            num_notes: Number of base notes to generate. Default is 10.
+            interval: Interval to move to and back. Default is 1 (semitone).
+            rng:
+                Random generator to draw the base notes with if there is no
+                exercise bank, e.g. the session's. Default is None, the
+                service's generator. With an exercise bank, the service is
+                unseeded, so the problem sets are drawn with the bank's
+                unseeded generator instead.
 
         Returns:
             List of Notes objects containing the generated melodic phrases.
         """
-        base_notes = sample(list(Notes), num_notes)
+        if self.exercise_bank is None:
+            return self.generate_melody(num_notes, interval, rng)
+        indices = self.exercise_bank.take(
+            self._exercise_key(num_notes),
+            partial(_draw_base_note_indices, num_notes=num_notes),
+        )
+        base_notes = [NOTES_BY_INDEX[index] for index in indices]
         return self.melody_composer.generate_interval_melody(base_notes, interval)
+
+    @staticmethod
+    def _exercise_key(num_notes: int) -> str:
+        """Return the exercise bank key of problem sets of a size."""
+        return f"interval_base_notes_{num_notes}"
@@ -1,7 +1,9 @@
 """Service for practicing melodies."""
 
+import random
+
 from improvisation_lab.config import Config
-from improvisation_lab.domain.composition import PhraseData
+from improvisation_lab.domain.composition import PhraseData, PhraseStream
 from improvisation_lab.service.base_practice_service import BasePracticeService
 
 
@@ -10,15 +12,45 @@ class PiecePracticeService(BasePracticeService):
 
     def __init__(self, config: Config):
         """Initialize PiecePracticeService with configuration."""
-        super().__init__(config)
+        super().__init__(config, seed=config.piece_practice.seed)
 
-    def generate_melody(self) -> list[PhraseData]:
+    def generate_melody(self, rng: random.Random | None = None) -> list[PhraseData]:
         """Generate a melody based on the configured chord progression.
 
+        Args:
+            rng:
+                Random generator to draw the notes with, e.g. the session's.
+                Default is None, the service's generator.
+
         Returns:
             List of PhraseData instances representing the generated melody.
         """
-        selected_progression = self.config.piece_practice.chord_progressions[
+        return self._composer(rng).generate_phrases(self._selected_progression())
+
+    def stream_melody(
+        self, rng: random.Random | None = None, lookahead: int = 1
+    ) -> PhraseStream:
+        """Stream an endless melody over the configured chord progression.
+
+        Phrases are generated as the practice reaches them, continuing the
+        melody across loops of the progression instead of repeating it.
+
+        Args:
+            rng:
+                Random generator to draw the notes with, e.g. the session's.
+                Default is None, the service's generator.
+            lookahead: Number of phrases generated ahead of the current one.
+
+        Returns:
+            The stream of phrases, indexed like a list of phrases.
+        """
+        return PhraseStream(
+            self._composer(rng).iter_phrases(self._selected_progression()),
+            lookahead=lookahead,
+        )
+
+    def _selected_progression(self) -> list[tuple[str, str, str, str, int]]:
+        """Return the chord progression of the selected song."""
+        return self.config.piece_practice.chord_progressions[
             self.config.piece_practice.selected_song
         ]
-        return self.melody_composer.generate_phrases(selected_progression)
@@ -0,0 +1,488 @@
+"""Offline grading of recorded practice takes.
+
+A take is a WAV recording of a student singing a generated melody. Its pitch
+is tracked hop by hop, smoothed into sung note segments with the same note
+decision engine as live practice, and the segments are aligned to the target
+notes of the melody. Takes are graded in parallel across worker processes,
+each holding its own pitch detection model, and are read in chunks so that
+neither a take nor the corpus is loaded into memory at once.
+"""
+
+import json
+import math
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+from scipy import signal
+from scipy.io import wavfile
+
+from improvisation_lab.config import Config
+from improvisation_lab.domain.analysis import NoteDecisionEngine, PitchDetector
+from improvisation_lab.domain.music_theory import NoteGrid, Notes
+
+
+@dataclass
+class NoteSegment:
+    """A note sung steadily in a take."""
+
+    note: str
+    start: float  # Start time in seconds
+    duration: float  # Duration in seconds
+    cents: float  # Median offset of the sung pitch from the note, in cents
+
+
+@dataclass
+class NoteScore:
+    """Grade of one target note of a take."""
+
+    take: str
+    index: int
+    target_note: str
+    sung_note: Optional[str]
+    is_correct: bool
+    start: Optional[float]
+    duration: float
+    cents: Optional[float]
+
+
+@dataclass
+class TakeScore:
+    """Grade of a whole take."""
+
+    take: str
+    num_targets: int
+    num_correct: int
+    num_extra: int  # Sung segments not aligned to any target
+    mean_abs_cents: Optional[float]
+    notes: List[NoteScore] = field(default_factory=list)
+
+    @property
+    def accuracy(self) -> float:
+        """Return the fraction of target notes sung correctly."""
+        return self.num_correct / self.num_targets if self.num_targets else 0.0
+
+
+def load_melody(path: str | Path) -> List[str] | Dict[str, List[str]]:
+    """Load target notes from a JSON melody file.
+
+    The file holds either one melody graded against every take, or an object
+    mapping take file names (without extension) to melodies. A melody is a
+    list of serialized ``PhraseData`` (objects with ``notes``), whose notes
+    are all targets, or a list of interval problems (lists of note names),
+    whose first note is the given base note and the rest are targets.
+
+    Args:
+        path: Path of the JSON file.
+
+    Returns:
+        The target notes, or the target notes of each take.
+
+    Raises:
+        ValueError: If the file does not hold a melody.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        return {take: _parse_melody(melody) for take, melody in data.items()}
+    return _parse_melody(data)
+
+
+def _parse_melody(melody: Any) -> List[str]:
+    """Flatten a serialized melody into its target notes.
+
+    Args:
+        melody: List of serialized PhraseData or of interval problems.
+
+    Returns:
+        The target notes in order.
+
+    Raises:
+        ValueError: If the melody is not in a supported format.
+    """
+    if not isinstance(melody, list):
+        raise ValueError("A melody must be a list of phrases or interval problems")
+    targets: List[str] = []
+    for phrase in melody:
+        if isinstance(phrase, dict) and "notes" in phrase:
+            notes = phrase["notes"]
+        elif isinstance(phrase, list):
+            notes = phrase[1:]
+        else:
+            raise ValueError(f"Invalid phrase in melody: {phrase!r}")
+        # Validates the note names
+        targets.extend(Notes(note).value for note in notes)
+    return targets
+
+
+def iter_audio_chunks(
+    path: str | Path, sample_rate: int, chunk_duration: float = 10.0
+) -> Iterator[np.ndarray]:
+    """Read a WAV file as mono float chunks at the given sample rate.
+
+    The file is memory-mapped and converted chunk by chunk. Samples are
+    normalized by the peak of the whole file, as live audio is normalized
+    before pitch detection. Each chunk is resampled together with enough
+    samples around it to cover the resampling filter, so the chunks join into
+    the same audio as resampling the whole take at once.
+
+    Args:
+        path: Path of the WAV file.
+        sample_rate: Sample rate of the returned audio in Hz.
+        chunk_duration: Duration of each chunk in seconds.
+
+    Yields:
+        Chunks of float32 audio.
+    """
+    file_rate, data = wavfile.read(path, mmap=True)
+    scale = 1.0
+    if np.issubdtype(data.dtype, np.integer):
+        scale = float(np.iinfo(data.dtype).max)
+
+    ratio = math.gcd(sample_rate, file_rate)
+    up, down = sample_rate // ratio, file_rate // ratio
+    # Chunks and context are whole multiples of the decimation factor, so that
+    # they start on an output sample
+    chunk_size = max(1, int(file_rate * chunk_duration) // down) * down
+    # Input samples on each side of an output sample that the filter of
+    # resample_poly reaches
+    context = math.ceil(10 * max(up, down) / up / down) * down
+
+    peak = 0.0
+    for start in range(0, len(data), chunk_size):
+        # Widened before abs, which overflows at the minimum of integer types
+        chunk = np.asarray(data[start : start + chunk_size], dtype=np.float32)
+        peak = max(peak, float(np.max(np.abs(chunk))))
+    gain = 1.0 / peak if peak > 0 else 1.0 / scale
+
+    for start in range(0, len(data), chunk_size):
+        end = min(start + chunk_size, len(data))
+        if file_rate == sample_rate:
+            chunk = _mono(data[start:end]) * gain
+        else:
+            padded_start = max(0, start - context)
+            padded = _mono(data[padded_start : end + context]) * gain
+            resampled = signal.resample_poly(padded, up, down)
+            offset = (start - padded_start) * up // down
+            chunk = resampled[
+                offset : offset + math.ceil((end - start) * up / down)
+            ].astype(np.float32)
+            # The resampling filter may overshoot the normalized range
+            np.clip(chunk, -1.0, 1.0, out=chunk)
+        yield chunk
+
+
+def _mono(data: np.ndarray) -> np.ndarray:
+    """Convert WAV samples to mono float32 audio."""
+    audio = np.asarray(data, dtype=np.float32)
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    return audio
+
+
+def track_pitch(detector: PitchDetector, chunks: Iterable[np.ndarray]) -> np.ndarray:
+    """Detect the pitch of every hop of a take.
+
+    Args:
+        detector: The pitch detector.
+        chunks: Audio chunks of the take, in order.
+
+    Returns:
+        Frequency in Hz for each hop, zero where no voice is detected.
+    """
+    tracks = []
+    remainder = np.array([], dtype=np.float32)
+    for chunk in chunks:
+        # Keep chunks a whole number of hops long so hops stay aligned
+        audio = np.concatenate([remainder, chunk])
+        usable = len(audio) // detector.hop_length * detector.hop_length
+        remainder = audio[usable:]
+        if usable:
+            tracks.append(detector.detect_pitch_track(audio[:usable])[:-1])
+    if len(remainder):
+        tracks.append(detector.detect_pitch_track(remainder)[:1])
+    if not tracks:
+        return np.array([], dtype=np.float32)
+    return np.concatenate(tracks)
+
+
+def segment_notes(
+    frequencies: np.ndarray,
+    hop_duration: float,
+    engine: NoteDecisionEngine,
+    grid: NoteGrid,
+    min_duration: float = 0.1,
+) -> List[NoteSegment]:
+    """Split a pitch track into steadily sung notes.
+
+    Args:
+        frequencies: Frequency in Hz for each hop, zero where unvoiced.
+        hop_duration: Duration of a hop in seconds.
+        engine: Note decision engine smoothing the pitch track.
+        grid: Note grid of the detectable frequencies, tuned like the engine.
+        min_duration: Segments shorter than this (seconds) are dropped.
+
+    Returns:
+        The sung note segments in order.
+    """
+    midis = Notes.convert_frequency_to_midi(frequencies, engine.reference_frequency)
+    # Hops read as each note (None: unvoiced), to date changes back to onsets
+    hop_notes = grid.base_note_names(frequencies)
+    # Decisions lag the audio by up to the window and hysteresis
+    max_lag = engine.window_size + engine.hysteresis
+
+    segments: List[NoteSegment] = []
+    note: Optional[str] = None
+    start = 0
+    for hop, frequency in enumerate(frequencies):
+        decision = engine.update([frequency])
+        if decision.changed:
+            onset = hop
+            while (
+                onset > start
+                and hop - onset < max_lag
+                and hop_notes[onset - 1] == decision.note
+            ):
+                onset -= 1
+            _close_segment(segments, note, start, onset, midis, hop_duration)
+            note = decision.note
+            start = onset
+    _close_segment(segments, note, start, len(frequencies), midis, hop_duration)
+    return [segment for segment in segments if segment.duration >= min_duration]
+
+
+def _close_segment(
+    segments: List[NoteSegment],
+    note: Optional[str],
+    start: int,
+    end: int,
+    midis: np.ndarray,
+    hop_duration: float,
+):
+    """Append the segment of a note sung from hop start to hop end."""
+    if note is None or end <= start:
+        return
+    pitch_class = Notes.get_note_index(note)
+    voiced = midis[start:end][~np.isnan(midis[start:end])]
+    # Offset from the nearest note of the sung pitch class, in any octave
+    offsets = (voiced - pitch_class + 6) % 12 - 6
+    segments.append(
+        NoteSegment(
+            note=note,
+            start=start * hop_duration,
+            duration=(end - start) * hop_duration,
+            cents=float(np.median(offsets) * 100) if len(offsets) else 0.0,
+        )
+    )
+
+
+def align_segments(
+    targets: List[str], segments: List[NoteSegment]
+) -> List[Optional[int]]:
+    """Align sung segments to target notes by minimum edit distance.
+
+    Args:
+        targets: Target notes in order.
+        segments: Sung note segments in order.
+
+    Returns:
+        For each target, the index of its aligned segment or None if missed.
+    """
+    n, m = len(targets), len(segments)
+    # cost[i][j]: cost of aligning the first i targets with the first j segments
+    cost = np.zeros((n + 1, m + 1), dtype=np.int64)
+    cost[:, 0] = np.arange(n + 1)
+    cost[0, :] = np.arange(m + 1)
+    for i in range(1, n + 1):
+        for j in range(1, m + 1):
+            substitution = 0 if targets[i - 1] == segments[j - 1].note else 1
+            cost[i, j] = min(
+                cost[i - 1, j - 1] + substitution,
+                cost[i - 1, j] + 1,  # Target missed
+                cost[i, j - 1] + 1,  # Extra sung note
+            )
+
+    alignment: List[Optional[int]] = [None] * n
+    i, j = n, m
+    while i > 0 and j > 0:
+        substitution = 0 if targets[i - 1] == segments[j - 1].note else 1
+        if cost[i, j] == cost[i - 1, j - 1] + substitution:
+            alignment[i - 1] = j - 1
+            i, j = i - 1, j - 1
+        elif cost[i, j] == cost[i - 1, j] + 1:
+            i -= 1
+        else:
+            j -= 1
+    return alignment
+
+
+def score_take(
+    take: str,
+    targets: List[str],
+    segments: List[NoteSegment],
+    tolerance_cents: float = 50.0,
+) -> TakeScore:
+    """Score a take from its aligned note segments.
+
+    Args:
+        take: Name of the take.
+        targets: Target notes in order.
+        segments: Sung note segments in order.
+        tolerance_cents: Maximum offset of a correct note, in cents.
+
+    Returns:
+        The per-note and per-take scores.
+    """
+    alignment = align_segments(targets, segments)
+    notes: List[NoteScore] = []
+    for index, (target, segment_idx) in enumerate(zip(targets, alignment)):
+        if segment_idx is None:
+            notes.append(NoteScore(take, index, target, None, False, None, 0.0, None))
+            continue
+        segment = segments[segment_idx]
+        is_correct = (
+            segment.note == target and abs(segment.cents) <= tolerance_cents
+        )
+        notes.append(
+            NoteScore(
+                take=take,
+                index=index,
+                target_note=target,
+                sung_note=segment.note,
+                is_correct=is_correct,
+                start=segment.start,
+                duration=segment.duration,
+                cents=segment.cents,
+            )
+        )
+
+    cents = [abs(note.cents) for note in notes if note.cents is not None]
+    num_aligned = sum(segment_idx is not None for segment_idx in alignment)
+    return TakeScore(
+        take=take,
+        num_targets=len(targets),
+        num_correct=sum(note.is_correct for note in notes),
+        num_extra=len(segments) - num_aligned,
+        mean_abs_cents=float(np.mean(cents)) if cents else None,
+        notes=notes,
+    )
+
+
+def grade_take(
+    path: str | Path,
+    targets: List[str],
+    config: Config,
+    detector: PitchDetector,
+    chunk_duration: float = 10.0,
+) -> TakeScore:
+    """Grade one recorded take.
+
+    Args:
+        path: Path of the WAV file of the take.
+        targets: Target notes in order.
+        config: Application configuration (audio, note decision and grading).
+        detector: The pitch detector.
+        chunk_duration: Duration (seconds) of audio read at once.
+
+    Returns:
+        The per-note and per-take scores.
+    """
+    sample_rate = config.audio.pitch_detector.sample_rate
+    chunks = iter_audio_chunks(path, sample_rate, chunk_duration)
+    frequencies = track_pitch(detector, chunks)
+
+    decision_config = config.audio.note_decision
+    engine = NoteDecisionEngine(
+        window_size=decision_config.window_size,
+        hysteresis=decision_config.hysteresis,
+        tolerance_cents=decision_config.tolerance_cents,
+        min_voiced_ratio=decision_config.min_voiced_ratio,
+        reference_frequency=config.audio.reference_frequency,
+    )
+    grid = NoteGrid(
+        detector.f0_min, detector.f0_max, config.audio.reference_frequency
+    )
+    segments = segment_notes(
+        frequencies, detector.hop_length / sample_rate, engine, grid
+    )
+    return score_take(
+        Path(path).stem, targets, segments, config.audio.grading.tolerance_cents
+    )
+
+
+# Per-process state of the grading workers
+_worker_config: Optional[Config] = None
+_worker_detector: Optional[PitchDetector] = None
+
+
+def _init_worker(config: Config, torch_threads: int):
+    """Load the pitch detection model once per worker process."""
+    global _worker_config, _worker_detector
+    import torch
+
+    torch.set_num_threads(torch_threads)
+    _worker_config = config
+    _worker_detector = PitchDetector(config.audio.pitch_detector)
+
+
+def _grade_in_worker(path: str, targets: List[str]) -> TakeScore:
+    """Grade a take with the worker's pitch detector."""
+    assert _worker_config is not None and _worker_detector is not None
+    return grade_take(path, targets, _worker_config, _worker_detector)
+
+
+def grade_takes(
+    paths: Iterable[str | Path],
+    melody: List[str] | Dict[str, List[str]],
+    config: Config,
+    workers: Optional[int] = None,
+) -> Iterator[TakeScore]:
+    """Grade takes in parallel, yielding scores as they are ready.
+
+    Only a bounded number of takes is in flight at once, so paths may be a
+    lazy iterator over a large corpus.
+
+    Args:
+        paths: Paths of the WAV files of the takes.
+        melody: Target notes of every take, or of each take by file name.
+        config: Application configuration.
+        workers: Number of worker processes (default: number of CPUs).
+
+    Yields:
+        Scores of the takes, in the order of the paths.
+
+    Raises:
+        KeyError: If a take has no melody.
+    """
+    workers = workers or os.cpu_count() or 1
+    torch_threads = max(1, (os.cpu_count() or 1) // workers)
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(config, torch_threads),
+    ) as executor:
+        for path in paths:
+            targets = melody if isinstance(melody, list) else melody[Path(path).stem]
+            pending.append(executor.submit(_grade_in_worker, str(path), targets))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def note_score_rows(score: TakeScore) -> List[Dict[str, Any]]:
+    """Return the per-note scores of a take as flat rows."""
+    return [asdict(note) for note in score.notes]
+
+
+def take_score_row(score: TakeScore) -> Dict[str, Any]:
+    """Return the per-take score as a flat row."""
+    row = asdict(score)
+    del row["notes"]
+    row["accuracy"] = score.accuracy
+    return row
@@ -5,24 +5,37 @@ using either a web or console interface.
 """
 
 import argparse
+import os
 
 import gradio as gr
+import uvicorn
+from fastapi import FastAPI
 
 from improvisation_lab.application import PracticeAppFactory
+from improvisation_lab.application.metrics import (MetricsRegistry,
+                                                   instrumentation_collector,
+                                                   mount_metrics_endpoint,
+                                                   practice_app_collector,
+                                                   process_collector)
 from improvisation_lab.config import Config
+from improvisation_lab.instrumentation import instrumentation
 
 
-def create_practice_interface(practice_type: str) -> gr.Blocks:
+def create_practice_interface(
+    practice_type: str, registry: MetricsRegistry, config: Config
+) -> gr.Blocks:
     """Create a practice interface for the given practice type.
 
     Args:
         practice_type: The type of practice to create an interface for.
+        registry: Metrics registry to register the application's metrics in.
+        config: Config instance.
 
     Returns:
         gr.Blocks: The practice interface.
     """
-    config = Config()
     app = PracticeAppFactory.create_app("web", practice_type, config)
+    registry.register(practice_app_collector(app, practice_type))
     return app.ui._build_interface()
 
 
@@ -41,9 +54,34 @@ def main():
         default="interval",
         help="Type of practice to run (interval or piece)",
     )
+    parser.add_argument(
+        "--stage_timings",
+        default=None,
+        help="Record per-stage latencies and write them as JSON to this path on exit",
+    )
     args = parser.parse_args()
 
-    if args.app_type == "web":
+    if args.stage_timings:
+        instrumentation.enable()
+    try:
+        run_app(args.app_type, args.practice_type)
+    finally:
+        if args.stage_timings:
+            instrumentation.dump_json(args.stage_timings)
+
+
+def run_app(app_type: str, practice_type: str):
+    """Create and launch the application.
+
+    Args:
+        app_type: Type of application to run (web or console).
+        practice_type: Type of practice to run (interval or piece).
+    """
+    config = Config()
+    if app_type == "web":
+        registry = MetricsRegistry()
+        registry.register(process_collector())
+        registry.register(instrumentation_collector())
         with gr.Blocks(
             head="""
             <script src="https://cdn.jsdelivr.net/npm/tone@14.8.39/build/Tone.js">
@@ -52,15 +90,38 @@ def main():
         ) as app:
             with gr.Tabs():
                 with gr.TabItem("Interval Practice"):
-                    create_practice_interface("interval")
+                    create_practice_interface("interval", registry, config)
                 with gr.TabItem("Piece Practice"):
-                    create_practice_interface("piece")
-        app.launch()
+                    create_practice_interface("piece", registry, config)
+        app.queue(max_size=config.web.max_queue_size)
+        if config.web.metrics_endpoint:
+            serve_with_metrics(app, registry)
+        else:
+            app.launch()
     else:
-        config = Config()
-        app = PracticeAppFactory.create_app(args.app_type, args.practice_type, config)
+        app = PracticeAppFactory.create_app(app_type, practice_type, config)
         app.launch()
 
 
+def serve_with_metrics(app: gr.Blocks, registry: MetricsRegistry):
+    """Serve the Gradio app and the metrics endpoint from the same server.
+
+    The server listens where Gradio's launch() would, according to the
+    GRADIO_SERVER_NAME and GRADIO_SERVER_PORT environment variables.
+
+    Args:
+        app: The Gradio app.
+        registry: Metrics registry served at /metrics.
+    """
+    server = FastAPI()
+    mount_metrics_endpoint(server, registry)
+    server = gr.mount_gradio_app(server, app, path="")
+    uvicorn.run(
+        server,
+        host=os.environ.get("GRADIO_SERVER_NAME", "127.0.0.1"),
+        port=int(os.environ.get("GRADIO_SERVER_PORT", "7860")),
+    )
+
+
 if __name__ == "__main__":
     main()
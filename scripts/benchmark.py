@@ -0,0 +1,361 @@
+"""Script for benchmarking the audio analysis hot path.
+
+Times pitch detection, audio buffering, web audio preprocessing, frequency to
+note conversion and phrase generation, saves the results as JSON and compares
+them against a stored baseline to flag regressions.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import torch
+
+from improvisation_lab.config import Config
+from improvisation_lab.domain.analysis import PitchDetector
+from improvisation_lab.domain.composition import MelodyComposer
+from improvisation_lab.domain.composition.phrase_generator import \
+    PhraseGenerator
+from improvisation_lab.domain.music_theory import Notes
+from improvisation_lab.infrastructure.audio import WebAudioProcessor
+
+DEFAULT_BASELINE_PATH = Path("benchmarks/baseline.json")
+DEFAULT_OUTPUT_PATH = Path("benchmarks/latest.json")
+
+FRAME_DURATIONS = [0.1, 0.2, 0.3, 0.5, 1.0]
+INPUT_SAMPLE_RATES = [16000, 44100, 48000]
+INPUT_CHUNK_DURATION = 0.1
+
+Benchmark = Tuple[str, Callable[[], object]]
+
+
+def sine_wave(frequency: float, duration: float, sample_rate: int) -> np.ndarray:
+    """Create a float32 sine wave.
+
+    Args:
+        frequency: Frequency of the sine wave in Hz.
+        duration: Duration in seconds.
+        sample_rate: Sample rate in Hz.
+
+    Returns:
+        Sine wave samples.
+    """
+    t = np.arange(int(sample_rate * duration)) / sample_rate
+    return np.sin(2 * np.pi * frequency * t).astype(np.float32)
+
+
+def pitch_detector_benchmarks(config: Config) -> List[Benchmark]:
+    """Create benchmarks for PitchDetector.detect_pitch across frame lengths."""
+    detector = PitchDetector(config.audio.pitch_detector)
+    sample_rate = config.audio.pitch_detector.sample_rate
+    benchmarks: List[Benchmark] = []
+    for duration in FRAME_DURATIONS:
+        frame = sine_wave(440.0, duration, sample_rate)
+        benchmarks.append(
+            (
+                f"detect_pitch[{int(duration * 1000)}ms]",
+                partial(detector.detect_pitch, frame),
+            )
+        )
+    return benchmarks
+
+
+def audio_processor_benchmarks(config: Config) -> List[Benchmark]:
+    """Create benchmarks for AudioProcessor buffering and preprocessing."""
+    sample_rate = config.audio.sample_rate
+    buffer_processor = WebAudioProcessor(
+        sample_rate=sample_rate,
+        callback=lambda audio_data: None,
+        buffer_duration=config.audio.buffer_duration,
+    )
+    chunk = sine_wave(440.0, INPUT_CHUNK_DURATION, sample_rate)
+
+    def append_and_process():
+        buffer_processor._append_to_buffer(chunk)
+        buffer_processor._process_buffer()
+
+    benchmarks: List[Benchmark] = [("append_and_process_buffer", append_and_process)]
+
+    for input_rate in INPUT_SAMPLE_RATES:
+        processor = WebAudioProcessor(
+            sample_rate=sample_rate,
+            callback=lambda audio_data: None,
+            buffer_duration=config.audio.buffer_duration,
+        )
+        processor.start_recording()
+        samples = (sine_wave(440.0, INPUT_CHUNK_DURATION, input_rate) * 8000).astype(
+            np.int16
+        )
+        benchmarks.append(
+            (
+                f"web_process_audio[{input_rate}Hz]",
+                partial(process_audio_copy, processor, input_rate, samples),
+            )
+        )
+    return benchmarks
+
+
+def process_audio_copy(
+    processor: WebAudioProcessor, input_rate: int, samples: np.ndarray
+):
+    """Pass a copy of samples to a web processor, which modifies its input."""
+    processor.process_audio((input_rate, samples.copy()))
+
+
+def music_theory_benchmarks() -> List[Benchmark]:
+    """Create benchmarks for frequency to note conversion."""
+    frequencies = np.geomspace(80.0, 880.0, 1000).tolist()
+
+    def convert_frequencies():
+        for frequency in frequencies:
+            Notes.convert_frequency_to_base_note(frequency)
+
+    track = np.array(frequencies)
+
+    def convert_track():
+        Notes.convert_frequencies_to_notes(track).base_note_names()
+
+    return [
+        ("convert_frequency_to_base_note[x1000]", convert_frequencies),
+        ("convert_frequencies_to_notes[1000]", convert_track),
+    ]
+
+
+def composition_benchmarks() -> List[Benchmark]:
+    """Create benchmarks for phrase generation."""
+    # Seeded, so that every run generates the same phrases
+    generator = PhraseGenerator(random.Random(0))
+    composer = MelodyComposer(random.Random(0))
+    rng = np.random.default_rng(0)
+    progression = [
+        ("A", "natural_minor", "A", "min7", 8),
+        ("A", "natural_minor", "D", "min7", 8),
+        ("C", "major", "G", "dom7", 8),
+        ("C", "major", "C", "maj7", 4),
+        ("F", "major", "C", "dom7", 4),
+    ]
+    return [
+        (
+            "generate_phrase[len8]",
+            lambda: generator.generate_phrase(
+                scale_root="C",
+                scale_type="major",
+                chord_root="G",
+                chord_type="dom7",
+                prev_note="B",
+                length=8,
+            ),
+        ),
+        (
+            "generate_phrase_batch[1000x8]",
+            lambda: generator.generate_phrase_batch(
+                scale_root="C",
+                scale_type="major",
+                chord_root="G",
+                chord_type="dom7",
+                num_phrases=1000,
+                length=8,
+                rng=rng,
+            ),
+        ),
+        (
+            "generate_phrases[progression5]",
+            lambda: composer.generate_phrases(progression),
+        ),
+    ]
+
+
+def time_benchmark(
+    func: Callable[[], object], repeat: int, min_time: float
+) -> Dict[str, float]:
+    """Time a benchmark function.
+
+    The function is called in batches large enough to take at least
+    ``min_time`` seconds, so that timer resolution does not dominate.
+
+    Args:
+        func: Function to benchmark.
+        repeat: Number of timed batches.
+        min_time: Minimum duration of each batch in seconds.
+
+    Returns:
+        Dictionary of per-call timings in seconds.
+    """
+    # Warm up caches and lazily initialized state, and size the batch
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+
+    return {
+        "median": statistics.median(timings),
+        "min": min(timings),
+        "mean": statistics.mean(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "calls_per_batch": number,
+    }
+
+
+def run_benchmarks(
+    config: Config, name_filter: str | None, repeat: int, min_time: float
+) -> dict:
+    """Run all benchmarks and collect the results.
+
+    Args:
+        config: Config instance.
+        name_filter: Only run benchmarks whose name contains this string.
+        repeat: Number of timed batches per benchmark.
+        min_time: Minimum duration of each batch in seconds.
+
+    Returns:
+        Dictionary with environment metadata and per-benchmark timings.
+    """
+    benchmarks = (
+        pitch_detector_benchmarks(config)
+        + audio_processor_benchmarks(config)
+        + music_theory_benchmarks()
+        + composition_benchmarks()
+    )
+
+    results = {}
+    for name, func in benchmarks:
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = time_benchmark(func, repeat, min_time)
+        print(f"{name:<40} {results[name]['median'] * 1e6:>12.1f} us")
+
+    return {
+        "metadata": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "torch": torch.__version__,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "benchmarks": results,
+    }
+
+
+def compare_with_baseline(results: dict, baseline: dict, threshold: float) -> bool:
+    """Compare benchmark results against a baseline and print the differences.
+
+    Args:
+        results: Results of the current run.
+        baseline: Results of the baseline run.
+        threshold: Relative slowdown of the median above which a regression
+            is reported (e.g. 0.2 for 20%).
+
+    Returns:
+        True if any benchmark regressed, False otherwise.
+    """
+    print(
+        f"\nBaseline: torch {baseline['metadata'].get('torch')}, "
+        f"numpy {baseline['metadata'].get('numpy')} -> "
+        f"torch {results['metadata']['torch']}, "
+        f"numpy {results['metadata']['numpy']}"
+    )
+    print(f"{'benchmark':<40} {'baseline us':>12} {'current us':>12} {'change':>8}")
+    print("-" * 76)
+
+    has_regression = False
+    for name, timing in results["benchmarks"].items():
+        if name not in baseline["benchmarks"]:
+            print(f"{name:<40} {'-':>12} {timing['median'] * 1e6:>12.1f} {'new':>8}")
+            continue
+        baseline_median = baseline["benchmarks"][name]["median"]
+        change = timing["median"] / baseline_median - 1
+        is_regression = change > threshold
+        has_regression |= is_regression
+        print(
+            f"{name:<40} {baseline_median * 1e6:>12.1f} "
+            f"{timing['median'] * 1e6:>12.1f} {change:>+8.1%}"
+            f"{'  REGRESSION' if is_regression else ''}"
+        )
+    return has_regression
+
+
+def main():
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description="Benchmark the analysis hot path")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_OUTPUT_PATH,
+        help="Path to save the benchmark results as JSON",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE_PATH,
+        help="Path of the baseline results to compare against",
+    )
+    parser.add_argument(
+        "--save_baseline",
+        action="store_true",
+        help="Save the results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown reported as a regression (default: 0.2)",
+    )
+    parser.add_argument(
+        "--filter",
+        default=None,
+        help="Only run benchmarks whose name contains this string",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=7, help="Number of timed batches"
+    )
+    parser.add_argument(
+        "--min_time",
+        type=float,
+        default=0.05,
+        help="Minimum duration of each timed batch in seconds",
+    )
+    args = parser.parse_args()
+
+    config = Config()
+    results = run_benchmarks(config, args.filter, args.repeat, args.min_time)
+
+    output_path = args.baseline if args.save_baseline else args.output
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to {output_path}")
+
+    if args.save_baseline:
+        return
+    if not args.baseline.exists():
+        print(f"No baseline found at {args.baseline}; run with --save_baseline.")
+        return
+
+    with open(args.baseline, "r") as f:
+        baseline = json.load(f)
+    if compare_with_baseline(results, baseline, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
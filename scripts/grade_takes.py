@@ -0,0 +1,75 @@
+"""Script for grading recorded practice takes offline.
+
+Grades every WAV file of a directory against a melody, in parallel across
+processes, and writes per-note and per-take scores as CSV files. Rows are
+written as each take is graded, so partial results survive an interruption.
+"""
+
+import argparse
+import csv
+from dataclasses import fields
+from pathlib import Path
+
+from improvisation_lab.config import Config
+from improvisation_lab.service.take_grading import (NoteScore, TakeScore,
+                                                    grade_takes, load_melody,
+                                                    note_score_rows,
+                                                    take_score_row)
+
+
+def main():
+    """Grade the takes."""
+    parser = argparse.ArgumentParser(description="Grade recorded practice takes")
+    parser.add_argument(
+        "takes_dir", type=Path, help="Directory containing the WAV files of takes"
+    )
+    parser.add_argument(
+        "melody",
+        type=Path,
+        help="JSON file of the melody (PhraseData list or interval problems), "
+        "or of a melody per take file name",
+    )
+    parser.add_argument(
+        "--output_dir",
+        type=Path,
+        default=Path("grading_results"),
+        help="Directory to write notes.csv and takes.csv to",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--config", default="config.yml", help="Path of the configuration file"
+    )
+    args = parser.parse_args()
+
+    config = Config(config_path=args.config)
+    melody = load_melody(args.melody)
+    paths = sorted(args.takes_dir.glob("*.wav"))
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    take_fields = [f.name for f in fields(TakeScore) if f.name != "notes"]
+    with open(args.output_dir / "notes.csv", "w", newline="") as notes_file, open(
+        args.output_dir / "takes.csv", "w", newline=""
+    ) as takes_file:
+        notes_writer = csv.DictWriter(
+            notes_file, fieldnames=[f.name for f in fields(NoteScore)]
+        )
+        takes_writer = csv.DictWriter(takes_file, fieldnames=take_fields + ["accuracy"])
+        notes_writer.writeheader()
+        takes_writer.writeheader()
+
+        for score in grade_takes(paths, melody, config, args.workers):
+            notes_writer.writerows(note_score_rows(score))
+            takes_writer.writerow(take_score_row(score))
+            print(
+                f"{score.take}: {score.num_correct}/{score.num_targets} correct "
+                f"({score.accuracy:.0%})"
+            )
+
+
+if __name__ == "__main__":
+    main()
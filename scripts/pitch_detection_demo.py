@@ -12,11 +12,14 @@ from improvisation_lab.infrastructure.audio import (DirectAudioProcessor,
                                                     WebAudioProcessor)
 
 
-def create_process_audio(pitch_detector: PitchDetector):
+def create_process_audio(
+    pitch_detector: PitchDetector, reference_frequency: float = 440.0
+):
     """Create audio processing callback function.
 
     Args:
         pitch_detector: PitchDetector instance
+        reference_frequency: Frequency of A4 in Hz
 
     Returns:
         Callback function for processing audio data
@@ -25,7 +28,7 @@ def create_process_audio(pitch_detector: PitchDetector):
     def process_audio(audio_data):
         frequency = pitch_detector.detect_pitch(audio_data)
         if frequency > 0:  # voice detected
-            note_name = Notes.convert_frequency_to_note(frequency)
+            note_name = Notes.convert_frequency_to_note(frequency, reference_frequency)
             print(
                 f"\rFrequency: {frequency:6.1f} Hz | Note: {note_name:<5}",
                 end="",
@@ -54,7 +57,9 @@ def run_direct_audio_demo(config: Config):
     print("-" * 50)
 
     try:
-        mic_input._callback = create_process_audio(pitch_detector)
+        mic_input._callback = create_process_audio(
+            pitch_detector, config.audio.reference_frequency
+        )
         mic_input.start_recording()
         while True:
             time.sleep(0.1)
@@ -82,7 +87,9 @@ def run_web_audio_demo(config: Config):
     def process_audio(audio_data):
         frequency = pitch_detector.detect_pitch(audio_data)
         if frequency > 0:
-            note_name = Notes.convert_frequency_to_note(frequency)
+            note_name = Notes.convert_frequency_to_note(
+                frequency, config.audio.reference_frequency
+            )
             result["text"] = f"Frequency: {frequency:6.1f} Hz | Note: {note_name}"
         else:
             result["text"] = "No voice detected"
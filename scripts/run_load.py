@@ -0,0 +1,345 @@
+"""Script for load testing the web practice applications.
+
+Simulates many concurrent browser sessions by awaiting ``handle_audio`` with
+synthetic microphone chunks at the same cadence Gradio streams them, all on one
+event loop like the Gradio server, and reports handler latency for an
+increasing number of sessions.
+"""
+
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+import gradio as gr
+import numpy as np
+
+from improvisation_lab.application.interval_practice import \
+    WebIntervalPracticeApp
+from improvisation_lab.application.piece_practice import WebPiecePracticeApp
+from improvisation_lab.config import Config
+from improvisation_lab.instrumentation import instrumentation
+from improvisation_lab.service import (IntervalPracticeService,
+                                       PiecePracticeService)
+
+# Gradio delivers microphone audio as int16 samples at the browser sample rate
+INPUT_SAMPLE_RATE = 48000
+INPUT_AMPLITUDE = 8000
+
+
+@dataclass
+class LoadTestResult:
+    """Latency statistics for one load level."""
+
+    num_sessions: int
+    stream_every: float
+    wall_time: float
+    latencies: List[float] = field(default_factory=list)
+
+    @property
+    def num_calls(self) -> int:
+        """Return the number of handler calls made."""
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        """Return the number of handler calls completed per second."""
+        return self.num_calls / self.wall_time if self.wall_time > 0 else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Return the q-th percentile of handler latency in seconds."""
+        if not self.latencies:
+            return 0.0
+        return float(np.percentile(self.latencies, q))
+
+    @property
+    def overrun_ratio(self) -> float:
+        """Return the fraction of calls slower than the stream interval."""
+        if not self.latencies:
+            return 0.0
+        overruns = sum(1 for latency in self.latencies if latency > self.stream_every)
+        return overruns / self.num_calls
+
+    @property
+    def is_saturated(self) -> bool:
+        """Return whether p95 latency exceeds the stream interval."""
+        return self.percentile(95) > self.stream_every
+
+
+def create_chunk(
+    frequency: float, duration: float, phase: float = 0.0
+) -> tuple[int, np.ndarray]:
+    """Create a synthetic microphone chunk in the format Gradio streams.
+
+    Args:
+        frequency: Frequency of the sine tone in Hz.
+        duration: Duration of the chunk in seconds.
+        phase: Start phase of the sine tone in radians.
+
+    Returns:
+        Tuple of (sample_rate, int16 audio samples).
+    """
+    num_samples = int(INPUT_SAMPLE_RATE * duration)
+    t = np.arange(num_samples) / INPUT_SAMPLE_RATE
+    audio = INPUT_AMPLITUDE * np.sin(2 * np.pi * frequency * t + phase)
+    return INPUT_SAMPLE_RATE, audio.astype(np.int16)
+
+
+def create_app(practice_type: str, config: Config):
+    """Create the web application whose sessions are simulated.
+
+    Args:
+        practice_type: Type of practice ("interval" or "piece").
+        config: Config instance.
+
+    Returns:
+        The web practice application.
+    """
+    if practice_type == "interval":
+        return WebIntervalPracticeApp(IntervalPracticeService(config), config)
+    return WebPiecePracticeApp(PiecePracticeService(config), config)
+
+
+async def start_session(
+    app, practice_type: str, request: gr.Request, config: Config
+):
+    """Start a practice session as if the user clicked "Generate Melody".
+
+    Args:
+        app: The web practice application.
+        practice_type: Type of practice ("interval" or "piece").
+        request: Request identifying the simulated session.
+        config: Config instance.
+    """
+    if practice_type == "interval":
+        await app.start(
+            "minor 2nd",
+            "Up",
+            config.interval_practice.num_problems,
+            True,
+            1.0,
+            request,
+        )
+    else:
+        await app.start(request)
+
+
+async def run_session(
+    app,
+    request: gr.Request,
+    stream_every: float,
+    duration: float,
+    start_time: float,
+    concurrency_limit: asyncio.Semaphore,
+) -> List[float]:
+    """Run one simulated session, calling handle_audio at the stream cadence.
+
+    Args:
+        app: The web practice application.
+        request: Request identifying the simulated session.
+        stream_every: Interval between chunks in seconds.
+        duration: Duration of the session in seconds.
+        start_time: perf_counter timestamp at which the session starts.
+        concurrency_limit:
+            Semaphore standing in for the stream event's concurrency limit.
+
+    Returns:
+        The handler latencies of the session.
+    """
+    frequency = float(np.random.uniform(110.0, 440.0))
+    phase = 0.0
+    next_tick = start_time
+    end_time = start_time + duration
+    session_latencies = []
+
+    while next_tick < end_time:
+        delay = next_tick - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        chunk = create_chunk(frequency, stream_every, phase)
+        phase += 2 * np.pi * frequency * stream_every
+
+        call_start = time.perf_counter()
+        # Latency includes the wait for a free slot, as seen by the client
+        async with concurrency_limit:
+            await app.handle_audio(chunk, request)
+        session_latencies.append(time.perf_counter() - call_start)
+
+        # Keep the real cadence; when the handler lags, the next chunk is
+        # already waiting, just like in the Gradio queue.
+        next_tick += stream_every
+
+    return session_latencies
+
+
+async def run_load_level(
+    app,
+    practice_type: str,
+    config: Config,
+    num_sessions: int,
+    duration: float,
+    stream_every: float | None,
+) -> LoadTestResult:
+    """Run the load test for a given number of concurrent sessions.
+
+    Args:
+        app: The web practice application.
+        practice_type: Type of practice ("interval" or "piece").
+        config: Config instance.
+        num_sessions: Number of concurrent simulated sessions.
+        duration: Duration of the load level in seconds.
+        stream_every: Interval between chunks, or None to use the UI default.
+
+    Returns:
+        LoadTestResult with the collected latencies.
+    """
+    requests = [
+        gr.Request(session_hash=f"load-test-{num_sessions}-{i}")
+        for i in range(num_sessions)
+    ]
+    for request in requests:
+        await start_session(app, practice_type, request, config)
+    if stream_every is None:
+        stream_every = app.ui.stream_every
+
+    # Gradio bounds concurrent stream events; None means no limit
+    limit = config.web.stream_concurrency_limit
+    concurrency_limit = asyncio.Semaphore(limit if limit is not None else num_sessions)
+    start_time = time.perf_counter() + 0.1
+    session_latencies = await asyncio.gather(
+        *(
+            run_session(
+                app,
+                request,
+                stream_every,
+                duration,
+                # Stagger sessions so that they do not all tick at the same instant
+                start_time + stream_every * i / num_sessions,
+                concurrency_limit,
+            )
+            for i, request in enumerate(requests)
+        )
+    )
+    wall_time = time.perf_counter() - start_time
+    latencies = [latency for latencies in session_latencies for latency in latencies]
+
+    for request in requests:
+        app.end_session(request)
+
+    return LoadTestResult(
+        num_sessions=num_sessions,
+        stream_every=stream_every,
+        wall_time=wall_time,
+        latencies=latencies,
+    )
+
+
+def print_report(results: List[LoadTestResult]):
+    """Print a latency report for all load levels.
+
+    Args:
+        results: Results of each load level in increasing order of sessions.
+    """
+    print(
+        f"{'sessions':>8} | {'calls':>6} | {'calls/s':>8} | {'p50 ms':>8} | "
+        f"{'p95 ms':>8} | {'p99 ms':>8} | {'overrun':>7}"
+    )
+    print("-" * 72)
+    for result in results:
+        print(
+            f"{result.num_sessions:>8} | {result.num_calls:>6} | "
+            f"{result.throughput:>8.1f} | {result.percentile(50) * 1000:>8.1f} | "
+            f"{result.percentile(95) * 1000:>8.1f} | "
+            f"{result.percentile(99) * 1000:>8.1f} | "
+            f"{result.overrun_ratio:>7.1%}"
+        )
+    print("-" * 72)
+
+    saturated = next((result for result in results if result.is_saturated), None)
+    if saturated is None:
+        print("p95 latency stayed within the stream interval at every load level.")
+    else:
+        print(
+            f"p95 latency exceeds the stream interval "
+            f"({saturated.stream_every * 1000:.0f} ms) "
+            f"at {saturated.num_sessions} concurrent sessions."
+        )
+
+
+def main():
+    """Run the load test."""
+    parser = argparse.ArgumentParser(
+        description="Load test the web practice applications"
+    )
+    parser.add_argument(
+        "--practice_type",
+        choices=["interval", "piece"],
+        default="interval",
+        help="Type of practice to load test (interval or piece)",
+    )
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8, 16],
+        help="Numbers of concurrent sessions to simulate, one load level each",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=10.0,
+        help="Duration of each load level in seconds",
+    )
+    parser.add_argument(
+        "--stream_every",
+        type=float,
+        default=None,
+        help="Interval between audio chunks in seconds (default: UI setting)",
+    )
+    parser.add_argument(
+        "--stop_on_saturation",
+        action="store_true",
+        help="Stop once p95 latency exceeds the stream interval",
+    )
+    parser.add_argument(
+        "--stage_timings",
+        default=None,
+        help="Record per-stage latencies and write them as JSON to this path",
+    )
+    args = parser.parse_args()
+
+    if args.stage_timings:
+        instrumentation.enable()
+
+    config = Config()
+    # Simulated sessions must all fit in the registry without evicting each other
+    config.session.max_sessions = max(config.session.max_sessions, *args.sessions)
+    app = create_app(args.practice_type, config)
+
+    results = []
+    for num_sessions in sorted(args.sessions):
+        print(f"Running {num_sessions} session(s) for {args.duration:.0f}s...")
+        result = asyncio.run(
+            run_load_level(
+                app,
+                args.practice_type,
+                config,
+                num_sessions,
+                args.duration,
+                args.stream_every,
+            )
+        )
+        results.append(result)
+        if args.stop_on_saturation and result.is_saturated:
+            break
+
+    print_report(results)
+
+    if args.stage_timings:
+        instrumentation.dump_json(args.stage_timings)
+        print(f"Stage timings saved to {args.stage_timings}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Tests for the ResultsTable class."""
+
+import pytest
+
+from improvisation_lab.application.interval_practice.results_table import \
+    ResultsTable
+
+
+class TestResultsTable:
+    @pytest.fixture
+    def init_module(self):
+        """Create a ResultsTable for testing."""
+        self.table = ResultsTable(max_rows=5, page_size=2)
+
+    @pytest.mark.usefixtures("init_module")
+    def test_add_keeps_newest_first(self):
+        """Test that the newest result comes first."""
+        self.table.add([1])
+        self.table.add([2])
+
+        assert self.table[0] == [2]
+        assert self.table.page(0) == [[2], [1]]
+
+    @pytest.mark.usefixtures("init_module")
+    def test_capacity(self):
+        """Test that only the latest max_rows results are kept."""
+        for i in range(8):
+            self.table.add([i])
+
+        assert len(self.table) == 5
+        assert self.table[-1] == [3]
+
+    @pytest.mark.usefixtures("init_module")
+    def test_pages(self):
+        """Test paging through the results."""
+        assert self.table.num_pages == 1
+        assert self.table.page(0) == []
+
+        for i in range(5):
+            self.table.add([i])
+
+        assert self.table.num_pages == 3
+        assert self.table.page(1) == [[2], [1]]
+        assert self.table.page(2) == [[0]]
+        # Out of range pages are clamped
+        assert self.table.page(10) == [[0]]
+        assert self.table.page(-1) == [[4], [3]]
+
+    @pytest.mark.usefixtures("init_module")
+    def test_version(self):
+        """Test that the version changes with the content."""
+        version = self.table.version
+        self.table.add([1])
+        assert self.table.version == version + 1
+        self.table.clear()
+        assert self.table.version == version + 2
+        assert len(self.table) == 0
+
+    def test_invalid_size(self):
+        """Test that the table needs room for at least one row."""
+        with pytest.raises(ValueError):
+            ResultsTable(max_rows=0)
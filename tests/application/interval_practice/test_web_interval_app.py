@@ -1,5 +1,7 @@
+import asyncio
 from unittest.mock import Mock, patch
 
+import gradio as gr
 import numpy as np
 import pytest
 
@@ -11,6 +13,7 @@ from improvisation_lab.infrastructure.audio import WebAudioProcessor
 from improvisation_lab.presentation.interval_practice.web_interval_view import \
     WebIntervalPracticeView
 from improvisation_lab.service import IntervalPracticeService
+from improvisation_lab.service.base_practice_service import PitchResult
 
 
 class TestWebIntervalPracticeApp:
@@ -21,7 +24,8 @@ class TestWebIntervalPracticeApp:
         service = IntervalPracticeService(config)
         self.app = WebIntervalPracticeApp(service, config)
         self.app.ui = Mock(spec=WebIntervalPracticeView)
-        self.app.audio_processor = Mock(spec=WebAudioProcessor)
+        self.session = self.app.get_session()
+        self.session.audio_processor = Mock(spec=WebAudioProcessor)
 
     @pytest.mark.usefixtures("init_module")
     def test_launch(self):
@@ -34,76 +38,158 @@ class TestWebIntervalPracticeApp:
     def test_process_audio_callback(self):
         """Test processing audio callback."""
         audio_data = np.array([0.0])
-        self.app.is_running = True
-        self.app.phrases = [
+        self.session.is_running = True
+        self.session.phrases = [
             [Notes.C, Notes.C_SHARP, Notes.C],
             [Notes.D, Notes.D_SHARP, Notes.D],
         ]
-        self.app.current_phrase_idx = 0
-        self.app.current_note_idx = 1
+        self.session.current_phrase_idx = 0
+        self.session.current_note_idx = 1
 
         mock_result = Mock()
         mock_result.target_note = "C#"
         mock_result.current_base_note = "C#"
         mock_result.remaining_time = 0.0
+        mock_result.octave = None
+        mock_result.cents = None
 
         with patch.object(
             self.app.service, "process_audio", return_value=mock_result
         ) as mock_process_audio:
-            self.app._process_audio_callback(audio_data)
-            mock_process_audio.assert_called_once_with(audio_data, "C#")
+            self.app._process_audio_callback(self.session, audio_data)
+            mock_process_audio.assert_called_once_with(
+                audio_data, "C#", self.session.tracking_state
+            )
             assert (
-                self.app.text_manager.result_text
+                self.session.text_manager.result_text
                 == "Target: C# | Your note: C# | Remaining: 0.0s"
             )
 
+    @pytest.mark.usefixtures("init_module")
+    def test_auto_advance_follows_audio_clock(self):
+        """Test that auto advance is timed by the audio consumed."""
+        self.session.is_running = True
+        self.session.is_auto_advance = True
+        self.session.note_duration = 1.0
+        self.session.phrases = [[Notes.C, Notes.C_SHARP, Notes.D]]
+        self.session.current_note_idx = 1
+        clock = self.session.tracking_state.clock
+        self.session.progress_timer = clock.now()
+
+        result = PitchResult(
+            target_note="C#", current_base_note=None, is_correct=False, remaining_time=1
+        )
+        with patch.object(self.app.service, "process_audio", return_value=result):
+            self.app._process_audio_callback(self.session, np.array([0.0]))
+            assert self.session.current_note_idx == 1
+
+            clock.advance(clock.sample_rate)
+            self.app._process_audio_callback(self.session, np.array([0.0]))
+            assert self.session.current_note_idx == 2
+            assert self.session.progress_timer == clock.now()
+
     @pytest.mark.usefixtures("init_module")
     def test_handle_audio(self):
         """Test handling audio input."""
         audio_data = (48000, np.array([0.0]))
-        self.app.is_running = True
+        self.session.is_running = True
         with patch.object(
-            self.app.audio_processor, "process_audio", return_value=None
+            self.session.audio_processor, "process_audio", return_value=None
         ) as mock_process_audio:
-            base_note, phrase_text, result_text, results_table = self.app.handle_audio(
-                audio_data
+            base_note, phrase_text, result_text, results_table = asyncio.run(
+                self.app.handle_audio(audio_data)
             )
             mock_process_audio.assert_called_once_with(audio_data)
-            assert base_note == self.app.base_note
-            assert phrase_text == self.app.text_manager.phrase_text
-            assert result_text == self.app.text_manager.result_text
-            assert results_table == self.app.results_table
+            assert base_note == self.session.base_note
+            assert phrase_text == self.session.text_manager.phrase_text
+            assert result_text == self.session.text_manager.result_text
+            assert results_table == self.session.results_table.page(0)
 
     @pytest.mark.usefixtures("init_module")
     def test_start(self):
         """Test starting the application."""
-        self.app.audio_processor.is_recording = False
+        self.session.audio_processor.is_recording = False
         with patch.object(
-            self.app.audio_processor, "start_recording", return_value=None
+            self.session.audio_processor, "start_recording", return_value=None
         ) as mock_start_recording:
-            base_note, phrase_text, result_text, results_table = self.app.start(
-                "minor 2nd", "Up", 10, True, 1.5
+            base_note, phrase_text, result_text, results_table = asyncio.run(
+                self.app.start("minor 2nd", "Up", 10, True, 1.5)
             )
             mock_start_recording.assert_called_once()
-            assert self.app.is_running
-            assert base_note == self.app.base_note
-            assert phrase_text == self.app.text_manager.phrase_text
-            assert result_text == self.app.text_manager.result_text
-            assert results_table == self.app.results_table
+            assert self.session.is_running
+            assert base_note == self.session.base_note
+            assert phrase_text == self.session.text_manager.phrase_text
+            assert result_text == self.session.text_manager.result_text
+            assert results_table == []
 
     @pytest.mark.usefixtures("init_module")
     def test_stop(self):
         """Test stopping the application."""
-        self.app.audio_processor.is_recording = True
+        self.session.audio_processor.is_recording = True
         with patch.object(
-            self.app.audio_processor, "stop_recording", return_value=None
+            self.session.audio_processor, "stop_recording", return_value=None
         ) as mock_stop_recording:
-            base_note, phrase_text, result_text = self.app.stop()
+            base_note, phrase_text, result_text = asyncio.run(self.app.stop())
             mock_stop_recording.assert_called_once()
-            assert not self.app.is_running
+            assert not self.session.is_running
             assert base_note == "-"
-            assert phrase_text == self.app.text_manager.phrase_text
-            assert result_text == self.app.text_manager.result_text
+            assert phrase_text == self.session.text_manager.phrase_text
+            assert result_text == self.session.text_manager.result_text
+
+    @pytest.mark.usefixtures("init_module")
+    def test_sessions_are_isolated(self):
+        """Test that each Gradio session has its own practice state."""
+        request_a = gr.Request(session_hash="a")
+        request_b = gr.Request(session_hash="b")
+
+        asyncio.run(self.app.start("minor 2nd", "Up", 10, True, 1.5, request_a))
+        asyncio.run(self.app.start("major 3rd", "Down", 5, False, 2.0, request_b))
+
+        session_a = self.app.get_session(request_a)
+        session_b = self.app.get_session(request_b)
+        assert session_a is not session_b
+        assert session_a.audio_processor is not session_b.audio_processor
+        assert session_a.tracking_state is not session_b.tracking_state
+        assert len(session_a.phrases) == 10
+        assert len(session_b.phrases) == 5
+
+        asyncio.run(self.app.stop(request_a))
+        assert not session_a.is_running
+        assert session_b.is_running
+
+    def test_seeded_sessions_are_reproducible(self):
+        """Test that a seeded session's problems do not depend on other sessions."""
+        config = Config()
+        config.interval_practice.seed = 7
+        requests = [gr.Request(session_hash="a"), gr.Request(session_hash="b")]
+        melodies = []
+        # Sessions are created in the same order but started in opposite orders
+        for start_order in (requests, requests[::-1]):
+            app = WebIntervalPracticeApp(IntervalPracticeService(config), config)
+            for request in requests:
+                app.get_session(request).audio_processor = Mock(
+                    spec=WebAudioProcessor, is_recording=True
+                )
+            for request in start_order:
+                asyncio.run(app.start("minor 2nd", "Up", 5, True, 1.5, request))
+            melodies.append(
+                [app.get_session(request).phrases for request in requests]
+            )
+
+        assert melodies[0] == melodies[1]
+
+    @pytest.mark.usefixtures("init_module")
+    def test_end_session(self):
+        """Test that ending a session removes it from the registry."""
+        request = gr.Request(session_hash="a")
+        asyncio.run(self.app.start("minor 2nd", "Up", 10, True, 1.5, request))
+        session = self.app.get_session(request)
+
+        self.app.end_session(request)
+
+        assert "a" not in self.app.sessions
+        assert not session.is_running
+        assert not session.audio_processor.is_recording
 
     @pytest.mark.usefixtures("init_module")
     @pytest.mark.parametrize(
@@ -112,14 +198,68 @@ class TestWebIntervalPracticeApp:
     )
     def test_update_results_table(self, detected_note, expected_result):
         """Test updating the results table with correct and incorrect results."""
-        self.app.phrases = [[Notes.C, Notes.C_SHARP, Notes.C]]
-        self.app.current_phrase_idx = 0
-        self.app.current_note_idx = 1
-        self.app.base_note = "C"
-        self.app.text_manager.result_text = f"Target: C# | Your note: {detected_note}"
+        self.session.phrases = [[Notes.C, Notes.C_SHARP, Notes.C]]
+        self.session.current_phrase_idx = 0
+        self.session.current_note_idx = 1
+        self.session.base_note = "C"
+        self.session.tracking_state.record(
+            PitchResult(
+                target_note="C#",
+                current_base_note=detected_note,
+                is_correct=detected_note == "C#",
+                remaining_time=0.0,
+            )
+        )
 
-        self.app.is_auto_advance = True
-        self.app.update_results_table()
+        self.session.is_auto_advance = True
+        self.app.update_results_table(self.session)
 
         expected_entry = [1, "C", "C#", detected_note, expected_result]
-        assert self.app.results_table[-1] == expected_entry
+        assert self.session.results_table[0] == expected_entry
+
+    @pytest.mark.usefixtures("init_module")
+    def test_update_results_table_no_voice(self):
+        """Test that a note without detection is recorded as missed."""
+        self.session.phrases = [[Notes.C, Notes.C_SHARP, Notes.C]]
+        self.session.current_note_idx = 1
+        self.session.is_auto_advance = True
+
+        self.app.update_results_table(self.session)
+
+        assert self.session.results_table[0][3:] == ["---", "X"]
+
+    @pytest.mark.usefixtures("init_module")
+    def test_update_results_table_before_start(self):
+        """Test that nothing is recorded before the practice is started."""
+        self.session.is_auto_advance = True
+
+        self.app.update_results_table(self.session)
+
+        assert len(self.session.results_table) == 0
+
+    @pytest.mark.usefixtures("init_module")
+    def test_results_table_sent_only_when_changed(self):
+        """Test that the results table is skipped while it has not changed."""
+        audio_data = (48000, np.array([0.0]))
+        self.session.is_running = True
+        self.session.results_table.add([1, "C", "C#", "C#", "⭕️"])
+
+        first = asyncio.run(self.app.handle_audio(audio_data))[3]
+        second = asyncio.run(self.app.handle_audio(audio_data))[3]
+        self.session.results_table.add([1, "C", "D", "D", "⭕️"])
+        third = asyncio.run(self.app.handle_audio(audio_data))[3]
+
+        assert first == [[1, "C", "C#", "C#", "⭕️"]]
+        assert second == gr.skip()
+        assert len(third) == 2
+
+    @pytest.mark.usefixtures("init_module")
+    def test_change_results_page(self):
+        """Test showing an older page of results."""
+        for i in range(25):
+            self.session.results_table.add([i + 1, "C", "C#", "C#", "⭕️"])
+
+        rows = asyncio.run(self.app.change_results_page(2))
+
+        assert self.session.results_page == 1
+        assert [row[0] for row in rows] == [5, 4, 3, 2, 1]
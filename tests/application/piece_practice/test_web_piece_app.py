@@ -1,7 +1,10 @@
 """Tests for the WebMelodyPracticeApp class."""
 
+import asyncio
+import threading
 from unittest.mock import Mock, patch
 
+import gradio as gr
 import pytest
 
 from improvisation_lab.application.piece_practice.web_piece_app import \
@@ -21,7 +24,8 @@ class TestWebPiecePracticeApp:
         service = PiecePracticeService(config)
         self.app = WebPiecePracticeApp(service, config)
         self.app.ui = Mock(spec=WebPiecePracticeView)
-        self.app.audio_processor = Mock(spec=WebAudioProcessor)
+        self.session = self.app.get_session()
+        self.session.audio_processor = Mock(spec=WebAudioProcessor)
 
     @pytest.mark.usefixtures("init_module")
     def test_launch(self):
@@ -34,23 +38,30 @@ class TestWebPiecePracticeApp:
     def test_process_audio_callback(self):
         """Test processing audio callback."""
         audio_data = Mock()
-        self.app.is_running = True
-        self.app.phrases = [Mock(notes=["C", "E", "G"]), Mock(notes=["C", "E", "G"])]
-        self.app.current_phrase_idx = 0
-        self.app.current_note_idx = 2
+        self.session.is_running = True
+        self.session.phrases = [
+            Mock(notes=["C", "E", "G"]),
+            Mock(notes=["C", "E", "G"]),
+        ]
+        self.session.current_phrase_idx = 0
+        self.session.current_note_idx = 2
 
         mock_result = Mock()
         mock_result.target_note = "G"
         mock_result.current_base_note = "G"
         mock_result.remaining_time = 0.0
+        mock_result.octave = None
+        mock_result.cents = None
 
         with patch.object(
             self.app.service, "process_audio", return_value=mock_result
         ) as mock_process_audio:
-            self.app._process_audio_callback(audio_data)
-            mock_process_audio.assert_called_once_with(audio_data, "G")
+            self.app._process_audio_callback(self.session, audio_data)
+            mock_process_audio.assert_called_once_with(
+                audio_data, "G", self.session.tracking_state
+            )
             assert (
-                self.app.text_manager.result_text
+                self.session.text_manager.result_text
                 == "Target: G | Your note: G | Remaining: 0.0s"
             )
 
@@ -58,37 +69,160 @@ class TestWebPiecePracticeApp:
     def test_handle_audio(self):
         """Test handling audio input."""
         audio_data = (48000, Mock())
-        self.app.is_running = True
+        self.session.is_running = True
         with patch.object(
-            self.app.audio_processor, "process_audio", return_value=None
+            self.session.audio_processor, "process_audio", return_value=None
         ) as mock_process_audio:
-            phrase_text, result_text = self.app.handle_audio(audio_data)
+            phrase_text, result_text = asyncio.run(self.app.handle_audio(audio_data))
             mock_process_audio.assert_called_once_with(audio_data)
-            assert phrase_text == self.app.text_manager.phrase_text
-            assert result_text == self.app.text_manager.result_text
+            assert phrase_text == self.session.text_manager.phrase_text
+            assert result_text == self.session.text_manager.result_text
+
+    @pytest.mark.usefixtures("init_module")
+    def test_handle_audio_skips_unchanged_text(self):
+        """Test that unchanged texts are not sent again."""
+        audio_data = (48000, Mock())
+        self.session.is_running = True
+
+        first = asyncio.run(self.app.handle_audio(audio_data))
+        second = asyncio.run(self.app.handle_audio(audio_data))
+        self.session.text_manager.result_text = "Target: C | Your note: C"
+        third = asyncio.run(self.app.handle_audio(audio_data))
+
+        assert first == (
+            self.session.text_manager.phrase_text,
+            "Ready to start... (waiting for audio)",
+        )
+        assert second == (gr.skip(), gr.skip())
+        assert third == (gr.skip(), "Target: C | Your note: C")
+
+    @pytest.mark.usefixtures("init_module")
+    def test_handle_audio_runs_in_inference_pool(self):
+        """Test that audio is processed off the event loop thread."""
+        self.session.is_running = True
+        thread_names = []
+        self.session.audio_processor.process_audio.side_effect = (
+            lambda audio: thread_names.append(threading.current_thread().name)
+        )
+
+        asyncio.run(self.app.handle_audio((48000, Mock())))
+
+        assert thread_names[0].startswith("inference")
+
+    @pytest.mark.usefixtures("init_module")
+    def test_pending_inferences(self):
+        """Test that audio processing calls are counted until they are done."""
+        self.session.is_running = True
+        pending = []
+        self.session.audio_processor.process_audio.side_effect = (
+            lambda audio: pending.append(self.app.pending_inferences)
+        )
+
+        asyncio.run(self.app.handle_audio((48000, Mock())))
+
+        assert pending == [1]
+        assert self.app.pending_inferences == 0
+
+    @pytest.mark.usefixtures("init_module")
+    def test_sessions_are_looked_up_off_the_event_loop(self):
+        """Test that session lookups, which may close sessions, run in workers."""
+        self.session.audio_processor.is_recording = False
+        thread_names = []
+        get = self.app.sessions.get
+
+        def record_get(session_id):
+            thread_names.append(threading.current_thread().name)
+            return get(session_id)
+
+        with patch.object(self.app.sessions, "get", side_effect=record_get):
+            asyncio.run(self.app.handle_audio((48000, Mock())))
+            asyncio.run(self.app.stop())
+
+        assert len(thread_names) == 2
+        assert threading.main_thread().name not in thread_names
+        assert thread_names[0].startswith("inference")
+
+    @pytest.mark.usefixtures("init_module")
+    def test_handle_audio_buffers_while_behind(self):
+        """Test that chunks are only buffered while processing lags behind."""
+        audio_data = (48000, Mock())
+        self.session.is_running = True
+        self.session.pacer.record(0.5)
+
+        asyncio.run(self.app.handle_audio(audio_data))
+
+        self.session.audio_processor.buffer_audio.assert_called_once_with(audio_data)
+        self.session.audio_processor.process_audio.assert_not_called()
+
+    @pytest.mark.usefixtures("init_module")
+    def test_stream_every_aligned_with_buffer(self):
+        """Test that the stream interval divides the buffer duration."""
+        buffer_duration = self.app.config.audio.buffer_duration
+        ratio = buffer_duration / self.app.stream_every
+        assert ratio == pytest.approx(round(ratio))
 
     @pytest.mark.usefixtures("init_module")
     def test_start(self):
         """Test starting the application."""
-        self.app.audio_processor.is_recording = False
+        self.session.audio_processor.is_recording = False
         with patch.object(
-            self.app.audio_processor, "start_recording", return_value=None
+            self.session.audio_processor, "start_recording", return_value=None
         ) as mock_start_recording:
-            phrase_text, result_text = self.app.start()
+            phrase_text, result_text = asyncio.run(self.app.start())
             mock_start_recording.assert_called_once()
-            assert self.app.is_running
-            assert phrase_text == self.app.text_manager.phrase_text
-            assert result_text == self.app.text_manager.result_text
+            assert self.session.is_running
+            assert phrase_text == self.session.text_manager.phrase_text
+            assert result_text == self.session.text_manager.result_text
+
+    @pytest.mark.usefixtures("init_module")
+    def test_advance_past_progression(self):
+        """Test that the melody goes on past the end of the progression."""
+        self.session.audio_processor.is_recording = False
+        with patch.object(
+            self.session.audio_processor, "start_recording", return_value=None
+        ):
+            asyncio.run(self.app.start())
+        num_chords = len(
+            self.app.config.piece_practice.chord_progressions[
+                self.app.config.piece_practice.selected_song
+            ]
+        )
+
+        for _ in range(num_chords):
+            self.session.current_note_idx = (
+                len(self.session.phrases[self.session.current_phrase_idx].notes) - 1
+            )
+            self.app._advance_to_next_note(self.session)
+
+        assert self.session.current_phrase_idx == num_chords
+        self.session.text_manager.update_phrase_text(
+            self.session.current_phrase_idx, self.session.phrases
+        )
+        assert f"Phrase {num_chords + 1}:" in self.session.text_manager.phrase_text
+        assert "Next:" in self.session.text_manager.phrase_text
 
     @pytest.mark.usefixtures("init_module")
     def test_stop(self):
         """Test stopping the application."""
-        self.app.audio_processor.is_recording = True
+        self.session.audio_processor.is_recording = True
         with patch.object(
-            self.app.audio_processor, "stop_recording", return_value=None
+            self.session.audio_processor, "stop_recording", return_value=None
         ) as mock_stop_recording:
-            phrase_text, result_text = self.app.stop()
+            phrase_text, result_text = asyncio.run(self.app.stop())
             mock_stop_recording.assert_called_once()
-            assert not self.app.is_running
-            assert phrase_text == self.app.text_manager.phrase_text
-            assert result_text == self.app.text_manager.result_text
+            assert not self.session.is_running
+            assert phrase_text == self.session.text_manager.phrase_text
+            assert result_text == self.session.text_manager.result_text
+
+    @pytest.mark.usefixtures("init_module")
+    def test_sessions_are_isolated(self):
+        """Test that each Gradio session has its own practice state."""
+        request_a = gr.Request(session_hash="a")
+        request_b = gr.Request(session_hash="b")
+
+        asyncio.run(self.app.start(request_a))
+        asyncio.run(self.app.stop(request_b))
+
+        assert self.app.get_session(request_a).is_running
+        assert not self.app.get_session(request_b).is_running
+        assert self.app.get_session(request_b).phrases is None
@@ -0,0 +1,129 @@
+"""Tests for the metrics module."""
+
+from collections import Counter
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from improvisation_lab.application.metrics import (MetricFamily, MetricSample,
+                                                   MetricsRegistry,
+                                                   instrumentation_collector,
+                                                   mount_metrics_endpoint,
+                                                   practice_app_collector,
+                                                   process_collector)
+from improvisation_lab.instrumentation import Instrumentation
+
+
+class TestMetricsRegistry:
+    @pytest.fixture
+    def init_module(self):
+        self.registry = MetricsRegistry()
+
+    @pytest.mark.usefixtures("init_module")
+    def test_render_prometheus(self):
+        self.registry.register(
+            lambda: [
+                MetricFamily(
+                    "test_total",
+                    "counter",
+                    "Test counter.",
+                    [MetricSample(3, {"kind": 'a"b'}), MetricSample(0.5)],
+                )
+            ]
+        )
+        assert self.registry.render_prometheus() == (
+            "# HELP test_total Test counter.\n"
+            "# TYPE test_total counter\n"
+            'test_total{kind="a\\"b"} 3\n'
+            "test_total 0.5\n"
+        )
+
+    @pytest.mark.usefixtures("init_module")
+    def test_collect_merges_families(self):
+        def collector(label):
+            return lambda: [
+                MetricFamily("test", "gauge", "Test.", [MetricSample(1, {"l": label})])
+            ]
+
+        self.registry.register(collector("a"))
+        self.registry.register(collector("b"))
+
+        families = self.registry.collect()
+        assert len(families) == 1
+        assert [sample.labels["l"] for sample in families[0].samples] == ["a", "b"]
+
+
+class TestCollectors:
+    def test_practice_app_collector(self):
+        session = Mock()
+        session.is_running = True
+        session.audio_processor.received_chunks = 10
+        session.audio_processor.dropped_chunks = 2
+        session.audio_processor.processed_windows = 5
+        session.audio_processor.skipped_windows = 0
+        session.audio_processor.buffered_seconds = 0.5
+        app = Mock()
+        app.sessions.sessions.return_value = [session]
+        app.sessions.evicted_count = 1
+        app.pending_inferences = 2
+        app.retired_audio_counts = Counter({"dropped_chunks": 3})
+        app.service.pitch_detector.inference_count = 5
+        app.service.pitch_detector.inference_seconds = 0.25
+        app.service.result_counts = Counter({"correct": 3, "incorrect": 2})
+
+        families = {
+            family.name: family
+            for family in practice_app_collector(app, "piece")()
+        }
+
+        assert families["improvisation_lab_active_sessions"].samples[0].value == 1
+        buffer_sample = families["improvisation_lab_audio_buffer_seconds"].samples[0]
+        assert buffer_sample.value == 0.5
+        assert buffer_sample.labels == {"practice_type": "piece"}
+        assert (
+            families["improvisation_lab_audio_chunks_dropped_total"].samples[0].value
+            == 5
+        )
+        assert (
+            families["improvisation_lab_sessions_evicted_total"].samples[0].value == 1
+        )
+        queue_family = families["improvisation_lab_inference_queue_depth"]
+        assert queue_family.type == "gauge"
+        assert queue_family.samples[0].value == 2
+        results = families["improvisation_lab_pitch_results_total"].samples
+        assert {s.labels["outcome"]: s.value for s in results} == {
+            "correct": 3,
+            "incorrect": 2,
+        }
+
+    def test_process_collector(self):
+        names = [family.name for family in process_collector()()]
+        assert "improvisation_lab_threads" in names
+
+    def test_instrumentation_collector(self):
+        source = Instrumentation(enabled=True)
+        assert instrumentation_collector(source)() == []
+
+        source.record("analysis.detect_pitch", 0.01)
+        (family,) = instrumentation_collector(source)()
+        assert family.type == "summary"
+        suffixes = [sample.suffix for sample in family.samples]
+        assert suffixes.count("") == 3
+        assert "_sum" in suffixes and "_count" in suffixes
+
+
+class TestMetricsEndpoint:
+    def test_mount_metrics_endpoint(self):
+        registry = MetricsRegistry()
+        registry.register(
+            lambda: [MetricFamily("test", "gauge", "Test.", [MetricSample(1)])]
+        )
+        app = FastAPI()
+        mount_metrics_endpoint(app, registry)
+
+        response = TestClient(app).get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "test 1\n" in response.text
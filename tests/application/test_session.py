@@ -0,0 +1,120 @@
+"""Tests for the practice session registry."""
+
+from unittest.mock import Mock
+
+import gradio as gr
+import pytest
+
+from improvisation_lab.application.session import (PracticeSession,
+                                                   SessionRegistry,
+                                                   get_session_id)
+from improvisation_lab.application.stream_pacing import StreamPacer
+from improvisation_lab.presentation.piece_practice import PieceViewTextManager
+
+
+def create_session(session_id: str) -> PracticeSession:
+    """Create a session with a mocked audio processor."""
+    return PracticeSession(
+        session_id,
+        PieceViewTextManager(),
+        lambda session: Mock(is_recording=False),
+        StreamPacer(0.1, max_interval=1.0),
+    )
+
+
+class TestSessionRegistry:
+    @pytest.fixture
+    def init_module(self):
+        """Create a SessionRegistry for testing."""
+        self.closed = []
+        self.registry = SessionRegistry(
+            create_session,
+            max_sessions=2,
+            idle_timeout=600.0,
+            on_close=self.closed.append,
+        )
+
+    @pytest.mark.usefixtures("init_module")
+    def test_get_creates_and_reuses_sessions(self):
+        """Test that a session is created once per id."""
+        session = self.registry.get("a")
+        assert self.registry.get("a") is session
+        assert self.registry.get("b") is not session
+        assert len(self.registry) == 2
+
+    @pytest.mark.usefixtures("init_module")
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used session is evicted when full."""
+        session_a = self.registry.get("a")
+        self.registry.get("b")
+        self.registry.get("a")
+        self.registry.get("c")
+
+        assert "a" in self.registry
+        assert "b" not in self.registry
+        assert "c" in self.registry
+        assert [session.session_id for session in self.closed] == ["b"]
+        assert self.registry.evicted_count == 1
+        assert self.registry.sessions()[0] is session_a
+
+    @pytest.mark.usefixtures("init_module")
+    def test_evict_idle(self):
+        """Test that idle sessions are evicted."""
+        session = self.registry.get("a")
+        session.is_running = True
+        session.last_access -= 601.0
+        self.registry.get("b")
+
+        self.registry.evict_idle()
+
+        assert "a" not in self.registry
+        assert "b" in self.registry
+        assert self.closed == [session]
+        assert not session.is_running
+
+    @pytest.mark.usefixtures("init_module")
+    def test_get_existing_session_evicts_idle(self):
+        """Test that looking up an existing session also evicts idle ones."""
+        session_a = self.registry.get("a")
+        session_b = self.registry.get("b")
+        session_a.last_access -= 601.0
+        session_b.last_access -= 601.0
+
+        assert self.registry.get("b") is session_b
+
+        assert "a" not in self.registry
+        assert "b" in self.registry
+        assert self.closed == [session_a]
+        assert self.registry.evicted_count == 1
+
+    @pytest.mark.usefixtures("init_module")
+    def test_remove(self):
+        """Test removing a session."""
+        session = self.registry.get("a")
+        session.audio_processor.is_recording = True
+
+        self.registry.remove("a")
+        self.registry.remove("missing")
+
+        assert "a" not in self.registry
+        assert self.closed == [session]
+        session.audio_processor.stop_recording.assert_called_once()
+        assert self.registry.evicted_count == 0
+
+    def test_invalid_max_sessions(self):
+        """Test that the registry needs room for at least one session."""
+        with pytest.raises(ValueError):
+            SessionRegistry(create_session, max_sessions=0)
+
+
+@pytest.mark.parametrize(
+    "request_, expected",
+    [
+        (None, "default"),
+        (gr.Request(), "default"),
+        (gr.Request(session_hash="abc"), "abc"),
+    ],
+)
+def test_get_session_id(request_, expected):
+    """Test deriving the session id from a Gradio request."""
+    assert get_session_id(request_) == expected
@@ -0,0 +1,78 @@
+"""Tests for the audio stream pacing."""
+
+import pytest
+
+from improvisation_lab.application.stream_pacing import (StreamPacer,
+                                                         align_stream_every)
+
+
+@pytest.mark.parametrize(
+    "stream_every, buffer_duration, expected",
+    [
+        (0.3, 0.3, 0.3),
+        (0.1, 0.3, 0.1),
+        (0.1, 0.2, 0.1),
+        (0.15, 0.4, 0.4 / 3),
+        (0.5, 0.3, 0.6),
+    ],
+)
+def test_align_stream_every(stream_every, buffer_duration, expected):
+    """Test aligning the stream interval with the buffer duration."""
+    assert align_stream_every(stream_every, buffer_duration) == pytest.approx(
+        expected
+    )
+
+
+def test_align_stream_every_invalid():
+    """Test that non-positive durations are rejected."""
+    with pytest.raises(ValueError):
+        align_stream_every(0.0, 0.3)
+
+
+class TestStreamPacer:
+    @pytest.fixture
+    def init_module(self):
+        """Create a StreamPacer with a manual clock."""
+        self.now = 0.0
+        self.pacer = StreamPacer(
+            0.1, max_interval=1.0, smoothing=0.5, clock=lambda: self.now
+        )
+
+    @pytest.mark.usefixtures("init_module")
+    def test_fast_processing_keeps_stream_interval(self):
+        """Test that every chunk is processed while processing is fast."""
+        for _ in range(5):
+            assert self.pacer.should_process()
+            self.pacer.record(0.01)
+            self.now += 0.1
+        assert self.pacer.interval == pytest.approx(0.1)
+
+    @pytest.mark.usefixtures("init_module")
+    def test_slow_processing_stretches_interval(self):
+        """Test that chunks are only buffered while processing is slow."""
+        assert self.pacer.should_process()
+        self.pacer.record(0.4)
+        assert self.pacer.interval == pytest.approx(0.48)
+
+        processed = []
+        for _ in range(10):
+            self.now += 0.1
+            processed.append(self.pacer.should_process())
+            if processed[-1]:
+                self.pacer.record(0.4)
+        # 0.48s interval with 0.05s slack: every fifth chunk is processed
+        assert processed == [False, False, False, False, True] * 2
+
+    @pytest.mark.usefixtures("init_module")
+    def test_interval_is_bounded(self):
+        """Test that the interval never exceeds max_interval."""
+        self.pacer.record(5.0)
+        assert self.pacer.interval == 1.0
+
+    @pytest.mark.usefixtures("init_module")
+    def test_reset(self):
+        """Test that reset forgets the measured latency."""
+        self.pacer.record(0.4)
+        self.pacer.reset()
+        assert self.pacer.should_process()
+        assert self.pacer.interval == pytest.approx(0.1)
@@ -0,0 +1,82 @@
+"""Tests for the NoteDecisionEngine class."""
+
+import pytest
+
+from improvisation_lab.domain.analysis.note_decision import NoteDecisionEngine
+
+A4 = 440.0
+C5 = 523.25
+
+
+class TestNoteDecisionEngine:
+
+    @pytest.fixture
+    def init_module(self):
+        """Initialization."""
+        self.engine = NoteDecisionEngine(
+            window_size=5, hysteresis=2, tolerance_cents=50.0, min_voiced_ratio=0.5
+        )
+
+    @pytest.mark.usefixtures("init_module")
+    def test_stable_note_needs_hysteresis(self):
+        """Test that a note is decided only after consecutive readings."""
+        decision = self.engine.update([A4])
+        assert decision.note is None
+        assert not decision.changed
+
+        decision = self.engine.update([A4])
+        assert decision.note == "A"
+        assert decision.changed
+        assert decision.midi == pytest.approx(69.0)
+        assert decision.note_midi == 69
+        assert decision.cents == pytest.approx(0.0, abs=1e-6)
+
+    @pytest.mark.usefixtures("init_module")
+    def test_single_outliers_are_ignored(self):
+        """Test that single wrong or unvoiced readings do not change the note."""
+        self.engine.update([A4] * 5)
+
+        decision = self.engine.update([C5, A4, 0.0, A4])
+        assert decision.note == "A"
+        assert not decision.changed
+
+    @pytest.mark.usefixtures("init_module")
+    def test_note_change_and_silence(self):
+        """Test that sustained changes replace the stable note."""
+        self.engine.update([A4] * 5)
+
+        decision = self.engine.update([C5] * 5)
+        assert decision.note == "C"
+        assert decision.changed
+
+        decision = self.engine.update([0.0] * 5)
+        assert decision.note is None
+        assert decision.midi is None
+        assert decision.changed
+
+    @pytest.mark.usefixtures("init_module")
+    def test_out_of_tolerance_keeps_current_note(self):
+        """Test that ambiguous pitches keep the current decision."""
+        engine = NoteDecisionEngine(window_size=3, hysteresis=1, tolerance_cents=20.0)
+        engine.update([A4] * 3)
+
+        # A quarter tone above A4 is 50 cents away from both A and A#
+        decision = engine.update([A4 * 2 ** (0.5 / 12)] * 3)
+        assert decision.note == "A"
+        assert decision.midi == pytest.approx(69.5)
+
+    @pytest.mark.usefixtures("init_module")
+    def test_reset(self):
+        """Test that reset forgets the stable note."""
+        self.engine.update([A4] * 5)
+        self.engine.reset()
+
+        assert self.engine.note is None
+        assert self.engine.update([A4]).note is None
+
+    def test_invalid_parameters(self):
+        """Test that window size and hysteresis must be positive."""
+        with pytest.raises(ValueError):
+            NoteDecisionEngine(window_size=0)
+        with pytest.raises(ValueError):
+            NoteDecisionEngine(hysteresis=0)
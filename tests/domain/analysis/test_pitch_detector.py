@@ -30,6 +30,18 @@ class TestPitchDetector:
         # Check if detected frequency is close to 440 Hz
         assert abs(detected_freq - 440.0) < 1.5  # Allow 1.5 Hz tolerance
 
+    @pytest.mark.usefixtures("init_module")
+    def test_detect_pitch_track(self):
+        """Test that pitch is returned for every hop."""
+        duration = 0.2
+        t = np.linspace(0, duration, int(self.pitch_detector.sample_rate * duration))
+        audio_data = np.sin(2 * np.pi * 440.0 * t).astype(np.float32)
+
+        f0 = self.pitch_detector.detect_pitch_track(audio_data)
+
+        assert len(f0) == len(audio_data) // self.pitch_detector.hop_length + 1
+        assert abs(np.median(f0) - 440.0) < 1.5
+
     def test_custom_parameters(self):
         """Test pitch detection with custom parameters."""
         custom_config = PitchDetectorConfig(
@@ -0,0 +1,96 @@
+import random
+
+import numpy as np
+import pytest
+
+from improvisation_lab.domain.composition.harmonic_context import (
+    HarmonicContext, closest_pitch_class_in_direction, resolve_context)
+from improvisation_lab.domain.music_theory import (ChordTone, Scale,
+                                                   pitch_class_mask)
+
+
+def test_closest_pitch_class_in_direction():
+    """Test searching a pitch class mask in both directions."""
+    c_major_triad = pitch_class_mask([0, 4, 7])
+
+    assert closest_pitch_class_in_direction(5, c_major_triad, -1) == 4
+    assert closest_pitch_class_in_direction(8, c_major_triad, 1) == 0
+    # A scale without other notes leaves the pitch class unchanged
+    assert closest_pitch_class_in_direction(3, pitch_class_mask([3]), 1) == 3
+
+
+class TestHarmonicContext:
+
+    def test_from_pitch_classes(self):
+        """Test the tables derived from a scale and a chord."""
+        # C major scale over a C major triad
+        context = HarmonicContext.from_pitch_classes(
+            (0, 2, 4, 5, 7, 9, 11), ChordTone.get_chord_mask("C", "maj")
+        )
+
+        assert context.scale_index[4] == 2
+        assert context.scale_index[1] == -1
+        # Scale notes move to their neighbors in scale order, wrapping around
+        assert context.adjacent[0] == (11, 2)
+        # Other notes move to the closest scale notes
+        assert context.adjacent[1] == (0, 2)
+        assert context.free_transitions[0].candidates == (2, 4, 5, 7, 9, 11)
+        # Chord tones move freely, other notes to adjacent notes
+        assert context.transitions[0] is context.free_transitions[0]
+        assert context.transitions[2].candidates == (0, 4)
+        assert context.transitions[2].cum_weights is None
+        assert context.is_chord_tone(4)
+        assert not context.is_chord_tone(2)
+
+    def test_weighted_transitions(self):
+        """Test that weighted moves only draw candidates with weight."""
+        # Only allow stepwise motion up
+        context = HarmonicContext.from_pitch_classes(
+            (0, 2, 4, 5, 7, 9, 11),
+            weight=lambda current, candidate: float((candidate - current) % 12 <= 2),
+        )
+
+        rng = random.Random(0)
+
+        assert context.transitions[4].cum_weights == (0.0, 1.0)
+        for _ in range(10):
+            assert context.transitions[4].draw(rng) == 5
+            assert context.free_transitions[9].draw(rng) == 11
+
+    def test_transition_table(self):
+        """Test that drawing from the table follows the transition weights."""
+        context = HarmonicContext.from_pitch_classes(
+            (0, 2, 4, 5, 7, 9, 11),
+            weight=lambda current, candidate: float((candidate - current) % 12 <= 2),
+        )
+        rng = np.random.default_rng(0)
+
+        drawn = context.transition_table.draw(np.full(100, 4), rng)
+        assert (drawn == 5).all()
+        drawn = context.free_transition_table.draw(np.array([0, 9, 11]), rng)
+        assert drawn.tolist() == [2, 11, 0]
+
+    def test_uniform_transition_table(self):
+        """Test that drawing from a uniform table reaches every candidate."""
+        context = HarmonicContext.from_pitch_classes((0, 2, 4, 5, 7, 9, 11))
+
+        drawn = context.free_transition_table.draw(
+            np.zeros(1000, dtype=np.int8), np.random.default_rng(0)
+        )
+
+        assert set(drawn.tolist()) == {2, 4, 5, 7, 9, 11}
+
+    def test_resolve_context_is_cached(self):
+        """Test that contexts are resolved once and shared."""
+        resolve_context.cache_clear()
+
+        context = resolve_context("A", "natural_minor", "D", "min7")
+
+        assert resolve_context("A", "natural_minor", "D", "min7") is context
+        assert resolve_context.cache_info().hits == 1
+        assert context.scale == Scale.get_scale_pitch_classes("A", "natural_minor")
+        assert context.chord_mask == ChordTone.get_chord_mask("D", "min7")
+
+    def test_resolve_context_raises_error_for_invalid_type(self):
+        with pytest.raises(ValueError, match="Invalid chord type: unknown"):
+            resolve_context("C", "major", "C", "unknown")
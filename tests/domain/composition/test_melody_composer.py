@@ -1,9 +1,12 @@
 """Tests for melody composer module."""
 
+import itertools
+
+import numpy as np
 import pytest
 
 from improvisation_lab.domain.composition.melody_composer import MelodyComposer
-from improvisation_lab.domain.music_theory import Notes
+from improvisation_lab.domain.music_theory import NOTE_NAMES, ChordTone, Notes
 
 
 class TestMelodyComposer:
@@ -84,6 +87,68 @@ class TestMelodyComposer:
                 )
                 assert first_note in adjacent_notes
 
+    @pytest.mark.usefixtures("init_module")
+    def test_iter_phrases_loops_progression(self):
+        """Test that phrases continue endlessly over the progression."""
+        progression = [
+            ("C", "major", "C", "maj7", 4),
+            ("A", "natural_minor", "A", "min7", 2),
+        ]
+
+        phrases = list(
+            itertools.islice(self.melody_composer.iter_phrases(progression), 6)
+        )
+
+        assert [phrase.chord_name for phrase in phrases] == ["Cmaj7", "Amin7"] * 3
+        # The melody connects across loops: after a non-chord tone of Amin7
+        # that is no Cmaj7 chord tone either, it moves to an adjacent note
+        for previous, phrase in zip(phrases[1::2], phrases[2::2]):
+            last_note = previous.notes[-1]
+            if last_note not in ["A", "C", "E", "G", "B"]:
+                adjacent_notes = (
+                    self.melody_composer.phrase_generator.get_adjacent_notes(
+                        last_note, ["C", "D", "E", "F", "G", "A", "B"]
+                    )
+                )
+                assert phrase.notes[0] in adjacent_notes
+
+    @pytest.mark.usefixtures("init_module")
+    def test_iter_phrases_without_loop(self):
+        """Test that phrases end with the progression unless looping."""
+        progression = [("C", "major", "C", "maj7", 4)]
+
+        phrases = list(self.melody_composer.iter_phrases(progression, loop=False))
+
+        assert len(phrases) == 1
+        assert list(self.melody_composer.iter_phrases([])) == []
+
+    @pytest.mark.usefixtures("init_module")
+    def test_generate_phrase_batches(self):
+        """Test generating many melodies over a progression at once."""
+        progression = [
+            ("C", "major", "C", "maj7", 4),
+            ("C", "major", "G", "dom7", 2),
+        ]
+
+        batches = self.melody_composer.generate_phrase_batches(
+            progression, num_melodies=100, rng=np.random.default_rng(0)
+        )
+
+        assert [batch.shape for batch in batches] == [(100, 4), (100, 2)]
+        # Phrases connect like those of generate_phrases
+        cmaj7 = ChordTone.get_chord_mask("C", "maj7")
+        g7 = ChordTone.get_chord_mask("G", "dom7")
+        for last, first in zip(batches[0][:, -1], batches[1][:, 0]):
+            if not (cmaj7 | g7) >> last & 1:
+                adjacent_notes = (
+                    self.melody_composer.phrase_generator.get_adjacent_notes(
+                        NOTE_NAMES[last], ["C", "D", "E", "F", "G", "A", "B"]
+                    )
+                )
+                assert NOTE_NAMES[first] in adjacent_notes
+            else:
+                assert first != last
+
     @pytest.mark.usefixtures("init_module")
     def test_generate_interval_melody(self):
         """Test interval melody generation."""
@@ -1,8 +1,14 @@
+import random
+
+import numpy as np
 import pytest
 
-from improvisation_lab.domain.composition.phrase_generator import \
-    PhraseGenerator
-from improvisation_lab.domain.music_theory import Scale
+from improvisation_lab.domain.composition.harmonic_context import \
+    resolve_context
+from improvisation_lab.domain.composition.phrase_generator import (
+    PhraseGenerator, _context_of)
+from improvisation_lab.domain.music_theory import (Notes, Scale,
+                                                   pitch_class_names)
 
 
 class TestPhraseGenerator:
@@ -101,6 +107,18 @@ class TestPhraseGenerator:
             )
             assert result in expected_adjacent
 
+    @pytest.mark.usefixtures("init_module")
+    def test_note_list_contexts_are_cached(self):
+        """Test that the context of note lists is derived once and shared."""
+        _context_of.cache_clear()
+        scale_notes = ["C", "D", "E", "F", "G", "A", "B"]
+
+        self.phrase_generator.get_next_note("C", scale_notes, ["C", "E", "G"])
+        self.phrase_generator.select_first_note(scale_notes, ["C", "E", "G"], "D")
+
+        assert _context_of.cache_info().misses == 1
+        assert _context_of.cache_info().hits == 1
+
     @pytest.mark.usefixtures("init_module")
     def test_select_first_note(self):
         """Test that select_first_note returns correct first note.
@@ -206,3 +224,65 @@ class TestPhraseGenerator:
                 length=length,
             )
             assert len(phrase) == length
+
+    def test_seeded_generators_generate_the_same_phrases(self):
+        """Test that phrases are reproducible with a seeded random generator."""
+        phrases = [
+            PhraseGenerator(random.Random(42)).generate_phrase(
+                "C", "major", "G", "dom7", length=16
+            )
+            for _ in range(2)
+        ]
+        batches = [
+            PhraseGenerator(random.Random(42)).generate_phrase_batch(
+                "C", "major", "G", "dom7", num_phrases=10
+            )
+            for _ in range(2)
+        ]
+
+        assert phrases[0] == phrases[1]
+        np.testing.assert_array_equal(batches[0], batches[1])
+
+    @pytest.mark.usefixtures("init_module")
+    def test_generate_phrase_batch(self):
+        """Test that phrases generated in bulk follow the phrase rules."""
+        rng = np.random.default_rng(0)
+        context = resolve_context("D", "harmonic_minor", "A", "dom7")
+
+        phrases = self.phrase_generator.generate_phrase_batch(
+            "D",
+            "harmonic_minor",
+            "A",
+            "dom7",
+            num_phrases=200,
+            length=6,
+            prev=np.full(200, Notes.get_note_index("G#")),
+            rng=rng,
+        )
+
+        assert phrases.shape == (200, 6)
+        # G# is not a chord tone, so phrases start on an adjacent note
+        assert set(pitch_class_names(phrases[:, 0])) == {"G", "A"}
+        for current, following in zip(phrases[:, :-1].ravel(), phrases[:, 1:].ravel()):
+            if context.is_chord_tone(current):
+                assert following != current
+                assert context.scale_mask >> following & 1
+            else:
+                assert following in context.adjacent[current]
+
+    @pytest.mark.usefixtures("init_module")
+    def test_generate_phrase_batch_after_chord_tone(self):
+        """Test that phrases after a chord tone start on any other scale note."""
+        phrases = self.phrase_generator.generate_phrase_batch(
+            "C",
+            "major",
+            "D",
+            "min7",
+            num_phrases=200,
+            length=1,
+            prev=np.full(200, Notes.get_note_index("E")),
+            prev_was_chord_tone=np.ones(200, dtype=bool),
+            rng=np.random.default_rng(0),
+        )
+
+        assert set(pitch_class_names(phrases[:, 0])) == {"C", "D", "F", "G", "A", "B"}
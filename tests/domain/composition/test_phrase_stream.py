@@ -0,0 +1,46 @@
+import itertools
+
+import pytest
+
+from improvisation_lab.domain.composition import PhraseData, PhraseStream
+
+
+def numbered_phrases():
+    """Yield phrases whose chord name is their index."""
+    for index in itertools.count():
+        yield PhraseData(notes=["C"], chord_name=str(index), scale_info="", length=1)
+
+
+class TestPhraseStream:
+
+    def test_generates_lookahead(self):
+        """Test that the phrases up to the look-ahead are generated."""
+        stream = PhraseStream(numbered_phrases(), lookahead=2)
+
+        assert len(stream) == 3
+        assert stream[0].chord_name == "0"
+        assert stream[5].chord_name == "5"
+        assert len(stream) == 8
+
+    def test_releases_passed_phrases(self):
+        """Test that phrases far enough behind are released."""
+        stream = PhraseStream(numbered_phrases())
+
+        # Peeking at the next phrase keeps the current one
+        assert stream[11].chord_name == "11"
+        assert stream[10].chord_name == "10"
+        with pytest.raises(IndexError):
+            stream[9]
+
+    def test_finite_iterator(self):
+        """Test that a stream ends with its iterator."""
+        stream = PhraseStream(itertools.islice(numbered_phrases(), 2))
+
+        assert stream[1].chord_name == "1"
+        assert len(stream) == 2
+        with pytest.raises(IndexError):
+            stream[2]
+
+    def test_invalid_lookahead(self):
+        with pytest.raises(ValueError):
+            PhraseStream(numbered_phrases(), lookahead=0)
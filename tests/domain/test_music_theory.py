@@ -1,8 +1,14 @@
 """Tests for music theory related classes."""
 
+import numpy as np
 import pytest
 
-from improvisation_lab.domain.music_theory import ChordTone, Notes, Scale
+from improvisation_lab.domain.music_theory import (CHROMATIC_SCALES,
+                                                   NOTE_NAMES, ChordTone,
+                                                   NoteGrid, Notes,
+                                                   PatternRegistry, Scale,
+                                                   pitch_class_mask,
+                                                   pitch_class_names)
 
 
 class TestNotes:
@@ -14,6 +20,13 @@ class TestNotes:
     def test_get_note_index_returns_correct_index(self):
         assert Notes.get_note_index("C") == 0
         assert Notes.get_note_index("G") == 7
+        # Members are looked up by value too, not only by their member name
+        assert Notes.get_note_index(Notes.C_SHARP) == 1
+        assert Notes.get_note_index("C#") == 1
+
+    def test_get_note_index_raises_error_for_invalid_note(self):
+        with pytest.raises(ValueError):
+            Notes.get_note_index("C_SHARP")
 
     def test_get_chromatic_scale_returns_ordered_notes(self):
         """Test that get_chromatic_scale returns notes in chromatic order."""
@@ -46,6 +59,13 @@ class TestNotes:
             "F#",
         ]
 
+    def test_chromatic_scales_table(self):
+        """Test that the precomputed tables match the enum."""
+        assert NOTE_NAMES == tuple(note.value for note in Notes)
+        for idx, scale in enumerate(CHROMATIC_SCALES):
+            assert scale[0] == NOTE_NAMES[idx]
+            assert sorted(scale) == sorted(NOTE_NAMES)
+
     def test_get_chromatic_scale_raises_error_for_invalid_note(self):
         """Test that get_chromatic_scale raises ValueError for invalid notes."""
         with pytest.raises(ValueError):
@@ -77,8 +97,141 @@ class TestNotes:
         for frequency, expected_note in test_cases:
             assert Notes.convert_frequency_to_base_note(frequency) == expected_note
 
+    def test_convert_frequency_to_midi(self):
+        """Test that frequencies are converted to MIDI numbers in one pass."""
+        midi = Notes.convert_frequency_to_midi(np.array([440.0, 261.63, 0.0, 880.0]))
+
+        np.testing.assert_allclose(midi[[0, 1, 3]], [69.0, 60.0, 81.0], atol=0.01)
+        assert np.isnan(midi[2])
+        assert Notes.convert_frequency_to_midi(466.16, reference_frequency=466.16) == 69
+
+    def test_convert_frequencies_to_notes(self):
+        """Test vectorized conversion of a frequency track to notes."""
+        frequencies = np.array([440.0, 0.0, 261.63, 440.0 * 2 ** (0.2 / 12), 55.0])
+
+        track = Notes.convert_frequencies_to_notes(frequencies)
+
+        assert len(track) == 5
+        assert track.voiced.tolist() == [True, False, True, True, True]
+        assert track.midi.tolist() == [69, -1, 60, 69, 33]
+        assert track.pitch_class.tolist() == [9, -1, 0, 9, 9]
+        assert track.octave.tolist() == [4, -1, 4, 4, 1]
+        assert track.cents[3] == pytest.approx(20.0)
+        assert np.isnan(track.cents[1])
+        assert track.base_note_names() == ["A", None, "C", "A", "A"]
+        assert track.note_names() == ["A4", None, "C4", "A4", "A1"]
+
+    def test_convert_frequency_with_reference_tuning(self):
+        """Test converting frequencies with A4 tuned to 442 Hz."""
+        assert Notes.convert_frequency_to_note(442.0, reference_frequency=442.0) == "A4"
+        # 453 Hz is nearer to A# at 440 Hz tuning, but to A at 442 Hz tuning
+        assert Notes.convert_frequency_to_base_note(453.0) == "A#"
+        assert Notes.convert_frequency_to_base_note(453.0, 442.0) == "A"
+
+    def test_note_grid(self):
+        """Test classifying a frequency track with the note grid."""
+        grid = NoteGrid(f0_min=80.0, f0_max=880.0)
+        frequencies = np.array([440.0, 0.0, 261.63, 453.0, 60.0, 2000.0])
+
+        assert grid.classify(frequencies).tolist() == [69, -1, 60, 70, -1, -1]
+        assert grid.base_note_names(frequencies) == ["A", None, "C", "A#", None, None]
+        assert NoteGrid(80.0, 880.0, 442.0).classify([453.0]).tolist() == [69]
+
+        with pytest.raises(ValueError):
+            NoteGrid(f0_min=880.0, f0_max=80.0)
+
+    def test_note_grid_matches_rounding(self):
+        """Test that the grid agrees with log conversion inside its range."""
+        grid = NoteGrid(f0_min=80.0, f0_max=880.0)
+        frequencies = np.geomspace(80.0, 880.0, 1000)
+
+        assert (
+            grid.classify(frequencies).tolist()
+            == Notes.convert_frequencies_to_notes(frequencies).midi.tolist()
+        )
+
+    def test_convert_frequencies_to_notes_matches_scalar(self):
+        """Test that vectorized and scalar conversions agree."""
+        frequencies = np.geomspace(80.0, 880.0, 200)
+
+        names = Notes.convert_frequencies_to_notes(frequencies).note_names()
+
+        assert names == [Notes.convert_frequency_to_note(f) for f in frequencies]
+
+
+def test_pitch_class_names():
+    """Test converting pitch class arrays to note names."""
+    assert pitch_class_names(np.array([[0, 1], [11, -1]])) == [["C", "C#"], ["B", None]]
+
+
+class TestPatternRegistry:
+    def test_compiles_all_roots(self):
+        """Test that patterns are looked up on every root."""
+        registry = PatternRegistry("chord", {"dom9": [0, 4, 7, 10, 14]})
+
+        assert registry.intervals("dom9") == (0, 4, 7, 10, 2)
+        assert registry.pitch_classes("dom9", 7) == (7, 11, 2, 5, 9)
+        assert registry.note_names("dom9", 7) == ("G", "B", "D", "F", "A")
+        assert registry.mask("dom9", 7) == pitch_class_mask([7, 11, 2, 5, 9])
+        assert "dom9" in registry
+        assert registry.names() == ["dom9"]
+
+    @pytest.mark.parametrize(
+        "name, intervals",
+        [
+            ("", [0, 4, 7]),
+            ("empty", []),
+            ("negative", [0, -1]),
+            ("float", [0, 4.0]),
+            ("repeated", [0, 4, 12]),
+        ],
+    )
+    def test_register_rejects_invalid_patterns(self, name, intervals):
+        registry = PatternRegistry("scale", {})
+
+        with pytest.raises(ValueError):
+            registry.register(name, intervals)
+
+    def test_register_rejects_conflicting_redefinition(self):
+        registry = PatternRegistry("scale", {"major": [0, 2, 4, 5, 7, 9, 11]})
+
+        registry.register("major", [0, 2, 4, 5, 7, 9, 11])
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register("major", [0, 2, 3, 5, 7, 9, 10])
+
+    def test_unknown_pattern(self):
+        registry = PatternRegistry("scale", {})
+
+        with pytest.raises(ValueError, match="Invalid scale type: dorian"):
+            registry.pitch_classes("dorian", 0)
+
 
 class TestScale:
+    def test_get_scale_mask(self):
+        """Test that scale masks have the bits of the scale notes set."""
+        assert Scale.get_scale_pitch_classes("A", "natural_minor") == (
+            9, 11, 0, 2, 4, 5, 7
+        )
+        mask = Scale.get_scale_mask("C", "major")
+        assert mask == 0b101010110101
+        assert [pc for pc in range(12) if mask >> pc & 1] == [0, 2, 4, 5, 7, 9, 11]
+
+    def test_register_scale(self):
+        """Test that registered scales are available on every root."""
+        Scale.register("minor_pentatonic", [0, 3, 5, 7, 10])
+
+        assert Scale.get_scale_notes("A", "minor_pentatonic") == [
+            "A",
+            "C",
+            "D",
+            "E",
+            "G",
+        ]
+
+    def test_get_scale_notes_raises_error_for_invalid_scale(self):
+        with pytest.raises(ValueError, match="Invalid scale type: unknown"):
+            Scale.get_scale_notes("C", "unknown")
+
     def test_get_scale_notes_returns_correct_notes(self):
         assert Scale.get_scale_notes("A", "major") == [
             "A",
@@ -107,3 +260,8 @@ class TestChordTone:
 
         for root, chord_type, expected in test_cases:
             assert ChordTone.get_chord_tones(root, chord_type) == expected
+
+    def test_get_chord_mask(self):
+        """Test that chord masks have the bits of the chord tones set."""
+        assert ChordTone.get_chord_pitch_classes("G", "dom7") == (7, 11, 2, 5)
+        assert ChordTone.get_chord_mask("G", "dom7") == pitch_class_mask([2, 5, 7, 11])
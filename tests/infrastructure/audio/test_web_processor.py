@@ -70,6 +70,15 @@ class TestGradioAudioInput:
 
         np.testing.assert_array_almost_equal(self.audio_input._buffer, expected_data)
 
+    @pytest.mark.usefixtures("init_module")
+    def test_buffered_seconds(self):
+        """Test the duration of the buffered audio."""
+        assert self.audio_input.buffered_seconds == 0.0
+
+        self.audio_input._append_to_buffer(np.zeros(22050, dtype=np.float32))
+
+        assert self.audio_input.buffered_seconds == 0.5
+
     @pytest.mark.usefixtures("init_module")
     def test_process_buffer(self):
         """Test processing buffer when it reaches the desired size."""
@@ -95,6 +104,43 @@ class TestGradioAudioInput:
             self.audio_input._buffer, test_data[buffer_size:]
         )
 
+    @pytest.mark.usefixtures("init_module")
+    def test_process_buffer_skips_stale_windows(self):
+        """Test that only the most recent complete window is processed."""
+        buffer_size = self.audio_input._buffer_size
+        test_data = np.arange(buffer_size * 3 + 2, dtype=np.float32)
+        self.audio_input._buffer = test_data
+        mock_callback = Mock()
+        self.audio_input._callback = mock_callback
+
+        self.audio_input._process_buffer()
+
+        np.testing.assert_array_equal(
+            mock_callback.call_args[0][0],
+            test_data[buffer_size * 2 : buffer_size * 3],
+        )
+        np.testing.assert_array_equal(
+            self.audio_input._buffer, test_data[buffer_size * 3 :]
+        )
+        assert self.audio_input.skipped_windows == 2
+        assert self.audio_input.processed_windows == 1
+        # The clock counts skipped windows too
+        assert self.audio_input.clock.samples == buffer_size * 3
+
+    @pytest.mark.usefixtures("init_module")
+    def test_buffer_audio(self):
+        """Test buffering audio without processing it."""
+        chunk = np.full(self.audio_input._buffer_size, 100.0, dtype=np.float32)
+        mock_callback = Mock()
+        self.audio_input._callback = mock_callback
+
+        assert not self.audio_input.buffer_audio((self.sample_rate, chunk.copy()))
+
+        self.audio_input.start_recording()
+        assert self.audio_input.buffer_audio((self.sample_rate, chunk.copy()))
+        assert len(self.audio_input._buffer) == self.audio_input._buffer_size
+        mock_callback.assert_not_called()
+
     @pytest.mark.usefixtures("init_module")
     def test_resample_audio(self):
         """Test audio resampling functionality."""
@@ -184,3 +230,18 @@ class TestGradioAudioInput:
 
         assert len(processed_data) == 0
         assert processed_data.dtype == np.float32
+
+    @pytest.mark.usefixtures("init_module")
+    def test_process_audio_counters(self):
+        """Test that chunk and window counters are updated."""
+        chunk = np.full(self.audio_input._buffer_size, 100.0, dtype=np.float32)
+
+        # Chunks arriving while not recording are dropped
+        self.audio_input.process_audio((self.sample_rate, chunk.copy()))
+        assert self.audio_input.dropped_chunks == 1
+        assert self.audio_input.received_chunks == 0
+
+        self.audio_input.start_recording()
+        self.audio_input.process_audio((self.sample_rate, chunk.copy()))
+        assert self.audio_input.received_chunks == 1
+        assert self.audio_input.processed_windows == 1
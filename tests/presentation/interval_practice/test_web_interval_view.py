@@ -74,6 +74,25 @@ class TestWebIntervalPracticeView:
         self.web_view.on_audio_input()
         self.audio_callback.assert_called_once()
 
+    @pytest.mark.usefixtures("init_module")
+    def test_concurrency_limits(self):
+        self.web_view.stream_concurrency_limit = 3
+        app = self.web_view._build_interface()
+        limits = {
+            block_fn.fn: block_fn.concurrency_limit for block_fn in app.fns.values()
+        }
+        assert limits[self.audio_callback] == 3
+        assert limits[self.start_callback] is None
+        assert limits[self.stop_callback] is None
+
+    @pytest.mark.usefixtures("init_module")
+    def test_results_page_callback(self):
+        page_callback = Mock(return_value=[])
+        self.web_view.on_results_page = page_callback
+        app = self.web_view._build_interface()
+        assert self.web_view.results_page_box.visible
+        assert any(block_fn.fn is page_callback for block_fn in app.fns.values())
+
     @pytest.mark.usefixtures("init_module")
     def test_launch(self, mocker):
         mocker.patch.object(gr.Blocks, "launch", return_value=None)
@@ -58,6 +58,17 @@ class TestWebPiecePracticeView:
         self.web_view.on_audio_input()
         self.audio_callback.assert_called_once()
 
+    @pytest.mark.usefixtures("init_module")
+    def test_concurrency_limits(self):
+        self.web_view.stream_concurrency_limit = 3
+        app = self.web_view._build_interface()
+        limits = {
+            block_fn.fn: block_fn.concurrency_limit for block_fn in app.fns.values()
+        }
+        assert limits[self.audio_callback] == 3
+        assert limits[self.start_callback] is None
+        assert limits[self.stop_callback] is None
+
     @pytest.mark.usefixtures("init_module")
     def test_launch(self, mocker):
         mocker.patch.object(gr.Blocks, "launch", return_value=None)
@@ -12,10 +12,14 @@ class MockViewTextManager(ViewTextManager):
     """Mock implementation of ViewTextManager for testing."""
 
     def __init__(self):
+        self.build_count = 0
         super().__init__()
 
-    def update_phrase_text(self, current_phrase_idx: int, phrases: Optional[List]):
-        pass
+    def _build_phrase_text(
+        self, current_phrase_idx: int, phrases: Optional[List]
+    ) -> str:
+        self.build_count += 1
+        return f"Phrase {current_phrase_idx + 1}"
 
 
 class TestViewTextManager:
@@ -56,3 +60,48 @@ class TestViewTextManager:
         # Test with auto advance
         self.text_manager.update_pitch_result(pitch_result, is_auto_advance=True)
         assert self.text_manager.result_text == "Target: C | Your note: A"
+
+        # Octave and cents offset are shown when known
+        pitch_result.octave = 4
+        pitch_result.cents = -12.4
+        self.text_manager.update_pitch_result(pitch_result, is_auto_advance=True)
+        assert self.text_manager.result_text == "Target: C | Your note: A4 (-10 cents)"
+
+        # Small drifts of the cents offset leave the text unchanged
+        result_version = self.text_manager.result_version
+        pitch_result.cents = -8.0
+        self.text_manager.update_pitch_result(pitch_result, is_auto_advance=True)
+        assert self.text_manager.result_version == result_version
+        pitch_result.cents = 3.0
+        self.text_manager.update_pitch_result(pitch_result, is_auto_advance=True)
+        assert self.text_manager.result_text == "Target: C | Your note: A4 (+0 cents)"
+
+    @pytest.mark.usefixtures("init_module")
+    def test_text_versions(self):
+        phrase_version = self.text_manager.phrase_version
+        result_version = self.text_manager.result_version
+
+        self.text_manager.result_text = "Target: C | Your note: A"
+        self.text_manager.result_text = "Target: C | Your note: A"
+        assert self.text_manager.result_version == result_version + 1
+        assert self.text_manager.phrase_version == phrase_version
+
+        self.text_manager.initialize_text()
+        assert self.text_manager.result_version == result_version + 2
+        assert self.text_manager.phrase_version == phrase_version
+
+    @pytest.mark.usefixtures("init_module")
+    def test_update_phrase_text_only_rebuilds_on_change(self):
+        phrases = [["C"], ["D"]]
+        self.text_manager.update_phrase_text(0, phrases)
+        version = self.text_manager.phrase_version
+        self.text_manager.update_phrase_text(0, phrases)
+        assert self.text_manager.build_count == 1
+        assert self.text_manager.phrase_version == version
+
+        self.text_manager.update_phrase_text(1, phrases)
+        self.text_manager.update_phrase_text(1, [["C"], ["D"]])
+        assert self.text_manager.build_count == 3
+        assert self.text_manager.phrase_text == "Phrase 2"
+        # The text did not change, so neither did its version
+        assert self.text_manager.phrase_version == version + 1
@@ -1,12 +1,15 @@
 """Tests for BasePracticeService."""
 
+import threading
 import time
 
 import numpy as np
 import pytest
 
+from improvisation_lab.clock import SampleClock
 from improvisation_lab.config import Config
-from improvisation_lab.service.base_practice_service import PitchResult
+from improvisation_lab.service.base_practice_service import (
+    PitchResult, PitchTrackingState)
 from improvisation_lab.service.piece_practice_service import \
     BasePracticeService
 
@@ -46,6 +49,9 @@ class TestBasePracticeService:
         assert isinstance(result, PitchResult)
         assert result.current_base_note == "A"
         assert result.is_correct
+        assert result.midi == 69
+        assert result.octave == 4
+        assert abs(result.cents) < 10
 
     @pytest.mark.usefixtures("init_module")
     def test_process_audio_incorrect_pitch(self):
@@ -104,3 +110,149 @@ class TestBasePracticeService:
         # Final detection
         result2 = self.service.process_audio(audio_data, target_note="A")
         assert result2.remaining_time == 0
+
+    @pytest.mark.usefixtures("init_module")
+    def test_tracking_states_are_isolated(self):
+        """Test that hold timing is kept per tracking state."""
+        sample_rate = 16000
+        duration = 0.1
+        t = np.linspace(0, duration, int(sample_rate * duration))
+        audio_data = np.sin(2 * np.pi * 440 * t)
+        state_a = PitchTrackingState()
+        state_b = PitchTrackingState()
+
+        self.service.process_audio(audio_data, target_note="A", state=state_a)
+        self.service.process_audio(
+            np.zeros(1024, dtype=np.float32), target_note="A", state=state_b
+        )
+
+        assert state_a.correct_pitch_start_time is not None
+        assert state_b.correct_pitch_start_time is None
+        assert self.service.correct_pitch_start_time is None
+
+    @pytest.mark.usefixtures("init_module")
+    def test_tracking_state_records_results(self):
+        """Test that the last result and per-note detections are kept."""
+        sample_rate = 16000
+        duration = 0.1
+        t = np.linspace(0, duration, int(sample_rate * duration))
+        audio_data = np.sin(2 * np.pi * 440 * t)
+        state = PitchTrackingState()
+
+        self.service.process_audio(audio_data, target_note="A", state=state)
+        result = self.service.process_audio(
+            np.zeros(4096, dtype=np.float32), target_note="A", state=state
+        )
+
+        assert state.last_result is result
+        assert state.note_detections == {"A": 1, None: 1}
+
+        state.start_note()
+        assert state.last_result is None
+        assert not state.note_detections
+        assert state.correct_pitch_start_time is None
+
+    @pytest.mark.usefixtures("init_module")
+    def test_result_counts_from_threads(self):
+        """Test that results counted from several threads are all kept."""
+
+        def count():
+            for _ in range(10000):
+                self.service._count_result("correct")
+
+        threads = [threading.Thread(target=count) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert self.service.result_counts["correct"] == 40000
+
+    @pytest.mark.usefixtures("init_module")
+    def test_short_dropout_keeps_correct_pitch(self):
+        """Test that a short unvoiced gap does not reset the hold timing."""
+        sample_rate = 16000
+        t = np.linspace(0, 0.2, int(sample_rate * 0.2))
+        audio_data = np.sin(2 * np.pi * 440 * t)
+        state = PitchTrackingState()
+
+        self.service.process_audio(audio_data, target_note="A", state=state)
+        start_time = state.correct_pitch_start_time
+        result = self.service.process_audio(
+            np.zeros(512, dtype=np.float32), target_note="A", state=state
+        )
+
+        assert result.is_correct
+        assert state.correct_pitch_start_time == start_time
+
+    @pytest.mark.usefixtures("init_module")
+    def test_note_decision_disabled(self):
+        """Test judging a single reading per buffer when smoothing is disabled."""
+        self.service.config.audio.note_decision.enabled = False
+        sample_rate = 16000
+        t = np.linspace(0, 0.1, int(sample_rate * 0.1))
+        audio_data = np.sin(2 * np.pi * 440 * t)
+
+        result = self.service.process_audio(audio_data, target_note="A")
+
+        assert result.is_correct
+        assert self.service.default_state.note_decider is None
+
+    @pytest.mark.usefixtures("init_module")
+    def test_grading_rule(self):
+        """Test the cents tolerance of the grading rule."""
+        sample_rate = 16000
+        t = np.linspace(0, 0.1, int(sample_rate * 0.1))
+        # A4 sung 30 cents sharp
+        audio_data = np.sin(2 * np.pi * 440 * 2 ** (0.3 / 12) * t)
+        grading = self.service.config.audio.grading
+
+        result = self.service.process_audio(audio_data, "A", PitchTrackingState())
+        assert result.is_correct
+        assert 20 < result.cents < 40
+
+        # Notes are judged by pitch class, so an octave lower is also correct
+        result = self.service.process_audio(
+            np.sin(2 * np.pi * 220 * 2 ** (0.3 / 12) * t), "A", PitchTrackingState()
+        )
+        assert result.octave == 3
+        assert result.is_correct
+
+        grading.tolerance_cents = 20
+        result = self.service.process_audio(audio_data, "A", PitchTrackingState())
+        assert result.current_base_note == "A"
+        assert not result.is_correct
+
+    @pytest.mark.usefixtures("init_module")
+    def test_hold_timing_follows_injected_clock(self):
+        """Test that hold timing reads the state's clock, not the wall clock."""
+        sample_rate = 16000
+        t = np.linspace(0, 0.1, int(sample_rate * 0.1))
+        audio_data = np.sin(2 * np.pi * 440 * t)
+        clock = SampleClock(sample_rate)
+        state = PitchTrackingState(clock=clock)
+
+        self.service.process_audio(audio_data, target_note="A", state=state)
+        clock.advance(sample_rate // 4)
+        result = self.service.process_audio(audio_data, target_note="A", state=state)
+        assert result.remaining_time == self.service.config.audio.note_duration - 0.25
+
+        clock.advance(sample_rate * 2)
+        result = self.service.process_audio(audio_data, target_note="A", state=state)
+        assert result.remaining_time == 0
+
+    @pytest.mark.usefixtures("init_module")
+    def test_reference_tuning(self):
+        """Test that notes are judged against the configured A4 frequency."""
+        sample_rate = 16000
+        t = np.linspace(0, 0.1, int(sample_rate * 0.1))
+        # Nearer to A# at 440 Hz tuning, but to A at 450 Hz tuning
+        audio_data = np.sin(2 * np.pi * 460 * t)
+
+        result = self.service.process_audio(audio_data, "A", PitchTrackingState())
+        assert result.current_base_note == "A#"
+
+        self.service.config.audio.reference_frequency = 450.0
+        result = self.service.process_audio(audio_data, "A", PitchTrackingState())
+        assert result.current_base_note == "A"
+        assert result.is_correct
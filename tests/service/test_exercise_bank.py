@@ -0,0 +1,69 @@
+"""Tests for the exercise bank."""
+
+import random
+
+import numpy as np
+import pytest
+
+from improvisation_lab.service.exercise_bank import ExerciseBank
+
+
+def draw_row(rng: random.Random) -> np.ndarray:
+    """Generate an exercise of three note indices."""
+    return np.array(rng.sample(range(12), 3), dtype=np.int8)
+
+
+class TestExerciseBank:
+    @pytest.fixture
+    def init_module(self, tmp_path):
+        """Initialization."""
+        self.cache_path = tmp_path / "exercises.npz"
+        self.bank = ExerciseBank(
+            pool_size=4, rng=random.Random(0), cache_path=self.cache_path
+        )
+        yield
+        self.bank.close()
+
+    @pytest.mark.usefixtures("init_module")
+    def test_take_from_empty_pool_generates(self):
+        """Test that an exercise is generated when the pool is empty."""
+        exercise = self.bank.take("key", draw_row)
+
+        assert exercise.shape == (3,)
+        # The pool is refilled in the background
+        self.bank.wait()
+        assert self.bank.pool_count("key") == 4
+
+    @pytest.mark.usefixtures("init_module")
+    def test_take_pops_pooled_exercises(self):
+        """Test that pooled exercises are taken in order and refilled."""
+        self.bank.warm("key", draw_row)
+        self.bank.wait()
+        expected = [row.tolist() for row in self.bank._pools["key"]]
+
+        taken = [self.bank.take("key", draw_row).tolist() for _ in range(2)]
+
+        assert taken == expected[:2]
+        # Refilled once below half the pool size
+        self.bank.wait()
+        assert self.bank.pool_count("key") == 2
+        self.bank.take("key", draw_row)
+        self.bank.wait()
+        assert self.bank.pool_count("key") == 4
+
+    @pytest.mark.usefixtures("init_module")
+    def test_pools_are_persisted(self):
+        """Test that pools are loaded from the cache file."""
+        self.bank.warm("key", draw_row)
+        self.bank.wait()
+        expected = self.bank._pools["key"][0]
+
+        bank = ExerciseBank(pool_size=4, cache_path=self.cache_path)
+
+        assert bank.pool_count("key") == 4
+        np.testing.assert_array_equal(bank.take("key", draw_row), expected)
+        bank.close()
+
+    def test_invalid_pool_size(self):
+        with pytest.raises(ValueError):
+            ExerciseBank(pool_size=0)
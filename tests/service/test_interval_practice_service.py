@@ -1,5 +1,7 @@
 """Tests for IntervalPracticeService."""
 
+import random
+
 from improvisation_lab.config import Config
 from improvisation_lab.domain.music_theory import Notes
 from improvisation_lab.service.interval_practice_service import \
@@ -19,3 +21,54 @@ class TestPiecePracticeService:
         assert all(
             isinstance(note, Notes) for note_group in melody for note in note_group
         )
+
+    def test_next_melody_from_exercise_bank(self):
+        """Test taking melodies from the exercise bank."""
+        config = Config()
+        config.interval_practice.exercise_pool_size = 2
+        service = IntervalPracticeService(config)
+
+        melody = service.next_melody(num_notes=5, interval=-3)
+
+        assert len(melody) == 5
+        base_notes = [note_group[0] for note_group in melody]
+        assert len(set(base_notes)) == 5
+        transposer = service.melody_composer.note_transposer
+        for base_note, target_note in melody:
+            assert target_note == transposer.transpose_note(base_note, -3)
+        service.exercise_bank.wait()
+        assert service.exercise_bank.pool_count("interval_base_notes_5") == 2
+
+    def test_next_melody_without_exercise_bank(self):
+        """Test that melodies are generated when the bank is disabled."""
+        config = Config()
+        config.interval_practice.exercise_pool_size = 0
+        service = IntervalPracticeService(config)
+
+        assert service.exercise_bank is None
+        assert len(service.next_melody(num_notes=4, interval=2)) == 4
+
+    def test_seeded_service_has_no_exercise_bank(self):
+        """Test that seeded services draw problem sets with the caller's rng."""
+        config = Config()
+        config.interval_practice.seed = 7
+        service = IntervalPracticeService(config)
+
+        assert service.exercise_bank is None
+        assert service.next_melody(
+            num_notes=5, interval=2, rng=random.Random(3)
+        ) == service.generate_melody(num_notes=5, interval=2, rng=random.Random(3))
+
+    def test_generate_melody_with_seed(self):
+        """Test that seeded services and session generators repeat melodies."""
+        config = Config()
+        config.interval_practice.seed = 7
+        services = [IntervalPracticeService(config) for _ in range(2)]
+
+        assert services[0].generate_melody(interval=2) == services[1].generate_melody(
+            interval=2
+        )
+        session_rngs = [service.create_rng() for service in services]
+        assert services[0].generate_melody(
+            interval=2, rng=session_rngs[0]
+        ) == services[1].generate_melody(interval=2, rng=session_rngs[1])
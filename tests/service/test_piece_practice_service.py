@@ -1,5 +1,7 @@
 """Tests for PiecePracticeService."""
 
+import random
+
 from improvisation_lab.config import Config
 from improvisation_lab.service.piece_practice_service import \
     PiecePracticeService
@@ -17,3 +19,29 @@ class TestPiecePracticeService:
         assert all(hasattr(phrase, "chord_name") for phrase in phrases)
         assert all(hasattr(phrase, "scale_info") for phrase in phrases)
         assert all(hasattr(phrase, "length") for phrase in phrases)
+
+    def test_stream_melody(self):
+        """Test streaming an endless melody over the progression."""
+        config = Config()
+        service = PiecePracticeService(config)
+        progression = config.piece_practice.chord_progressions[
+            config.piece_practice.selected_song
+        ]
+
+        stream = service.stream_melody()
+
+        # The melody goes on past the end of the progression
+        phrase = stream[len(progression) + 1]
+        assert phrase.chord_name == "{}{}".format(*progression[1][2:4])
+        assert len(phrase.notes) == progression[1][4]
+
+    def test_generate_melody_with_session_rng(self):
+        """Test that melodies drawn with equally seeded generators match."""
+        service = PiecePracticeService(Config())
+
+        first = service.generate_melody(rng=random.Random(3))
+        second = service.generate_melody(rng=random.Random(3))
+
+        assert [phrase.notes for phrase in first] == [
+            phrase.notes for phrase in second
+        ]
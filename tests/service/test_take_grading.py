@@ -0,0 +1,139 @@
+"""Tests for offline grading of recorded takes."""
+
+import json
+
+import numpy as np
+import pytest
+from scipy import signal
+from scipy.io import wavfile
+
+from improvisation_lab.config import Config
+from improvisation_lab.domain.analysis import PitchDetector
+from improvisation_lab.service.take_grading import (NoteSegment,
+                                                    align_segments, grade_take,
+                                                    grade_takes,
+                                                    iter_audio_chunks,
+                                                    load_melody, score_take,
+                                                    take_score_row)
+
+NOTE_FREQUENCIES = {"C": 261.63, "E": 329.63, "G": 392.0}
+
+
+def write_take(path, notes, sample_rate=44100, note_duration=0.5):
+    """Write a WAV file of sine tones, one per note."""
+    t = np.arange(int(sample_rate * note_duration)) / sample_rate
+    audio = np.concatenate(
+        [np.sin(2 * np.pi * NOTE_FREQUENCIES[note] * t) for note in notes]
+    )
+    wavfile.write(path, sample_rate, (audio * 8000).astype(np.int16))
+
+
+def segment(note, start=0.0, cents=0.0):
+    return NoteSegment(note=note, start=start, duration=0.5, cents=cents)
+
+
+class TestLoadMelody:
+    def test_phrase_data(self, tmp_path):
+        path = tmp_path / "melody.json"
+        path.write_text(
+            json.dumps(
+                [
+                    {"notes": ["C", "E"], "chord_name": "Cmaj7"},
+                    {"notes": ["G"], "chord_name": "G7"},
+                ]
+            )
+        )
+        assert load_melody(path) == ["C", "E", "G"]
+
+    def test_interval_problems_per_take(self, tmp_path):
+        path = tmp_path / "melody.json"
+        path.write_text(json.dumps({"take1": [["C", "C#"], ["D", "D#"]]}))
+        assert load_melody(path) == {"take1": ["C#", "D#"]}
+
+    def test_invalid_melody(self, tmp_path):
+        path = tmp_path / "melody.json"
+        path.write_text(json.dumps([["C", "H"]]))
+        with pytest.raises(ValueError):
+            load_melody(path)
+
+
+class TestScoring:
+    def test_align_segments(self):
+        targets = ["C", "E", "G", "C"]
+        # E is missed and an extra D is sung
+        segments = [segment("C"), segment("D"), segment("G"), segment("C")]
+
+        assert align_segments(targets, segments) in (
+            [0, 1, 2, 3],
+            [0, None, 2, 3],
+        )
+        assert align_segments(["C", "E"], []) == [None, None]
+
+    def test_score_take(self):
+        segments = [segment("C"), segment("E", cents=-40.0), segment("A")]
+
+        score = score_take("take", ["C", "E", "G"], segments, tolerance_cents=30.0)
+
+        assert [note.is_correct for note in score.notes] == [True, False, False]
+        assert score.notes[1].sung_note == "E"
+        assert score.num_correct == 1
+        assert score.accuracy == pytest.approx(1 / 3)
+        row = take_score_row(score)
+        assert "notes" not in row
+        assert row["accuracy"] == score.accuracy
+
+
+class TestGradeTake:
+    def test_iter_audio_chunks(self, tmp_path):
+        path = tmp_path / "take.wav"
+        write_take(path, ["C", "E"])
+
+        chunks = list(iter_audio_chunks(path, 16000, chunk_duration=0.25))
+
+        assert len(chunks) == 4
+        assert sum(len(chunk) for chunk in chunks) == 16000
+        assert max(np.max(np.abs(chunk)) for chunk in chunks) <= 1.0
+
+    def test_iter_audio_chunks_match_whole_take(self, tmp_path):
+        """Test that chunks join into the whole take, resampled at once."""
+        path = tmp_path / "take.wav"
+        audio = (np.random.default_rng(0).standard_normal(44100) * 3000).astype(
+            np.int16
+        )
+        # abs() of the minimum int16 overflows unless widened first
+        audio[10] = -32768
+        wavfile.write(path, 44100, audio)
+
+        chunks = list(iter_audio_chunks(path, 16000, chunk_duration=0.3))
+
+        whole = signal.resample_poly(audio / 32768.0, 160, 441)
+        np.testing.assert_allclose(
+            np.concatenate(chunks), np.clip(whole, -1.0, 1.0), atol=1e-5
+        )
+
+    def test_grade_take(self, tmp_path):
+        config = Config()
+        detector = PitchDetector(config.audio.pitch_detector)
+        path = tmp_path / "take.wav"
+        write_take(path, ["C", "E", "G"])
+
+        score = grade_take(path, ["C", "E", "G"], config, detector, 0.4)
+
+        assert score.take == "take"
+        assert [note.sung_note for note in score.notes] == ["C", "E", "G"]
+        assert score.num_correct == 3
+        assert score.num_extra == 0
+        assert score.notes[1].start == pytest.approx(0.5, abs=0.1)
+
+    def test_grade_takes_in_processes(self, tmp_path):
+        write_take(tmp_path / "a.wav", ["C", "E"])
+        write_take(tmp_path / "b.wav", ["G", "G"])
+        melody = {"a": ["C", "E"], "b": ["C", "E"]}
+
+        scores = list(
+            grade_takes(sorted(tmp_path.glob("*.wav")), melody, Config(), workers=1)
+        )
+
+        assert [score.take for score in scores] == ["a", "b"]
+        assert scores[0].num_correct == 2
+        assert scores[1].num_correct == 0
@@ -0,0 +1,23 @@
+"""Tests for the clock module."""
+
+import time
+
+from improvisation_lab.clock import MonotonicClock, SampleClock
+
+
+class TestSampleClock:
+    def test_advance(self):
+        clock = SampleClock(sample_rate=16000)
+        assert clock.now() == 0.0
+
+        clock.advance(8000)
+        clock.advance(4000)
+        assert clock.samples == 12000
+        assert clock.now() == 0.75
+
+
+class TestMonotonicClock:
+    def test_now(self):
+        clock = MonotonicClock()
+        before = time.monotonic()
+        assert before <= clock.now() <= time.monotonic()
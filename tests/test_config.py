@@ -3,7 +3,8 @@
 import pytest
 import yaml
 
-from improvisation_lab.config import AudioConfig, Config
+from improvisation_lab.config import (AudioConfig, Config, MusicTheoryConfig,
+                                      SessionConfig, WebConfig)
 
 
 class TestConfig:
@@ -19,6 +20,8 @@ class TestConfig:
             "interval_practice": {
                 "num_problems": 15,
                 "interval": 2,
+                "results_page_size": 10,
+                "seed": 1,
             },
             "piece_practice": {
                 "selected_song": "test_song",
@@ -43,6 +46,12 @@ class TestConfig:
         assert config.audio.note_duration == 4
         assert config.interval_practice.num_problems == 15
         assert config.interval_practice.interval == 2
+        assert config.interval_practice.max_results == 500
+        assert config.interval_practice.results_page_size == 10
+        assert config.interval_practice.seed == 1
+        assert config.interval_practice.exercise_pool_size == 8
+        assert config.interval_practice.exercise_cache_path is None
+        assert config.piece_practice.seed is None
         assert config.piece_practice.selected_song == "test_song"
         assert "test_song" in config.piece_practice.chord_progressions
 
@@ -53,10 +62,18 @@ class TestConfig:
         assert config.audio.sample_rate == 16000
         assert config.audio.buffer_duration == 0.3
         assert config.audio.note_duration == 1.0
+        assert config.audio.reference_frequency == 440.0
         assert config.interval_practice.num_problems == 10
         assert config.interval_practice.interval == 0
         assert config.piece_practice.selected_song == "fly_me_to_the_moon"
         assert "fly_me_to_the_moon" in config.piece_practice.chord_progressions
+        assert config.session.max_sessions == 32
+        assert config.session.idle_timeout == 600.0
+        assert config.web.stream_concurrency_limit == 4
+        assert config.web.max_queue_size == 64
+        assert config.web.inference_workers == 2
+        assert config.web.max_stream_interval == 1.0
+        assert config.music_theory.scales == {}
 
     def test_audio_config_from_yaml(self):
         """Test creating AudioConfig from YAML data."""
@@ -65,8 +82,11 @@ class TestConfig:
             "buffer_duration": 0.3,
             "note_duration": 4,
         }
-        audio_config = AudioConfig.from_yaml(yaml_data)
+        audio_config = AudioConfig.from_yaml(
+            {**yaml_data, "reference_frequency": 442.0}
+        )
 
+        assert audio_config.reference_frequency == 442.0
         assert audio_config.sample_rate == 48000
         assert audio_config.buffer_duration == 0.3
         assert audio_config.note_duration == 4
@@ -94,3 +114,45 @@ class TestConfig:
         assert audio_config.pitch_detector.device == "cpu"
         # 未指定のパラメータはデフォルト値を保持
         assert audio_config.pitch_detector.decoder_mode == "local_argmax"
+
+    def test_note_decision_config_from_yaml(self):
+        """Test creating NoteDecision config from YAML data."""
+        audio_config = AudioConfig.from_yaml(
+            {"note_decision": {"window_size": 7, "tolerance_cents": 30}}
+        )
+
+        assert audio_config.note_decision.window_size == 7
+        assert audio_config.note_decision.tolerance_cents == 30
+        assert audio_config.note_decision.enabled
+        assert audio_config.note_decision.hysteresis == 2
+
+    def test_grading_config_from_yaml(self):
+        """Test creating grading config from YAML data."""
+        audio_config = AudioConfig.from_yaml({"grading": {"tolerance_cents": 25}})
+
+        assert audio_config.grading.tolerance_cents == 25
+
+    def test_session_config_from_yaml(self):
+        """Test creating SessionConfig from YAML data."""
+        session_config = SessionConfig.from_yaml({"max_sessions": 4})
+
+        assert session_config.max_sessions == 4
+        assert session_config.idle_timeout == 600.0
+
+    def test_music_theory_config_from_yaml(self):
+        """Test creating MusicTheoryConfig from YAML data."""
+        music_theory_config = MusicTheoryConfig.from_yaml(
+            {"scales": {"dorian": [0, 2, 3, 5, 7, 9, 10]}}
+        )
+
+        assert music_theory_config.scales == {"dorian": [0, 2, 3, 5, 7, 9, 10]}
+        assert music_theory_config.chords == {}
+
+    def test_web_config_from_yaml(self):
+        """Test creating WebConfig from YAML data."""
+        web_config = WebConfig.from_yaml({"stream_concurrency_limit": 8})
+
+        assert web_config.stream_concurrency_limit == 8
+        assert web_config.max_queue_size == 64
+        assert web_config.inference_workers == 2
+        assert not web_config.metrics_endpoint
@@ -0,0 +1,138 @@
+"""Tests for the instrumentation module."""
+
+import json
+import threading
+
+import pytest
+
+from improvisation_lab.instrumentation import (Instrumentation,
+                                               LatencyHistogram,
+                                               instrumentation, timed)
+
+
+class TestLatencyHistogram:
+    @pytest.fixture
+    def init_module(self):
+        self.histogram = LatencyHistogram()
+
+    @pytest.mark.usefixtures("init_module")
+    def test_empty_snapshot(self):
+        snapshot = self.histogram.snapshot()
+        assert snapshot["count"] == 0
+        assert snapshot["mean"] == 0.0
+        assert snapshot["min"] == 0.0
+        assert snapshot["p99"] == 0.0
+
+    @pytest.mark.usefixtures("init_module")
+    def test_record(self):
+        for duration in [0.001, 0.002, 0.003, 0.1]:
+            self.histogram.record(duration)
+
+        snapshot = self.histogram.snapshot()
+        assert snapshot["count"] == 4
+        assert snapshot["total"] == pytest.approx(0.106)
+        assert snapshot["min"] == 0.001
+        assert snapshot["max"] == 0.1
+        # Percentiles are bucket upper bounds (4 buckets per octave)
+        assert 0.002 <= snapshot["p50"] <= 0.002 * 2**0.25
+        assert snapshot["p99"] == 0.1
+
+    @pytest.mark.usefixtures("init_module")
+    def test_snapshot_during_concurrent_records(self):
+        """Test that snapshots stay consistent while durations are recorded."""
+
+        def record():
+            for _ in range(2000):
+                self.histogram.record(0.001)
+                self.histogram.record(0.5)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            snapshot = self.histogram.snapshot()
+            if snapshot["count"]:
+                assert 0.0 < snapshot["p50"] <= snapshot["max"]
+                assert snapshot["p99"] <= snapshot["max"]
+        for thread in threads:
+            thread.join()
+
+        assert self.histogram.snapshot()["count"] == 16000
+
+    @pytest.mark.usefixtures("init_module")
+    def test_reset(self):
+        self.histogram.record(0.01)
+        self.histogram.reset()
+        assert self.histogram.snapshot()["count"] == 0
+
+
+class TestInstrumentation:
+    @pytest.fixture
+    def init_module(self):
+        self.instrumentation = Instrumentation(enabled=True)
+
+    @pytest.mark.usefixtures("init_module")
+    def test_snapshot(self):
+        self.instrumentation.record("stage_b", 0.02)
+        self.instrumentation.record("stage_a", 0.01)
+        self.instrumentation.record("stage_a", 0.03)
+
+        snapshot = self.instrumentation.snapshot()
+        assert list(snapshot.keys()) == ["stage_a", "stage_b"]
+        assert snapshot["stage_a"]["count"] == 2
+        assert snapshot["stage_b"]["count"] == 1
+
+    @pytest.mark.usefixtures("init_module")
+    def test_dump_json(self, tmp_path):
+        self.instrumentation.record("stage", 0.01)
+        path = tmp_path / "timings.json"
+        self.instrumentation.dump_json(path)
+
+        with open(path) as f:
+            assert json.load(f) == self.instrumentation.snapshot()
+
+    @pytest.mark.usefixtures("init_module")
+    def test_reset(self):
+        self.instrumentation.record("stage", 0.01)
+        self.instrumentation.reset()
+        assert self.instrumentation.snapshot() == {}
+
+
+class TestTimed:
+    @pytest.fixture
+    def init_module(self):
+        instrumentation.reset()
+        yield
+        instrumentation.disable()
+        instrumentation.reset()
+
+    @pytest.mark.usefixtures("init_module")
+    def test_timed_disabled(self):
+        @timed("test.disabled")
+        def func(value):
+            return value * 2
+
+        assert func(2) == 4
+        assert instrumentation.snapshot() == {}
+
+    @pytest.mark.usefixtures("init_module")
+    def test_timed_enabled(self):
+        @timed("test.enabled")
+        def func(value):
+            return value * 2
+
+        instrumentation.enable()
+        assert func(2) == 4
+        assert func(3) == 6
+        assert instrumentation.snapshot()["test.enabled"]["count"] == 2
+
+    @pytest.mark.usefixtures("init_module")
+    def test_timed_records_on_exception(self):
+        @timed("test.exception")
+        def func():
+            raise ValueError("error")
+
+        instrumentation.enable()
+        with pytest.raises(ValueError):
+            func()
+        assert instrumentation.snapshot()["test.exception"]["count"] == 1